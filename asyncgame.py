@@ -0,0 +1,217 @@
+"""Games that wait for their players without blocking: AsyncGame.run_async is Game.run as a coroutine, so one
+event loop can run any number of games, each suspended only while one of its seats is thinking.
+
+Every player is asked through the awaitable side of the player protocol (Player.choose_move_async and
+pick_colour_async). Ordinary bots answer at once (after botDelay), search bots search in slices, and seats
+played from elsewhere are RemotePlayers: the game's questions go out through a send function (as dicts, see
+server.py for the protocol) and the answers come back on the player's inbox. A remote seat whose connection
+is gone is played by the computer policy for the rest of the game.
+
+With a turnTimeout, a player that has not decided when the turn's deadline passes is interrupted and the
+game's fallback is used: 'pass', 'draw' (one card, then pass) or 'computer' (the move Computer would make).
+"""
+import asyncio
+import typing
+from card import Card, COLOURS, BULLY_RESPONSES
+from game import Game
+from player import Player, Computer, Winner
+from events import AlreadyDone, TurnStarted, TimedOut, GameEnded
+
+class RemotePlayer(Player):
+    """A seat that answers through messages instead of input(): every turn it is sent the hand, the top card
+    and the valid moves, and it answers with one of {'type': 'play', 'card': id, 'colour': name},
+    {'type': 'pass'} or {'type': 'uno'}. Like a human, it can call Uno and then pick its move"""
+
+    def __init__(self, id: int, send: typing.Callable[[dict], None] = None, close: typing.Callable[[], None] = None):
+        super().__init__(id)
+        self.send: typing.Callable[[dict], None] = send or (lambda message: None) # delivers a message to the player
+        self.close: typing.Callable[[], None] = close or (lambda: None) # hangs up, once the game is over
+        self.inbox: asyncio.Queue = asyncio.Queue() # the player's messages, None once they are gone
+        self.connected: bool = True
+        self.colour: str = None # sent along with the last black card, handed out by pick_colour
+        self.game: Game = None
+
+    def join(self, game: Game) -> None:
+        """Takes a seat like any player, and keeps the game to tell who called Uno and how many cards everybody holds"""
+        super().join(game)
+        self.game = game
+        return
+
+    def receive(self, message: dict) -> None:
+        """Hands a message from the player to the game"""
+        self.inbox.put_nowait(message)
+        return
+
+    def disconnect(self) -> None:
+        """The player is gone: the computer policy takes over the seat, starting with the move it is waiting for"""
+        self.connected = False
+        self.inbox.put_nowait(None)
+        return
+
+    def turn_message(self, currentCard: Card) -> dict:
+        """Everything the client needs to draw the screen of a turn (what display_options shows), with card ids"""
+        players: typing.List[Player] = self.game.players if self.game else [self]
+        return {'type': 'turn',
+                'seat': self.id,
+                'top': currentCard.id,
+                'hand': [card.id for card in self.hand],
+                'valid': [card.id for card in self.valid_moves(currentCard)],
+                'calledUno': [player.id for player in players if player.calledUno],
+                'handSizes': [len(player.hand) for player in players],
+                'bullyDraw': self.game.bullyDraw if self.game else 0}
+
+    async def choose_move_async(self, currentCard: Card) -> typing.Union[Card, str]:
+        """Asks the player for a move and waits for it, invalid answers are refused with an error message
+        :param top card: :return card, 'pass' or 'wrongcall':"""
+        while not self.inbox.empty(): # late answers to an earlier turn, which ran out of time
+            if self.inbox.get_nowait() is None:
+                break
+        prompt: bool = True # the screen is sent again after an error, not after a correct Uno call
+        while self.connected:
+            if prompt:
+                self.send(self.turn_message(currentCard))
+            prompt = True
+            message: dict = await self.inbox.get()
+            if message is None: # disconnected
+                break
+            kind: str = message.get('type')
+            if kind == 'pass':
+                return 'pass'
+            elif kind == 'uno':
+                self.calledUno = True
+                if self.handle_uno_call(currentCard):
+                    prompt = False
+                    continue # the player can now pick the actual move they want to play
+                return 'wrongcall'
+            elif kind == 'play':
+                card: Card = next((card for card in self.valid_moves(currentCard) if card.id == message.get('card')), None)
+                colour: str = message.get('colour')
+                if card is None:
+                    self.send({'type': 'error', 'text': 'that card cannot be played now'})
+                elif card.colour == 'Black' and colour not in COLOURS:
+                    self.send({'type': 'error', 'text': 'pick a colour from: ' + ', '.join(COLOURS)})
+                else:
+                    self.colour = colour
+                    return self.play(card)
+            else:
+                self.send({'type': 'error', 'text': f'unknown move {kind!r}'})
+        return Computer.choose_move(self, currentCard)
+
+    def choose_move(self, currentCard: Card) -> typing.Union[Card, str]:
+        """Only reached when a remote seat ends up in a synchronous game: played by the computer policy"""
+        return Computer.choose_move(self, currentCard)
+
+    def pick_colour(self) -> str:
+        """Returns the colour that came with the black card, or picks one like the computer does when there is none
+        (the computer played the card for the player)"""
+        colour, self.colour = self.colour, None
+        return colour or Computer.pick_colour(self)
+
+class AsyncGame(Game):
+    """Game with a coroutine main loop, for servers that run many games in one event loop"""
+
+    FALLBACKS: typing.Tuple[str, ...] = ('pass', 'draw', 'computer')
+
+    def __init__(self, headless: bool = True, seed: int = None, botDelay: float = 0.0, turnTimeout: float = 0.0,
+                 fallback: str = 'pass'):
+        """:param no printing: :param seed: :param seconds a computer player waits before it moves:
+        :param seconds a player gets per decision, 0 for no limit: :param what happens to a player who runs out of time:"""
+        super().__init__(headless, seed)
+        if fallback not in self.FALLBACKS:
+            raise ValueError(f'unknown fallback {fallback}')
+        self.botDelay: float = botDelay # 0 still lets the other games on the event loop go first
+        self.turnTimeout: float = turnTimeout
+        self.fallback: str = fallback
+        self.timeouts: int = 0 # decisions that ran out of time
+
+    async def ask(self, player: Player) -> typing.Tuple[typing.Union[Card, str], str]:
+        """Gets a move from any kind of player, within the deadline of the turn when there is one
+        :param player: :return tuple(move, colour picked along with a black card or None):"""
+        if isinstance(player, Computer):
+            await asyncio.sleep(self.botDelay)
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        deadline: float = loop.time() + self.turnTimeout
+        try:
+            move: typing.Union[Card, str] = await self.in_time(player.choose_move_async(self.currentCard), deadline)
+        except asyncio.TimeoutError:
+            move = self.fall_back(player)
+            return move, Computer.pick_colour(player) if isinstance(move, Card) and move.colour == 'Black' else None
+        colour: str = None
+        if isinstance(move, Card) and move.colour == 'Black':
+            try:
+                colour = await self.in_time(player.pick_colour_async(), deadline)
+            except asyncio.TimeoutError: # too late to take the card back, the colour is picked for them
+                self.timeouts += 1
+                colour = Computer.pick_colour(player)
+        return move, colour
+
+    async def in_time(self, decision: typing.Awaitable, deadline: float) -> typing.Any:
+        """Awaits a decision, cancelled when the deadline passes (when there is a turnTimeout)"""
+        if not self.turnTimeout:
+            return await decision
+        return await asyncio.wait_for(decision, max(deadline - asyncio.get_running_loop().time(), 0))
+
+    def fall_back(self, player: Player) -> typing.Union[Card, str]:
+        """Decides for a player who ran out of time, with the game's fallback :param player: :return move:"""
+        self.timeouts += 1
+        if TimedOut in self.events.handlers:
+            self.events.emit(TimedOut(player.id, self.fallback))
+        if self.fallback == 'computer':
+            return Computer.choose_move(player, self.currentCard)
+        if self.fallback == 'draw':
+            self.give(player, 1, 'timeout')
+        return 'pass'
+
+    async def run_async(self) -> None:
+        """Game.run as a coroutine: the same turns, but every decision is awaited (remote players are not asked
+        with input(), their screens are drawn by the clients, so nothing is displayed here)"""
+        currentPlayerId: int = 1 # player 1 starts
+        handlers: dict = self.events.handlers
+        lastPlayer: Player = None # the player who moved last, the only one who can have finished since
+        while not self.is_done(lastPlayer):
+            if self.maxTurns and self.turns >= self.maxTurns:
+                break
+
+            currentPlayer = self.players[currentPlayerId-1]
+            lastPlayer = currentPlayer
+
+            if isinstance(currentPlayer, Winner): # checking if current player is still active
+                if AlreadyDone in handlers:
+                    self.events.emit(AlreadyDone(currentPlayerId))
+                currentPlayerId = self.next_player_id(currentPlayerId)
+                continue
+            self.turns += 1
+            if TurnStarted in handlers:
+                self.events.emit(TurnStarted(currentPlayerId))
+
+            if len(currentPlayer.hand) == 1 and not currentPlayer.calledUno: # checking for forgotten Uno Calls
+                self.give(currentPlayer, 3, 'uno')
+            currentPlayer.calledUno = False
+
+            if self.bullyDraw != 0: # checking for "active" bullying
+                passOnToNext: int = await self.handle_bully_response_async(currentPlayer)
+                if passOnToNext:
+                    currentPlayerId = passOnToNext
+                    continue
+
+            # "normal" behavior starts here
+            if not currentPlayer.has_valid_move(self.currentCard):
+                self.give(currentPlayer, 1, 'stuck')
+            move, colour = await self.ask(currentPlayer)
+            currentPlayerId = self.handle_action(move, currentPlayer, colour)
+        if GameEnded in handlers:
+            self.events.emit(GameEnded(self.result()))
+        return
+
+    async def handle_bully_response_async(self, currentPlayer: Player) -> int:
+        """Game.handle_bully_response, awaiting the player's answer
+        :param current player: :return 0 [falsy] or next player's id [truthy]:"""
+        if currentPlayer.has_any(BULLY_RESPONSES[self.currentCard.id]):
+            chosenMove, colour = await self.ask(currentPlayer)
+            if isinstance(chosenMove, Card): # they could technically choose to not play their own +2 or +4
+                if chosenMove.value != 'Draw Two' and chosenMove.value != 'Draw Four':
+                    self.draw_bully(currentPlayer) # but then they would still have to draw the cards
+                return self.handle_action(chosenMove, currentPlayer, colour)
+            return 0 # passed or called Uno wrongly, the turn goes on as usual
+        self.draw_bully(currentPlayer)
+        return 0
@@ -0,0 +1,292 @@
+"""Vectorized simulator that plays thousands of all-computer games in lockstep with numpy.
+
+Every game is a row in a set of arrays (hand counts per card id, deck order, top card, direction,
+bully counter, ...) and every step plays one turn in all unfinished games at once. The rules and
+the computer policy are the same as in Game.run, Game.handle_action, Game.handle_bully_response
+and Computer.choose_move / pick_colour, but this module needs numpy, the rest of the game does not.
+"""
+import argparse
+import numpy as np
+from card import CARDS, NUM_CARDS, DRAW_TWO, REVERSE, SKIP, DRAW_FOUR
+from card import VALID_MOVES, VALID_LAST_MOVES, PREFERRED_MOVES, BULLY_RESPONSES
+from deck import FULL_DECK
+from tournament import Standings
+
+
+# the legality tables of card.py as arrays of bitmasks (54 card ids fit in 64 bits), indexed by top card state
+VALID: np.ndarray = np.array(VALID_MOVES, dtype=np.uint64)
+VALID_LAST: np.ndarray = np.array(VALID_LAST_MOVES, dtype=np.uint64)
+PREFERRED: np.ndarray = np.array(PREFERRED_MOVES, dtype=np.uint64)
+BULLY: np.ndarray = np.array(BULLY_RESPONSES, dtype=np.uint64)
+BITS: np.ndarray = np.array([CARDS[cardId].bit for cardId in range(NUM_CARDS)], dtype=np.uint64) # card.bit per card id
+SHIFTS: np.ndarray = np.arange(NUM_CARDS, dtype=np.uint64)
+VALUE_CODES: np.ndarray = np.array([CARDS[cardId].valueCode for cardId in range(NUM_CARDS)])
+PICK_ORDER: np.ndarray = np.array([0, 1, 3, 2]) # colour codes in the order Computer.pick_colour tries them
+PASS: int = -1 # chosen card id when a player passes
+
+
+class BatchSimulator:
+    """Plays a number of games between Computer players (all with the same number of seats) in a fixed
+    number of slots: every slot holds one game, and when a game ends its slot is dealt a new one, so
+    the arrays stay full until the last games are played"""
+
+    def __init__(self, numGames: int, numPlayers: int = 4, slots: int = 10000, seed: int = None,
+                 maxTurns: int = 10000):
+        if numPlayers < 2:
+            raise ValueError('a game needs at least two players')
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.numGames: int = numGames # games still to be dealt, including the ones in the slots
+        self.numPlayers: int = numPlayers
+        self.maxTurns: int = maxTurns
+        self.standings: Standings = Standings(numPlayers) # games that have ended so far
+        K, P = min(slots, numGames), numPlayers
+
+        packs: int = 1 + (P - 1) // 10 # same rule as Game.seat_players
+        self.fullDeck: np.ndarray = np.array([card.id for card in FULL_DECK] * packs, dtype=np.int16)
+        self.deck: np.ndarray = np.zeros((K, self.fullDeck.size), dtype=np.int16) # cards are drawn from the end
+        self.deckLen: np.ndarray = np.zeros(K, dtype=np.int64)
+        self.hands: np.ndarray = np.zeros((K, P, NUM_CARDS), dtype=np.int32) # card counts per seat
+        self.handSize: np.ndarray = np.zeros((K, P), dtype=np.int32)
+        self.handMask: np.ndarray = np.zeros((K, P), dtype=np.uint64) # Player.handMask: bits of the card ids held
+        self.pileCounts: np.ndarray = np.zeros((K, NUM_CARDS), dtype=np.int32) # the pile below the top card
+        self.topCard: np.ndarray = np.zeros(K, dtype=np.int64) # id of the card on top of the pile, as it is in a deck
+        self.top: np.ndarray = np.zeros(K, dtype=np.int64) # top card state, includes a picked colour
+        self.direction: np.ndarray = np.ones(K, dtype=np.int64)
+        self.bully: np.ndarray = np.zeros(K, dtype=np.int64) # Game.bullyDraw
+        self.current: np.ndarray = np.zeros(K, dtype=np.int64) # seat index (player id - 1) whose turn it is
+        self.calledUno: np.ndarray = np.zeros((K, P), dtype=bool)
+        self.active: np.ndarray = np.ones((K, P), dtype=bool) # seats that have not finished
+        self.winners: np.ndarray = np.zeros(K, dtype=np.int64)
+        self.placings: np.ndarray = np.zeros((K, P), dtype=np.int64) # player ids in finishing order
+        self.drawn: np.ndarray = np.zeros((K, P), dtype=np.int64) # cards drawn during play, not counting the deal
+        self.turns: np.ndarray = np.zeros(K, dtype=np.int64)
+        self.done: np.ndarray = np.zeros(K, dtype=bool) # slots without a game in progress
+        self.completed: np.ndarray = np.zeros(K, dtype=bool)
+        self.deal(np.arange(K))
+
+    def deal(self, games: np.ndarray) -> None:
+        """Starts a new game in every given slot: shuffles, deals seven cards to every seat and
+        turns up a number card, like Game.setup :param slot indices:"""
+        self.numGames -= games.size
+        self.deck[games] = self.rng.permuted(np.tile(self.fullDeck, (games.size, 1)), axis=1)
+        self.deckLen[games] = self.fullDeck.size
+        for array in (self.hands, self.handSize, self.handMask, self.pileCounts, self.bully, self.current, self.calledUno,
+                      self.winners, self.placings, self.turns, self.done, self.completed):
+            array[games] = 0
+        self.direction[games] = 1
+        self.active[games] = True
+        for seat in range(self.numPlayers):
+            self.draw(games, np.full(games.size, seat), 7)
+        self.drawn[games] = 0
+        # Game redraws until it finds a number, which leaves a random number card on top of a random deck:
+        # swap a random number card to the end of the deck and take it from there
+        length: int = self.fullDeck.size - 7 * self.numPlayers
+        isNumber: np.ndarray = VALUE_CODES[self.deck[games, :length]] < DRAW_TWO
+        keys: np.ndarray = np.where(isNumber, self.rng.random(isNumber.shape), -1.0)
+        picked: np.ndarray = keys.argmax(axis=1)
+        last: np.ndarray = self.deck[games, length - 1]
+        self.deck[games, length - 1] = self.deck[games, picked]
+        self.deck[games, picked] = last
+        self.topCard[games] = self.deck[games, length - 1]
+        self.top[games] = self.topCard[games]
+        self.deckLen[games] -= 1
+        return
+
+    def draw(self, games: np.ndarray, seats: np.ndarray, counts) -> None:
+        """Draws cards into one seat per game, reshuffling the pile when a deck runs out (like Game.draw)
+        :param game indices (unique): :param seat per game: :param no. cards, one number or one per game:"""
+        counts = np.broadcast_to(np.asarray(counts), games.shape).copy()
+        keep: np.ndarray = counts > 0
+        games, seats, counts = games[keep], seats[keep], counts[keep]
+        while games.size:
+            for game in games[self.deckLen[games] == 0]:
+                self.reshuffle(game)
+            keep = self.deckLen[games] > 0 # when the pile was empty too, all other cards are in hands
+            games, seats, counts = games[keep], seats[keep], counts[keep]
+            cards: np.ndarray = self.deck[games, self.deckLen[games] - 1]
+            self.hands[games, seats, cards] += 1
+            self.handMask[games, seats] |= BITS[cards]
+            self.handSize[games, seats] += 1
+            self.drawn[games, seats] += 1
+            self.deckLen[games] -= 1
+            counts -= 1
+            keep = counts > 0
+            games, seats, counts = games[keep], seats[keep], counts[keep]
+        return
+
+    def reshuffle(self, game: int) -> None:
+        """Shuffles the pile, except for its top card, back into an empty deck (rare, so one game at a time)"""
+        cards: np.ndarray = np.repeat(np.arange(NUM_CARDS, dtype=np.int16), self.pileCounts[game])
+        self.rng.shuffle(cards)
+        self.deck[game, :cards.size] = cards
+        self.deckLen[game] = cards.size
+        self.pileCounts[game] = 0
+        return
+
+    def next_seats(self, games: np.ndarray, seats: np.ndarray, steps: int) -> np.ndarray:
+        """Walks the given number of active seats on from every seat, in each game's direction"""
+        offsets: np.ndarray = np.arange(1, self.numPlayers + 1)
+        for _ in range(steps):
+            candidates: np.ndarray = (seats[:, None] + self.direction[games][:, None] * offsets) % self.numPlayers
+            seats = candidates[np.arange(games.size), self.active[games[:, None], candidates].argmax(axis=1)]
+        return seats
+
+    def choose(self, games: np.ndarray, seats: np.ndarray) -> np.ndarray:
+        """Computer.choose_move for one seat per game: calls uno when that is correct, prefers to bully
+        back on a +2 or +4 and otherwise picks a random valid card :return card id or PASS per game:"""
+        top: np.ndarray = self.top[games]
+        handSize: np.ndarray = self.handSize[games, seats]
+        handMask: np.ndarray = self.handMask[games, seats]
+        self.calledUno[games, seats] |= (handSize <= 2) & (handMask & VALID[top] != 0)
+
+        preferred: np.ndarray = handMask & PREFERRED[top]
+        legal: np.ndarray = np.where((preferred != 0) & (handSize > 1), preferred,
+                                     handMask & np.where(handSize == 1, VALID_LAST[top], VALID[top]))
+        choosing: np.ndarray = np.flatnonzero(legal)
+        choice: np.ndarray = np.full(games.size, PASS)
+        if choosing.size:
+            # a card counts as often as it is held, like random.choice over the hand
+            weights: np.ndarray = self.hands[games[choosing], seats[choosing]] * \
+                                  (legal[choosing, None] >> SHIFTS & np.uint64(1)).astype(bool)
+            cumulative: np.ndarray = weights.cumsum(axis=1)
+            pick: np.ndarray = (self.rng.random(choosing.size) * cumulative[:, -1]).astype(np.int64)
+            choice[choosing] = (cumulative > pick[:, None]).argmax(axis=1)
+        return choice
+
+    def pick_colours(self, games: np.ndarray, seats: np.ndarray) -> np.ndarray:
+        """Computer.pick_colour: the colour most in hand, Red when there are no colours left :return colour codes:"""
+        colourCounts: np.ndarray = self.hands[games, seats, :52].reshape(games.size, 4, 13).sum(axis=2)
+        return PICK_ORDER[colourCounts[:, PICK_ORDER].argmax(axis=1)]
+
+    def play(self, games: np.ndarray, seats: np.ndarray, cards: np.ndarray) -> np.ndarray:
+        """Game.handle_action for a card (not a pass) in every given game :return next seat per game:"""
+        self.hands[games, seats, cards] -= 1
+        self.handSize[games, seats] -= 1
+        gone: np.ndarray = self.hands[games, seats, cards] == 0
+        self.handMask[games[gone], seats[gone]] &= ~BITS[cards[gone]]
+        values: np.ndarray = VALUE_CODES[cards]
+        self.bully[games] += np.where(values == DRAW_TWO, 2, 0) + np.where(values == DRAW_FOUR, 4, 0)
+        state: np.ndarray = cards.copy()
+        black: np.ndarray = values >= DRAW_FOUR
+        if black.any():
+            colours: np.ndarray = self.pick_colours(games[black], seats[black])
+            state[black] = NUM_CARDS + colours * 2 + (values[black] - DRAW_FOUR)
+        self.pileCounts[games, self.topCard[games]] += 1
+        self.topCard[games] = cards
+        self.top[games] = state
+
+        reverse: np.ndarray = values == REVERSE
+        if self.numPlayers >= 3:
+            self.direction[games[reverse]] *= -1
+        nextSeats: np.ndarray = self.next_seats(games, seats, 1)
+        skip: np.ndarray = values == SKIP
+        if skip.any():
+            nextSeats[skip] = self.next_seats(games[skip], nextSeats[skip], 1)
+        if self.numPlayers == 2: # special behavior! the same player moves again
+            nextSeats[reverse] = seats[reverse]
+        return nextSeats
+
+    def step(self) -> bool:
+        """Plays one turn in every unfinished game :return whether any game is still unfinished:"""
+        games: np.ndarray = np.flatnonzero(~self.done)
+        if not games.size:
+            return False
+        seats: np.ndarray = self.current[games]
+        self.turns[games] += 1
+
+        forgotUno: np.ndarray = (self.handSize[games, seats] == 1) & ~self.calledUno[games, seats]
+        self.draw(games[forgotUno], seats[forgotUno], 3)
+        self.calledUno[games, seats] = False
+
+        bullied: np.ndarray = self.bully[games] > 0
+        responds: np.ndarray = bullied & (self.handMask[games, seats] & BULLY[self.top[games]] != 0)
+        takes: np.ndarray = bullied & ~responds # has to draw, and then plays as usual
+        self.draw(games[takes], seats[takes], self.bully[games[takes]])
+        self.bully[games[takes]] = 0
+
+        normal: np.ndarray = ~responds # draws a card when there is no valid move
+        stuck: np.ndarray = normal & (self.handMask[games, seats] & VALID[self.top[games]] == 0)
+        self.draw(games[stuck], seats[stuck], 1)
+
+        cards: np.ndarray = self.choose(games, seats)
+        played: np.ndarray = cards != PASS
+        # answering a bully with anything but a +2 or +4 still means drawing the cards first
+        bullyBack: np.ndarray = np.isin(VALUE_CODES[np.maximum(cards, 0)], (DRAW_TWO, DRAW_FOUR))
+        dodged: np.ndarray = responds & played & ~bullyBack
+        self.draw(games[dodged], seats[dodged], self.bully[games[dodged]])
+        self.bully[games[dodged]] = 0
+
+        nextSeats: np.ndarray = np.empty_like(seats)
+        nextSeats[~played] = self.next_seats(games[~played], seats[~played], 1) # a pass keeps any bully going
+        nextSeats[played] = self.play(games[played], seats[played], cards[played])
+
+        finished: np.ndarray = played & (self.handSize[games, seats] == 0)
+        for game, seat in zip(games[finished], seats[finished]):
+            self.active[game, seat] = False
+            self.placings[game, self.winners[game]] = seat + 1
+            self.winners[game] += 1
+        over: np.ndarray = self.numPlayers - self.winners[games] <= 1
+        self.completed[games[over]] = True
+        self.current[games] = nextSeats
+        ended: np.ndarray = games[over | (self.turns[games] >= self.maxTurns)]
+        if ended.size:
+            self.harvest(ended)
+            self.done[ended] = True
+            if self.numGames > 0:
+                self.deal(ended[:self.numGames])
+        return True
+
+    def harvest(self, games: np.ndarray) -> None:
+        """Adds the results of games that have just ended to self.standings :param slot indices:"""
+        for game in games[~self.completed[games]]: # unfinished seats go after the winners, in seat order
+            self.placings[game, self.winners[game]:] = np.flatnonzero(self.active[game]) + 1
+        completed: np.ndarray = games[self.completed[games]]
+        self.placings[completed, -1] = self.active[completed].argmax(axis=1) + 1 # the one loser
+        placings: np.ndarray = self.placings[games]
+        places: np.ndarray = np.zeros_like(placings)
+        np.put_along_axis(places, placings - 1, np.arange(1, self.numPlayers + 1)[None, :], axis=1)
+
+        batch = Standings(self.numPlayers)
+        batch.games = games.size
+        batch.completed = int(self.completed[games].sum())
+        batch.turns = int(self.turns[games].sum())
+        won: np.ndarray = self.winners[games] > 0 # games cut off before anybody finished have no winner
+        batch.wins = np.bincount(placings[won, 0] - 1, minlength=self.numPlayers).tolist()
+        batch.cardsDrawn = self.drawn[games].sum(axis=0).tolist()
+        batch.placeSum = places.sum(axis=0).tolist()
+        self.standings.merge(batch)
+        return
+
+    def run(self) -> Standings:
+        """Plays all games to the end (or the turn limit) :return standings of all games:"""
+        while self.step():
+            pass
+        return self.standings
+
+
+def simulate_batches(numGames: int, numPlayers: int = 4, slots: int = 10000, seed: int = 0,
+                     maxTurns: int = 10000) -> Standings:
+    """Plays any number of games with at most a given number of them in lockstep
+    :param no. games: :param no. players: :param no. games in lockstep (bounds memory use): :param seed:
+    :param turn limit per game: :return standings of all games:"""
+    return BatchSimulator(numGames, numPlayers, slots, seed, maxTurns).run()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Plays many all-computer games in lockstep with numpy')
+    parser.add_argument('--games', type=int, default=100000, help='number of games to play')
+    parser.add_argument('--players', type=int, default=4, help='number of seats per game')
+    parser.add_argument('--slots', type=int, default=10000, help='number of games played in lockstep')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the random generator')
+    args = parser.parse_args()
+
+    report: dict = simulate_batches(args.games, args.players, args.slots, args.seed).report()
+    print(f'{report["games"]} games ({report["completed"]} completed), mean length {report["meanTurns"]:.1f} turns')
+    print('seat  win rate  mean place  mean drawn')
+    for seat in range(args.players):
+        print(f'{seat+1:4} {report["winRate"][seat]:9.3f} {report["meanPlace"][seat]:11.2f} '
+              f'{report["meanCardsDrawn"][seat]:11.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+"""Micro-benchmarks of the engine's hot paths: legality checks, the computer's move, drawing (including
+shuffling the pile into a new deck), walking the seats, rendering the screen and whole headless games.
+
+Run from anywhere with: python benchmarks/hotpaths.py [--json] [--save FILE] [--baseline FILE]
+Every benchmark reports the best time per operation over a few repeats (the least disturbed one).
+--save writes the results as json, --baseline compares with such a file and exits with status 1 when a
+benchmark got slower than the baseline by more than --tolerance, so it can guard against regressions."""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+import typing
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # the repository, where the game lives
+sys.path.insert(0, ROOT)
+
+from card import Card, CARDS, NUM_CARDS
+from game import Game
+from player import Computer
+from renderer import Renderer
+
+OPS: int = 1000 # operations per call of a benchmark, so the loop itself is measured as little as possible
+
+
+def random_cards(count: int, rng: random.Random) -> typing.List[Card]:
+    """Lists random cards as they sit in a deck or hand"""
+    return [CARDS[rng.randrange(NUM_CARDS)] for _ in range(count)]
+
+
+def random_tops(count: int, rng: random.Random) -> typing.List[Card]:
+    """Lists random top cards, black cards with a colour picked for them"""
+    return [card.declare(rng.choice(('Red', 'Yellow', 'Blue', 'Green'))) if card.colour == 'Black' else card
+            for card in random_cards(count, rng)]
+
+
+def new_game(players: int = 4) -> Game:
+    """Sets up a seeded headless game"""
+    game = Game(headless=True, seed=0)
+    game.setup((players, 0))
+    return game
+
+
+def bench_is_valid_move() -> typing.Callable:
+    rng = random.Random(0) # the same inputs on every run
+    pairs: typing.List[tuple] = list(zip(random_cards(OPS, rng), random_tops(OPS, rng)))
+
+    def run() -> None:
+        for card, top in pairs:
+            card.is_valid_move(top)
+    return run
+
+
+def bench_has_valid_move() -> typing.Callable:
+    rng = random.Random(0) # the same inputs on every run
+    player: Computer = new_game().players[0]
+    tops: typing.List[Card] = random_tops(OPS, rng)
+
+    def run() -> None:
+        for top in tops:
+            player.has_valid_move(top)
+    return run
+
+
+def bench_has_card() -> typing.Callable:
+    rng = random.Random(0) # the same inputs on every run
+    player: Computer = new_game().players[0]
+    patterns: typing.List[Card] = [rng.choice((card, Card('*', card.value), Card(card.colour, '*')))
+                                   for card in random_cards(OPS, rng)]
+
+    def run() -> None:
+        for pattern in patterns:
+            player.has_card(pattern)
+    return run
+
+
+def bench_choose_move() -> typing.Callable:
+    rng = random.Random(0) # the same inputs on every run
+    player: Computer = new_game().players[0]
+    tops: typing.List[Card] = random_tops(OPS, rng)
+
+    def run() -> None:
+        for top in tops:
+            choice = player.choose_move(top)
+            if isinstance(choice, Card): # back into the hand, so every call sees seven cards
+                player.draw([choice])
+            player.calledUno = False
+    return run
+
+
+def bench_draw() -> typing.Callable:
+    game: Game = new_game()
+
+    def run() -> None:
+        for _ in range(OPS):
+            game.pile += game.draw(1) # straight back onto the pile, so the deck runs out every 80 odd draws
+    return run
+
+
+def bench_draw_recreate() -> typing.Callable:
+    rng = random.Random(0) # the same inputs on every run
+    game: Game = new_game()
+    pile: typing.List[Card] = random_cards(100, rng)
+
+    def run() -> None:
+        for _ in range(OPS // 10):
+            game.deck.cardDeck.clear()
+            game.pile = pile.copy()
+            game.draw(1) # shuffles 99 cards into a new deck first
+    return run
+
+
+def bench_next_player_id() -> typing.Callable:
+    rng = random.Random(0) # the same inputs on every run
+    game: Game = new_game(6)
+    seats: typing.List[int] = [rng.randint(1, 6) for _ in range(OPS)]
+
+    def run() -> None:
+        for seat in seats:
+            game.next_player_id(seat)
+    return run
+
+
+def bench_display_options() -> typing.Callable:
+    game: Game = new_game()
+    game.renderer = Renderer(out=open(os.devnull, 'w'))
+    player: Computer = game.players[0]
+
+    def run() -> None:
+        for _ in range(OPS // 100):
+            game.display_options(player)
+    return run
+
+
+def bench_headless_game() -> typing.Callable:
+    seeds: typing.Iterator[int] = iter(range(10 ** 9))
+
+    def run() -> None:
+        for _ in range(OPS // 100):
+            Game(headless=True, seed=next(seeds)).simulate(4)
+    return run
+
+
+# name -> (function that prepares a benchmark and returns the callable to time, operations per call)
+BENCHMARKS: typing.Dict[str, tuple] = {
+    'Card.is_valid_move': (bench_is_valid_move, OPS),
+    'Player.has_valid_move': (bench_has_valid_move, OPS),
+    'Player.has_card': (bench_has_card, OPS),
+    'Computer.choose_move': (bench_choose_move, OPS),
+    'Game.draw': (bench_draw, OPS),
+    'Game.draw (recreate)': (bench_draw_recreate, OPS // 10),
+    'Game.next_player_id': (bench_next_player_id, OPS),
+    'Game.display_options': (bench_display_options, OPS // 100),
+    'headless game (4 players)': (bench_headless_game, OPS // 100),
+}
+
+
+def measure(name: str, repeat: int) -> dict:
+    """Times one benchmark :param name in BENCHMARKS: :param no. repeats: :return its results:"""
+    prepare, ops = BENCHMARKS[name]
+    timer = timeit.Timer(prepare())
+    number, _ = timer.autorange() # calls per repeat, so that a repeat takes at least 0.2 seconds
+    best: float = min(timer.repeat(repeat, number)) / (number * ops)
+    return {'nsPerOp': best * 1e9, 'opsPerSec': 1 / best}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> typing.List[str]:
+    """Compares with a baseline :param results: :param baseline results: :param allowed slowdown, 0.2 is 20%:
+    :return names of the benchmarks that got slower than allowed:"""
+    regressions: typing.List[str] = []
+    for name, result in results.items():
+        if name in baseline:
+            ratio: float = result['nsPerOp'] / baseline[name]['nsPerOp']
+            result['vsBaseline'] = ratio
+            if ratio > 1 + tolerance:
+                regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Times the hot paths of the game engine')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), metavar='NAME', help='run only these benchmarks')
+    parser.add_argument('--repeat', type=int, default=5, help='timed repeats per benchmark, the best one counts')
+    parser.add_argument('--json', action='store_true', help='print the results as json')
+    parser.add_argument('--save', default=None, help='write the results to a json file, to be used as a baseline')
+    parser.add_argument('--baseline', default=None, help='json file of an earlier run to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown against the baseline')
+    args = parser.parse_args()
+
+    results: dict = {name: measure(name, args.repeat) for name in (args.only or BENCHMARKS)}
+    regressions: typing.List[str] = []
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file)['benchmarks'], args.tolerance)
+    report: dict = {'python': platform.python_version(), 'platform': platform.platform(),
+                    'benchmarks': results, 'regressions': regressions}
+    if args.save is not None:
+        with open(args.save, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.json:
+        print(json.dumps(report))
+    else:
+        for name, result in results.items():
+            line: str = f'{name:28} {result["nsPerOp"]:12.0f} ns/op {result["opsPerSec"]:14.0f} ops/s'
+            if 'vsBaseline' in result:
+                line += f'  {result["vsBaseline"]:5.2f}x baseline' + ('  REGRESSION' if name in regressions else '')
+            print(line)
+    if regressions:
+        if not args.json:
+            print(f'slower than the baseline by more than {args.tolerance:.0%}: {", ".join(regressions)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,244 @@
+"""Load test of the game server (server.py): simulated clients in a few local processes join tables, play
+whole games with the computer policy (Computer decides every move, Uno calls included) and measure every move.
+
+Run from anywhere with: python benchmarks/loadtest.py [--clients 100 500 1000] [--processes 4] [--json]
+Without --unix or --port a server is started on a Unix socket in a temporary directory (bots move at once).
+A move's round trip is the time from sending it until the first message that comes back: while a seat has
+to move its table is waiting for it, so that message is the server's answer to the move.
+
+Every number of clients is one step; a step reports moves per second, round trip percentiles (p50, p99,
+p999) and errors (refused moves, connections that failed, games cut off by --timeout). The concurrency limit
+is the largest step with p99 under --p99-budget. --save and --baseline work like in hotpaths.py: the script
+exits with status 1 when a step got slower (p99 or throughput) than the baseline by more than --tolerance."""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # the repository, where the game lives
+sys.path.insert(0, ROOT)
+
+from card import Card, CARDS
+from player import Computer
+
+
+class Tally:
+    """What the clients of one process measured"""
+
+    def __init__(self):
+        self.latencies: typing.List[float] = [] # seconds per move, from sending it to the answer
+        self.games: int = 0
+        self.errors: int = 0
+
+
+async def connect(address: typing.Union[str, tuple]) -> typing.Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Opens a connection to a Unix socket (a path) or a TCP port (host, port)"""
+    if isinstance(address, str):
+        return await asyncio.open_unix_connection(address)
+    return await asyncio.open_connection(*address)
+
+
+async def simulated_client(address: typing.Union[str, tuple], join: dict, games: int, rng: random.Random,
+                           tally: Tally) -> None:
+    """Plays a number of games in a row, one connection per game, and measures every move"""
+    clock: typing.Callable = time.perf_counter
+    for _ in range(games):
+        try:
+            reader, writer = await connect(address)
+        except OSError:
+            tally.errors += 1
+            continue
+        player = Computer(0)
+        player.headless, player.rng = True, rng
+        writer.write(json.dumps(join).encode() + b'\n')
+        sentAt: float = 0.0 # when the last move was sent, 0 once it was answered
+        try:
+            async for line in reader:
+                if sentAt:
+                    tally.latencies.append(clock() - sentAt)
+                    sentAt = 0.0
+                message: dict = json.loads(line)
+                kind: str = message['type']
+                if kind == 'turn':
+                    player.receive_hand([CARDS[card] for card in message['hand']])
+                    player.calledUno = False
+                    move: typing.Union[Card, str] = player.choose_move(CARDS[message['top']])
+                    answer: bytes = b'{"type": "uno"}\n' if player.calledUno else b''
+                    if isinstance(move, Card):
+                        colour: str = player.pick_colour() if move.colour == 'Black' else None
+                        answer += json.dumps({'type': 'play', 'card': move.id, 'colour': colour}).encode() + b'\n'
+                    else:
+                        answer += b'{"type": "pass"}\n'
+                    writer.write(answer)
+                    sentAt = clock()
+                elif kind == 'error':
+                    tally.errors += 1
+                elif kind == 'end':
+                    tally.games += 1
+                    break
+        except (OSError, ValueError):
+            tally.errors += 1
+        finally:
+            writer.close()
+    return
+
+
+def run_clients(address: typing.Union[str, tuple], clients: int, join: dict, games: int, seed: int,
+                timeout: float) -> Tally:
+    """Runs a number of simulated clients on one event loop (in a process of its own) :return what they measured:"""
+    tally = Tally()
+
+    async def run() -> None:
+        tasks: list = [simulated_client(address, join, games, random.Random(seed * 100003 + client), tally)
+                       for client in range(clients)]
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+        except asyncio.TimeoutError:
+            tally.errors += clients * games - tally.games # games that did not end in time
+    asyncio.run(run())
+    return tally
+
+
+def percentile(ordered: typing.List[float], fraction: float) -> float:
+    """Nearest rank percentile of sorted values :param sorted values: :param 0.99 for p99: :return value:"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def step(address: typing.Union[str, tuple], clients: int, processes: int, join: dict, games: int, seed: int,
+         timeout: float) -> dict:
+    """Runs one step of the load test :param address: :param simulated clients: :param local processes they are
+    spread over: :param join message: :param games per client: :param seed: :param seconds before giving up:
+    :return results of the step:"""
+    processes = min(processes, clients)
+    shares: typing.List[int] = [clients // processes + (1 if process < clients % processes else 0)
+                                for process in range(processes)]
+    start: float = time.perf_counter()
+    with multiprocessing.Pool(processes) as pool:
+        tallies: typing.List[Tally] = pool.starmap(run_clients, [(address, share, join, games, seed * 1000 + process,
+                                                                  timeout) for process, share in enumerate(shares)])
+    seconds: float = time.perf_counter() - start
+    latencies: typing.List[float] = sorted(latency for tally in tallies for latency in tally.latencies)
+    return {'clients': clients,
+            'games': sum(tally.games for tally in tallies),
+            'moves': len(latencies),
+            'seconds': seconds,
+            'movesPerSec': len(latencies) / seconds,
+            'p50ms': percentile(latencies, 0.5) * 1000,
+            'p99ms': percentile(latencies, 0.99) * 1000,
+            'p999ms': percentile(latencies, 0.999) * 1000,
+            'errors': sum(tally.errors for tally in tallies)}
+
+
+def start_server(path: str) -> subprocess.Popen:
+    """Starts server.py on a Unix socket, with bots that move at once, and waits until it listens"""
+    process = subprocess.Popen([sys.executable, os.path.join(ROOT, 'server.py'), '--unix', path, '--bot-delay', '0'],
+                               stdout=subprocess.DEVNULL)
+    deadline: float = time.perf_counter() + 30
+    while not os.path.exists(path):
+        if process.poll() is not None or time.perf_counter() > deadline:
+            raise RuntimeError('the server did not start')
+        time.sleep(0.05)
+    return process
+
+
+def compare(results: typing.List[dict], baseline: typing.List[dict], tolerance: float) -> typing.List[str]:
+    """Compares the steps with the steps of a baseline that had the same number of clients
+    :return descriptions of the steps that got slower than allowed:"""
+    earlier: typing.Dict[int, dict] = {result['clients']: result for result in baseline}
+    regressions: typing.List[str] = []
+    for result in results:
+        base: dict = earlier.get(result['clients'])
+        if base is None:
+            continue
+        result['p99VsBaseline'] = result['p99ms'] / base['p99ms'] if base['p99ms'] else 1.0
+        result['throughputVsBaseline'] = result['movesPerSec'] / base['movesPerSec'] if base['movesPerSec'] else 1.0
+        if result['p99VsBaseline'] > 1 + tolerance:
+            regressions.append(f'p99 at {result["clients"]} clients')
+        if result['throughputVsBaseline'] < 1 / (1 + tolerance):
+            regressions.append(f'moves/s at {result["clients"]} clients')
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Plays many games against the game server and measures every move')
+    parser.add_argument('--clients', type=int, nargs='+', default=[100, 500, 1000], help='simulated clients per step')
+    parser.add_argument('--processes', type=int, default=multiprocessing.cpu_count(), help='local processes for the clients')
+    parser.add_argument('--games', type=int, default=2, help='games per client')
+    parser.add_argument('--seats', type=int, default=4, help='players per table')
+    parser.add_argument('--humans', type=int, default=2, help='simulated clients per table, bots play the other seats')
+    parser.add_argument('--unix', default=None, metavar='PATH', help='Unix socket of a running server')
+    parser.add_argument('--host', default='127.0.0.1', help='host of a running server, with --port')
+    parser.add_argument('--port', type=int, default=None, help='TCP port of a running server')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the clients\' decisions')
+    parser.add_argument('--timeout', type=float, default=300, help='seconds a step may take')
+    parser.add_argument('--p99-budget', type=float, default=50, help='p99 round trip in ms that a step has to stay under')
+    parser.add_argument('--json', action='store_true', help='print the report as json')
+    parser.add_argument('--save', default=None, help='write the report to a json file, to be used as a baseline')
+    parser.add_argument('--baseline', default=None, help='json file of an earlier run to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown against the baseline')
+    args = parser.parse_args()
+    if any(clients % args.humans for clients in args.clients):
+        parser.error('every number of clients has to fill whole tables (a multiple of --humans)')
+
+    join: dict = {'type': 'join', 'seats': args.seats, 'humans': args.humans}
+    server: subprocess.Popen = None
+    directory: tempfile.TemporaryDirectory = None
+    if args.unix is not None:
+        address: typing.Union[str, tuple] = args.unix
+    elif args.port is not None:
+        address = (args.host, args.port)
+    else:
+        directory = tempfile.TemporaryDirectory()
+        address = os.path.join(directory.name, 'uno.sock')
+        server = start_server(address)
+    try:
+        results: typing.List[dict] = [step(address, clients, args.processes, join, args.games, args.seed, args.timeout)
+                                      for clients in args.clients]
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+            directory.cleanup()
+
+    regressions: typing.List[str] = []
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file)['steps'], args.tolerance)
+    withinBudget: typing.List[int] = [result['clients'] for result in results if result['p99ms'] < args.p99_budget]
+    report: dict = {'python': platform.python_version(), 'platform': platform.platform(), 'seats': args.seats,
+                    'humans': args.humans, 'steps': results, 'limit': max(withinBudget, default=0),
+                    'regressions': regressions}
+    if args.save is not None:
+        with open(args.save, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.json:
+        print(json.dumps(report))
+    else:
+        print(f'{"clients":>8} {"games":>7} {"moves/s":>9} {"p50 ms":>8} {"p99 ms":>8} {"p999 ms":>8} {"errors":>7}')
+        for result in results:
+            line: str = (f'{result["clients"]:8} {result["games"]:7} {result["movesPerSec"]:9.0f} {result["p50ms"]:8.2f} '
+                         f'{result["p99ms"]:8.2f} {result["p999ms"]:8.2f} {result["errors"]:7}')
+            if 'p99VsBaseline' in result:
+                line += f'  p99 {result["p99VsBaseline"]:5.2f}x, moves/s {result["throughputVsBaseline"]:5.2f}x baseline'
+            print(line)
+        print(f'p99 under {args.p99_budget:g} ms up to {report["limit"]} clients' if report['limit']
+              else f'p99 over {args.p99_budget:g} ms at every step')
+    if regressions:
+        if not args.json:
+            print(f'slower than the baseline by more than {args.tolerance:.0%}: {", ".join(regressions)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
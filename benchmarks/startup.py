@@ -0,0 +1,77 @@
+"""Measures the cold start of the terminal game: how long importing the game takes,
+and how long it takes main.py to show its first prompt.
+
+Run from anywhere with: python benchmarks/startup.py [--runs N] [--budget MS]
+With --budget the script exits with status 1 when time-to-first-prompt exceeds the budget,
+so it can guard against startup regressions (like an expensive import sneaking back in)."""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import typing
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # the repository, where main.py lives
+
+
+def time_command(code: str) -> float:
+    """Runs a snippet in a fresh interpreter :return wall time in ms:"""
+    start: float = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def time_to_first_prompt() -> float:
+    """Starts main.py and waits until it asks for input for the first time :return wall time in ms:"""
+    start: float = time.perf_counter()
+    process = subprocess.Popen([sys.executable, 'main.py'], cwd=ROOT, stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    while True:
+        char: bytes = process.stdout.read(1)
+        if char == b'>' or not char: # every prompt in the game ends with '>'
+            break
+    elapsed: float = (time.perf_counter() - start) * 1000
+    process.kill()
+    process.wait()
+    return elapsed
+
+
+def slowest_imports(count: int = 5) -> typing.List[tuple]:
+    """Uses python -X importtime to find the most expensive imports of game.py
+    :return list of (cumulative microseconds, module name):"""
+    output: str = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import game'], cwd=ROOT,
+                                 capture_output=True, text=True, check=True).stderr
+    imports: typing.List[tuple] = []
+    for line in output.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            imports.append((int(fields[1]), fields[2].strip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measures import time and time-to-first-prompt of main.py')
+    parser.add_argument('--runs', type=int, default=10, help='number of cold starts per measurement')
+    parser.add_argument('--budget', type=float, default=None, help='maximum median time-to-first-prompt in ms')
+    args = parser.parse_args()
+
+    bare: typing.List[float] = [time_command('pass') for _ in range(args.runs)]
+    imported: typing.List[float] = [time_command('import game') for _ in range(args.runs)]
+    prompt: typing.List[float] = [time_to_first_prompt() for _ in range(args.runs)]
+
+    interpreter: float = statistics.median(bare)
+    print(f'interpreter startup:   {interpreter:7.1f} ms')
+    print(f'import game:           {statistics.median(imported) - interpreter:7.1f} ms (on top of the interpreter)')
+    print(f'time to first prompt:  {statistics.median(prompt):7.1f} ms (median of {args.runs})')
+    print('slowest imports (cumulative):')
+    for microseconds, module in slowest_imports():
+        print(f'  {microseconds / 1000:7.2f} ms  {module}')
+
+    if args.budget is not None and statistics.median(prompt) > args.budget:
+        print(f'time to first prompt is over the budget of {args.budget} ms')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,22 +1,101 @@
 from __future__ import annotations
 import typing
 
+COLOURS: tuple = ('Red', 'Yellow', 'Blue', 'Green') # index in this tuple is the colour code
+BLACK: int = 4 # colour code of wild cards, as long as no colour has been picked for them
+VALUES: tuple = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 'Draw Two', 'Reverse', 'Skip', 'Draw Four', 'Wild') # index is the value code
+DRAW_TWO, REVERSE, SKIP, DRAW_FOUR, WILD = 10, 11, 12, 13, 14 # value codes of the action cards
+COLOUR_CODES: dict = {colour: code for code, colour in enumerate(COLOURS + ('Black',))} # colour name -> colour code
+VALUE_CODES: dict = {value: code for code, value in enumerate(VALUES)} # card value -> value code
+
+NUM_CARDS: int = 54 # distinct cards in a deck: 13 values in four colours, plus the two black cards
+NUM_STATES: int = 62 # distinct top cards: every card, plus the black cards after a colour was picked
+
 class Card:
-    def __init__(self, colour: str, value):
-        self.colour: str = colour
-        self.value: typing.Union[str, int] = value # can be string or int
-    
+    """Flyweight card: there is exactly one (interned) instance for every colour/value combination,
+    so decks, hands and the pile only hold references to these shared objects.
+
+    Ids 0-51 are the coloured cards (colour code * 13 + value code), 52 and 53 are the black
+    Draw Four and Wild, and 54-61 are Draw Fours and Wilds for which a colour has been picked.
+    The latter never sit in a deck or hand, they only describe the card on top of the pile."""
+    __slots__ = ('id', 'colour', 'value', 'colourCode', 'valueCode', 'bit')
+    _interned: dict = {} # (colour, value) -> the shared instance
+
+    def __new__(cls, colour: str, value: typing.Union[str, int]) -> Card:
+        card = cls._interned.get((colour, value))
+        if card is None: # not a real card, for instance the pattern Card('*', 'Draw Two') in has_card
+            card = object.__new__(cls)
+            card.id, card.colour, card.value, card.colourCode, card.valueCode, card.bit = -1, colour, value, -1, -1, 0
+        return card
+
+    def __reduce__(self) -> tuple:
+        """Makes pickle and copy hand back the interned instance instead of a new object"""
+        return (Card, (self.colour, self.value))
+
     def __str__(self) -> str:
         return f'[{self.colour} | {self.value}]'
 
+    def __repr__(self) -> str:
+        return f'Card({self.colour!r}, {self.value!r})'
+
     def is_valid_move(self, topCard: Card) -> bool:
-        if self.colour == 'Black': # always legal
+        if self.colourCode == BLACK: # always legal
             return True
-        elif self.colour == topCard.colour or self.value == topCard.value:
+        elif self.colourCode == topCard.colourCode or self.valueCode == topCard.valueCode:
             return True
         return False
-    
+
     def is_valid_last_move(self, topCard: Card) -> bool:
-        if isinstance(self.value, int) and self.is_valid_move(topCard):
+        if self.valueCode < DRAW_TWO and self.is_valid_move(topCard):
             return True
         return False
+
+    def declare(self, colour: str) -> Card:
+        """For a black card, returns the top card state after a colour has been picked for it"""
+        return Card(colour, self.value)
+
+    def undeclared(self) -> Card:
+        """Returns the card as it sits in a deck, so a picked colour is turned back into black"""
+        return CARDS[self.id - 2 * self.colourCode - 2] if self.id >= NUM_CARDS else self
+
+
+def _intern(cardId: int, colourCode: int, valueCode: int) -> Card:
+    """Creates the shared instance for a card, only called while building CARDS"""
+    card = object.__new__(Card)
+    card.id, card.colourCode, card.valueCode = cardId, colourCode, valueCode
+    card.bit = 1 << cardId # the card's flag in the move masks below
+    card.colour = COLOURS[colourCode] if colourCode < BLACK else 'Black'
+    card.value = VALUES[valueCode]
+    Card._interned[(card.colour, card.value)] = card
+    return card
+
+CARDS: typing.Tuple[Card, ...] = tuple( # index in this tuple is the card id
+    [_intern(colourCode * 13 + valueCode, colourCode, valueCode) for colourCode in range(4) for valueCode in range(13)] +
+    [_intern(52, BLACK, DRAW_FOUR), _intern(53, BLACK, WILD)] +
+    [_intern(54 + colourCode * 2 + valueCode - DRAW_FOUR, colourCode, valueCode) for colourCode in range(4) for valueCode in (DRAW_FOUR, WILD)])
+
+def _legality_tables() -> tuple:
+    """Computes, for every top card state, bitmasks of the cards (ids 0-53) that may be played on it
+    :return tuple(valid moves, valid last moves, preferred computer moves, bully responses):"""
+    numbers: int = sum(card.bit for card in CARDS[:NUM_CARDS] if card.valueCode < DRAW_TWO)
+    drawTwos: int = sum(card.bit for card in CARDS[:NUM_CARDS] if card.valueCode == DRAW_TWO)
+    drawFour: int = CARDS[52].bit
+    valid, last, preferred, bully = [], [], [], []
+    for topCard in CARDS:
+        mask: int = sum(card.bit for card in CARDS[:NUM_CARDS] if card.is_valid_move(topCard))
+        valid.append(mask)
+        last.append(mask & numbers) # the last card of a hand has to be a number
+        if topCard.valueCode == DRAW_TWO:
+            preferred.append(drawTwos)
+            bully.append(drawTwos | drawFour)
+        elif topCard.valueCode == DRAW_FOUR:
+            preferred.append(drawFour)
+            # after a Draw Four, a Draw Two is only a response if it has the picked colour
+            bully.append(drawFour | (Card(topCard.colour, 'Draw Two').bit if topCard.colourCode < BLACK else 0))
+        else:
+            preferred.append(0)
+            bully.append(0)
+    return tuple(valid), tuple(last), tuple(preferred), tuple(bully)
+
+# index these with the id of the card on top of the pile, and test a card with mask & card.bit
+VALID_MOVES, VALID_LAST_MOVES, PREFERRED_MOVES, BULLY_RESPONSES = _legality_tables()
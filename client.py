@@ -0,0 +1,129 @@
+"""Terminal client for server.py: shows the same screens as the terminal game (through Renderer) and asks
+for moves the same way, with option numbers (see Human.choose_move), then sends them to the server.
+
+Run with: python client.py [--host 127.0.0.1 --port 7777 | --unix PATH] [--table office --seats 4 --humans 2] [--curses]
+Or watch a table as a spectator: python client.py --watch office
+"""
+import argparse
+import json
+import socket
+import typing
+from card import Card, CARDS
+from player import Human
+from renderer import Renderer
+
+class Client:
+    """One player at a table of a game server, on a blocking socket"""
+
+    def __init__(self, connection: socket.socket, renderer: Renderer = None):
+        self.connection: socket.socket = connection
+        self.lines: typing.TextIO = connection.makefile('r', encoding='utf-8') # messages from the server
+        self.renderer: Renderer = renderer or Renderer()
+        self.player: Human = Human(0) # asks for moves and colours exactly like the terminal game, seat set on joining
+        self.player.renderer = self.renderer
+
+    def send(self, message: dict) -> None:
+        self.connection.sendall(json.dumps(message).encode() + b'\n')
+        return
+
+    def play(self, table: str = None, seats: int = 4, humans: int = 1) -> dict:
+        """Joins a table and plays until the game ends :return the end message, None if the server hung up:"""
+        self.send({'type': 'join', 'table': table, 'seats': seats, 'humans': humans})
+        for line in self.lines:
+            message: dict = json.loads(line)
+            kind: str = message['type']
+            if kind == 'turn':
+                self.show(message)
+                self.take_turn(message)
+            elif kind == 'log':
+                self.renderer.log(message['text'])
+            elif kind == 'error':
+                self.renderer.say(message['text'])
+            elif kind == 'joined':
+                self.player.id = message['seat']
+                waiting: str = f', waiting for {message["humans"] - message["seat"]} more' if message['seat'] < message['humans'] else ''
+                self.renderer.say(f'joined table {message["table"]} in seat {message["seat"]} of {message["seats"]}{waiting}')
+            elif kind == 'end':
+                ranked: typing.List[int] = message['placings'] if message['completed'] else message['placings'][:message['finished']]
+                places: str = ', '.join(f'{place}. player {seat}' for place, seat in enumerate(ranked, start=1))
+                if message['completed']:
+                    self.renderer.say(f'the game is over: {places}')
+                else: # the turn limit was hit, the players that did not finish have no place
+                    self.renderer.say(f'the game was cut off after {message["turns"]} turns: {places or "nobody finished"}')
+                return message
+        return None
+
+    def watch(self, table: str) -> dict:
+        """Watches a table until its game ends :return the last frame, None if there was nothing to watch:"""
+        from spectator import screen # only spectators need it, it brings threading along
+        self.send({'type': 'watch', 'table': table})
+        for line in self.lines:
+            message: dict = json.loads(line)
+            if message['type'] == 'error':
+                self.renderer.say(message['text'])
+                return None
+            self.renderer.write(screen(message, self.renderer))
+            if message['over']:
+                return message
+        return None
+
+    def show(self, message: dict) -> None:
+        """Shows the screen of a turn, like Game.display_options :param turn message:"""
+        self.renderer.show_turn(CARDS[message['top']], message['seat'], [CARDS[card] for card in message['hand']],
+                                message['calledUno'])
+        return
+
+    def take_turn(self, message: dict) -> None:
+        """Asks for a move with the option numbers of the screen and sends it :param turn message:"""
+        player: Human = self.player
+        player.receive_hand([CARDS[card] for card in message['hand']])
+        player.calledUno = False
+        move: typing.Union[Card, str] = player.choose_move(CARDS[message['top']])
+        if player.calledUno: # correct or not, the server decides what happens next
+            self.send({'type': 'uno'})
+        if isinstance(move, Card):
+            self.send({'type': 'play', 'card': move.id, 'colour': player.pick_colour() if move.colour == 'Black' else None})
+        elif move == 'pass':
+            self.send({'type': 'pass'})
+        return
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Plays Uno at a table of a game server')
+    parser.add_argument('--host', default='127.0.0.1', help='address of the server')
+    parser.add_argument('--port', type=int, default=7777, help='TCP port of the server')
+    parser.add_argument('--unix', default=None, metavar='PATH', help='connect to a Unix socket instead of TCP')
+    parser.add_argument('--table', default=None, help='name of the table to join, the same name seats players together')
+    parser.add_argument('--seats', type=int, default=4, help='players at the table, when it is a new one')
+    parser.add_argument('--humans', type=int, default=1, help='human players the table waits for, when it is a new one')
+    parser.add_argument('--curses', action='store_true', help='draw on curses, repainting only what changed')
+    parser.add_argument('--watch', default=None, metavar='TABLE', help='watch a table as a spectator instead of playing')
+    args = parser.parse_args()
+
+    if args.unix is not None:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(args.unix)
+    else:
+        connection = socket.create_connection((args.host, args.port))
+    renderer: Renderer = Renderer()
+    onCurses: bool = False # whether the renderer took over the terminal
+    if args.curses and args.watch is None:
+        from cursesrenderer import CursesRenderer, open_screen
+        renderer = open_screen()
+        onCurses = isinstance(renderer, CursesRenderer)
+    with connection:
+        try:
+            if args.watch is not None:
+                Client(connection, renderer).watch(args.watch)
+                return
+            Client(connection, renderer).play(args.table, args.seats, args.humans)
+            if onCurses: # the screen goes away with curses
+                renderer.ask('Press Enter to leave: ')
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if onCurses:
+                renderer.stop()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+"""Terminal interface on curses that keeps a model of the screen and only repaints what changed between
+two updates. The screen is split into regions: Uno banners, the top card, the title of the turn, the hand,
+the other options, the event log and a message line, with the prompt on the bottom line.
+
+Every update lays out all regions for the current terminal size and compares them with what is on the screen:
+regions that are the same are not touched, regions that stayed in place only get their changed lines rewritten
+and regions that moved are wiped and drawn again (curses then sends only the characters that differ). When the
+terminal is resized the layout is made again and the whole screen is repainted: the log moves below the card
+when it does not fit next to it, and the big card shrinks to one line when the terminal is not high enough.
+
+    UNO_RENDERER=curses python main.py
+
+    renderer = CursesRenderer().start() # takes over the terminal
+    renderer.attach(game) # before the game is set up
+    game.start()
+    renderer.stop()
+
+Renderer (one write per screen, scrolling) is still the default, and the fallback where curses is not available:
+open_screen() returns a started CursesRenderer when it can, and a plain Renderer otherwise.
+"""
+import re
+import typing
+from card import Card, CARDS
+from events import Event
+from renderer import Renderer, TerminalLog
+try:
+    import curses
+except ImportError: # not part of Python on Windows
+    curses = None
+
+ANSI: re.Pattern = re.compile('\033\\[[0-9;]*m') # colour codes in the cached pictures of Renderer
+CARD_WIDTH: int = 34 # width of the big top card
+LOG_MIN_WIDTH: int = 30 # the log goes next to the card when at least this many columns are left for it
+LOG_LINES: int = 50 # lines of the event log that are kept
+
+Line = typing.Tuple[typing.Tuple[str, str], ...] # (text, colour name) segments
+Region = typing.Tuple[int, int, typing.Tuple[Line, ...]] # row, column, lines
+
+
+class CursesRenderer(Renderer):
+    """Draws the screens of the terminal game on a curses window, repainting only the regions that changed"""
+
+    cardLines: typing.List[typing.Tuple[Line, ...]] = None # big top card per card id without colour codes, shared
+
+    def __init__(self, window: typing.Any = None):
+        super().__init__()
+        if CursesRenderer.cardLines is None:
+            CursesRenderer.cardLines = [tuple(((line, card.colour),) for line in ANSI.sub('', frame).rstrip('\n').split('\n'))
+                                        for card, frame in zip(CARDS, self.frames)]
+        self.window: typing.Any = window # the curses window, made by start() or handed in (tests use a fake one)
+        self.started: bool = False # whether start() took over the terminal
+        self.attrs: typing.Dict[str, int] = {} # colour name -> curses attribute, empty means no colours
+        self.turn: tuple = None # (top card, seat, hand or None while it is hidden, uno calls) of the turn on screen
+        self.logLines: typing.List[str] = []
+        self.message: str = '' # last message to the player, shown above the prompt
+        self.painted: typing.Dict[str, Region] = {} # region name -> region as it is on the screen
+        self.repaints: typing.Dict[str, int] = {} # region name -> times it was (partly) painted
+
+    def start(self) -> 'CursesRenderer':
+        """Takes over the terminal, raises curses.error when it cannot :return itself:"""
+        self.window = curses.initscr()
+        self.started = True
+        curses.noecho()
+        curses.cbreak()
+        self.window.keypad(True)
+        if curses.has_colors():
+            curses.start_color()
+            curses.use_default_colors()
+            for pair, (name, colour) in enumerate([('Red', curses.COLOR_RED), ('Yellow', curses.COLOR_YELLOW),
+                                                   ('Green', curses.COLOR_GREEN), ('Blue', curses.COLOR_BLUE)], start=1):
+                curses.init_pair(pair, colour, -1)
+                self.attrs[name] = curses.color_pair(pair)
+        self.attrs['Uno'] = curses.A_BOLD
+        return self
+
+    def stop(self) -> None:
+        """Gives the terminal back"""
+        if self.started:
+            self.window.keypad(False)
+            curses.nocbreak()
+            curses.echo()
+            curses.endwin()
+            self.started = False
+        return
+
+    def attach(self, game: 'Game') -> 'CursesRenderer':
+        """Lets a game draw on this screen: its turns, prompts and event log (before the game is set up) :return itself:"""
+        if game.terminalLog:
+            game.events.unsubscribe(game.terminalLog)
+        game.terminalLog = CursesLog(self)
+        game.events.subscribe(game.terminalLog)
+        game.renderer = self
+        for player in game.players:
+            player.renderer = self
+        return self
+
+    def show_turn(self, topCard: Card, seat: int, hand: typing.List[Card], unoCalls: typing.List[int],
+                  private: bool = False) -> None:
+        """Updates the screen for a turn, the hand stays hidden until Enter is pressed when private"""
+        if private:
+            self.turn = (topCard, seat, None, tuple(unoCalls))
+            self.ask('Press Enter to view your options: ')
+        self.turn = (topCard, seat, tuple(hand), tuple(unoCalls))
+        self.paint()
+        return
+
+    def log(self, text: str) -> None:
+        """Adds lines to the event log, without the padding that puts them to the right of a scrolling terminal"""
+        self.logLines += TerminalLog.unpadded(text)
+        del self.logLines[:-LOG_LINES]
+        self.paint()
+        return
+
+    def say(self, text: str) -> None:
+        """Shows a message above the prompt, an empty one clears it"""
+        self.message = ' '.join(line.strip() for line in text.split('\n') if line.strip())
+        self.paint()
+        return
+
+    def ask(self, prompt: str) -> str:
+        """Reads a line on the bottom row, the lines of the prompt before the last one become the message
+        :param prompt: :return what was typed:"""
+        *lines, label = prompt.split('\n')
+        if any(line.strip() for line in lines):
+            self.message = ' '.join(line.strip() for line in lines if line.strip())
+        self.paint()
+        text: str = ''
+        while True:
+            self.show_prompt(label + text)
+            key: typing.Union[str, int] = self.window.get_wch()
+            if key in ('\n', '\r') or key == curses.KEY_ENTER:
+                break
+            if key == curses.KEY_RESIZE:
+                self.resize()
+            elif key in ('\b', '\x7f') or key == curses.KEY_BACKSPACE:
+                text = text[:-1]
+            elif isinstance(key, str) and key.isprintable():
+                text += key
+        self.show_prompt('')
+        return text
+
+    def resize(self) -> None:
+        """Lays the screen out again for the new size of the terminal and repaints all of it"""
+        if self.started:
+            curses.update_lines_cols()
+        self.window.clear()
+        self.painted = {}
+        self.paint()
+        return
+
+    def layout(self) -> typing.Dict[str, Region]:
+        """Places every region for the current size of the terminal :return region name -> region:"""
+        rows, cols = self.window.getmaxyx()
+        regions: typing.Dict[str, Region] = {}
+        row: int = 0
+        cardRow, cardLines = 0, ()
+        if self.turn is not None:
+            topCard, seat, hand, unoCalls = self.turn
+            banners: tuple = tuple(((f'player {playerId} called Uno!', 'Uno'),) for playerId in unoCalls)
+            handLines: tuple = self.hand_lines(hand, cols) if hand is not None else ()
+            options: tuple = () if hand is None else ((('Other options:', None),), ((f'{len(hand)+1} - Pass', None),),
+                                                       ((f'{len(hand)+2} - Call Uno', None),))
+            if isinstance(topCard, Card) and topCard.id >= 0:
+                cardLines = self.cardLines[topCard.id]
+                below: int = 1 + len(handLines) + len(options) + 2 # title, hand, options, message and prompt
+                if len(banners) + len(cardLines) + below > rows: # not high enough for the big card
+                    cardLines = ((('top of pile: ', None), (str(topCard), topCard.colour)),)
+            regions['banners'] = (row, 0, banners)
+            row += len(banners)
+            cardRow = row
+            regions['card'] = (row, 0, cardLines)
+            row += len(cardLines)
+            regions['title'] = (row, 0, (((f'---player {seat}\'s turn---', None),),))
+            row += 1
+            regions['hand'] = (row, 0, handLines)
+            row += len(handLines)
+            regions['options'] = (row, 0, options)
+            row += len(options)
+        if len(cardLines) > 1 and cols - CARD_WIDTH - 4 >= LOG_MIN_WIDTH: # next to the big card
+            height, logRow, logCol = len(cardLines), cardRow, CARD_WIDTH + 4
+        else:
+            height, logRow, logCol = rows - 2 - row, row, 0
+        shown: typing.List[str] = self.logLines[-height:] if height > 0 else []
+        regions['log'] = (logRow, logCol, tuple(((line[:cols - logCol], None),) for line in shown))
+        regions['message'] = (rows - 2, 0, (((self.message[:cols], None),),) if self.message else ())
+        return regions
+
+    def hand_lines(self, hand: typing.Tuple[Card, ...], cols: int) -> typing.Tuple[Line, ...]:
+        """Lays out a hand in rows of (small) cards with their option numbers, as many to a row as fit"""
+        perRow: int = max(1, min(14, cols // 8))
+        lines: typing.List[Line] = []
+        cardsDisplayed: int = 0
+        for row in self.split_rows(list(hand), -(-len(hand) // perRow)):
+            top, colours, middle, values, numbers = [], [], [], [], []
+            for idx, card in enumerate(row):
+                shortColour, shortValue = self.shortCards[card.id]
+                top.append(('+-----+ ', card.colour))
+                colours.append((f'| {ANSI.sub("", shortColour)} | ', card.colour))
+                middle.append(('|     | ', card.colour))
+                values.append((f'| {shortValue} | ', card.colour))
+                numbers.append((f'   {cardsDisplayed + idx + 1:<5}', None))
+            cardsDisplayed += len(row)
+            lines += [tuple(top), tuple(colours), tuple(middle), tuple(values), tuple(top), tuple(numbers), ()]
+        return tuple(lines)
+
+    def paint(self) -> None:
+        """Brings the screen up to date with the model: wipes what changed first (regions can move into each
+        other's place) and then draws it, regions that did not change are left alone"""
+        regions: typing.Dict[str, Region] = self.layout()
+        redraw: typing.Dict[str, typing.List[int]] = {} # region name -> lines to draw
+        for name, region in regions.items():
+            old: Region = self.painted.get(name)
+            if old == region or (old is None and not region[2]): # nothing to do for what is (and was) empty
+                continue
+            if old is not None and old[:2] == region[:2]: # in place: only the lines that differ
+                changed: typing.List[int] = [i for i in range(max(len(old[2]), len(region[2])))
+                                             if old[2][i:i+1] != region[2][i:i+1]]
+                self.erase(old, [i for i in changed if i < len(old[2])])
+            else:
+                changed = list(range(len(region[2])))
+                if old is not None:
+                    self.erase(old, range(len(old[2])))
+            redraw[name] = [i for i in changed if i < len(region[2])]
+        for name, lines in redraw.items():
+            self.draw(regions[name], lines)
+            self.painted[name] = regions[name]
+            self.repaints[name] = self.repaints.get(name, 0) + 1
+        if redraw:
+            self.window.refresh()
+        return
+
+    def draw(self, region: Region, lines: typing.Iterable[int]) -> None:
+        row, col, content = region
+        for i in lines:
+            x: int = col
+            for text, colour in content[i]:
+                self.put(row + i, x, text, self.attrs.get(colour, 0))
+                x += len(text)
+        return
+
+    def erase(self, region: Region, lines: typing.Iterable[int]) -> None:
+        row, col, content = region
+        for i in lines:
+            width: int = sum(len(text) for text, _ in content[i])
+            if width:
+                self.put(row + i, col, ' ' * width, 0)
+        return
+
+    def put(self, row: int, col: int, text: str, attr: int) -> None:
+        """Writes text that is clipped to the window (curses refuses to write outside of it)"""
+        rows, cols = self.window.getmaxyx()
+        if row < 0 or row >= rows or col >= cols:
+            return
+        text = text[:cols - col - (1 if row == rows - 1 else 0)] # the bottom right corner can not be written
+        if not text:
+            return
+        try:
+            self.window.addstr(row, col, text, attr)
+        except curses.error: # the terminal shrank in the meantime, a KEY_RESIZE follows
+            pass
+        return
+
+    def show_prompt(self, text: str) -> None:
+        """Rewrites the bottom row and puts the cursor at the end of it"""
+        rows, cols = self.window.getmaxyx()
+        self.put(rows - 1, 0, text[-(cols - 1):] + ' ' * max(0, cols - 1 - len(text)), 0)
+        self.window.move(rows - 1, min(len(text), cols - 1))
+        self.window.refresh()
+        return
+
+
+class CursesLog(TerminalLog):
+    """Subscriber that sends the lines of the terminal log to the log region of a CursesRenderer"""
+
+    def __init__(self, renderer: CursesRenderer):
+        super().__init__()
+        self.renderer: CursesRenderer = renderer
+
+    def __call__(self, event: Event) -> None:
+        message: str = self.format(event)
+        if message:
+            self.renderer.log(message)
+        return
+
+
+def open_screen() -> Renderer:
+    """Takes over the terminal with a CursesRenderer, or returns a plain Renderer when curses is not available
+    or cannot drive this terminal :return renderer, stop() it when it is a CursesRenderer:"""
+    if curses is None:
+        return Renderer()
+    try:
+        return CursesRenderer().start()
+    except curses.error:
+        try:
+            curses.endwin() # gives the terminal back if initscr() got that far
+        except curses.error: # it did not
+            pass
+        return Renderer()
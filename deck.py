@@ -1,10 +1,29 @@
 import typing
-import random # for shuffling
-from card import Card
+import random # for shuffling, every deck has its own random.Random
+from card import Card, DRAW_FOUR
+
+def _full_deck() -> typing.List[Card]:
+    """Lists the 108 cards of a deck, in the order in which they used to be created"""
+    cards: typing.List[Card] = []
+    for colour in ['Red', 'Yellow', 'Blue', 'Green']:
+        for number in list(range(0, 10)) + list(range(1, 10)):
+            cards.append(Card(colour, number))
+        for actionCardType in ['Draw Two', 'Reverse', 'Skip']:
+            cards.append(Card(colour, actionCardType))
+            cards.append(Card(colour, actionCardType))
+    for _ in range(4):
+        for blackCardType in ['Draw Four', 'Wild']:
+            cards.append(Card('Black', blackCardType))
+    return cards
+
+FULL_DECK: typing.List[Card] = _full_deck() # template that every new deck is copied from
 
 class Deck:
-    def __init__(self):
+    def __init__(self, packs: int = 1, rng: random.Random = None):
         self.cardDeck: typing.List[Card] = [] # in this variable the entire deck will be stored
+        self.packs: int = packs # number of full 108 card decks shuffled together, more are needed for large tables
+        self.rng: random.Random = rng or random.Random() # a seeded rng makes every shuffle reproducible
+        self.redraws: int = 0 # calls of redraw, read by profiling.Profiler
         self.create() # calls the function that actually puts the cards in the variable cardDeck
 
     def __str__(self) -> str:
@@ -12,35 +31,25 @@ class Deck:
         return str(self.cardDeck)
 
     def create(self) -> bool:
-        """Generates all needed cards and appends these to self.cardDeck"""
-        for colour in ['Red', 'Yellow', 'Blue', 'Green']:
-            for number in list(range(0, 10)) + list(range(1, 10)):
-                self.cardDeck.append(Card(colour, number))
-            for actionCardType in ['Draw Two', 'Reverse', 'Skip']:
-                self.cardDeck.append(Card(colour, actionCardType))
-                self.cardDeck.append(Card(colour, actionCardType))
-        for _ in range(4):
-            for blackCardType in ['Draw Four', 'Wild']:
-                blackCard = Card('Black', blackCardType)
-                self.cardDeck.append(blackCard)
+        """Appends all cards of a full deck to self.cardDeck
+        (cards are interned, so this only copies references from FULL_DECK)"""
+        self.cardDeck += FULL_DECK * self.packs
         return True
 
     def recreate(self, pile: typing.List[Card]) -> None:
         """If deck is empty, takes all cards on pile and shuffles them
         :param pile of cards:"""
-        dirtyDeck: list = pile.copy()
-        for card in dirtyDeck:
-            if card.value == 'Wild' or card.value == 'Draw Four':
-                self.cardDeck.append(Card('Black', card.value))
+        for card in pile:
+            if card.valueCode >= DRAW_FOUR: # a colour may have been picked for it
+                self.cardDeck.append(card.undeclared())
             else:
                 self.cardDeck.append(card)
-        self.shuffle(10)
+        self.shuffle()
         return None
 
-    def shuffle(self, times: int) -> None:
-        """Shuffles the deck a specified amount of times"""
-        for _ in range(times):
-            random.shuffle(self.cardDeck)
+    def shuffle(self) -> None:
+        """Shuffles the deck, once is enough: a Fisher-Yates shuffle makes every order equally likely"""
+        self.rng.shuffle(self.cardDeck)
 
     def draw(self) -> Card:
         """Removes the last element of the deck and returns it"""
@@ -48,8 +57,11 @@ class Deck:
 
     def redraw(self, card: Card) -> Card:
         """Put a non-number card back in the deck somewhere randomly and return a new one"""
+        self.redraws += 1
         self.cardDeck.append(card)
-        self.shuffle(1) # shuffle just one time
+        # swapping a random card to the top is enough, the rest of the deck is shuffled already
+        idx: int = self.rng.randrange(len(self.cardDeck))
+        self.cardDeck[idx], self.cardDeck[-1] = self.cardDeck[-1], self.cardDeck[idx]
         return self.cardDeck.pop()
 
     def count_cards(self) -> int:
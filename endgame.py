@@ -0,0 +1,172 @@
+"""Endgame solver: expectimax over GameState, for the last few cards of a game.
+
+Every player picks the move that is best for themselves (max-n), and every card that a move makes
+somebody draw is a chance node: the cards in the deck are taken to be in random order, so each distinct card
+is drawn with a chance proportional to its number of copies. The rules come from GameState, so the
+last card has to be a number card and a Reverse between two players means playing again, as in
+Game.handle_action. Positions that are reached again (by another order of moves) are looked up in a
+transposition table, which forgets the positions that were used least recently when it is full.
+
+The solver plays on a state in which all hands are known. EndgameComputer deals the cards it cannot see
+in a few ways (like MCTSComputer does), solves each deal and plays the move that is best on average.
+Searches go one move deeper at a time, until every line ends the game (then the result is exact) or the
+budget runs out; positions at the search horizon are scored like the end of an MCTS rollout. A reshuffle of
+the pile during the search is not enumerated but done with the state's rng.
+"""
+import collections
+import typing
+from gamestate import GameState, PASS
+from mcts import MCTSComputer, score
+
+class BudgetExceeded(Exception):
+    """Raised when a position takes more nodes to solve than the solver is allowed to search"""
+
+class EndgameSolver:
+    """Expectimax with chance nodes for drawn cards and a size-bounded transposition table"""
+
+    def __init__(self, depth: int = 20, maxNodes: int = 1000, tableSize: int = 1 << 16):
+        self.depth: int = depth # moves searched ahead at most, after that the position is scored
+        self.maxNodes: int = maxNodes # moves applied per solve before giving up, 0 means no limit
+        self.tableSize: int = tableSize # positions kept in the transposition table
+        self.table: collections.OrderedDict = collections.OrderedDict() # key -> (depth searched, rewards per seat)
+        self.nodes: int = 0 # moves applied by the last solve, once for every series of drawn cards
+        self.hits: int = 0 # transposition table hits of the last solve
+        self.solvedDepth: int = 0 # moves searched ahead by the last solve
+        self.cutoff: bool = False # whether the current iteration scored a position that was not the end of the game
+
+    def solve(self, state: GameState) -> typing.Dict[int, typing.Tuple[float, ...]]:
+        """Evaluates every legal move of the current player by iterative deepening: one move deeper every time,
+        until the whole game is solved (no position was cut off), depth is reached or the budget runs out.
+        The table is kept between solves and the state is restored afterwards
+        :param state with all hands known: :return move -> expected reward per seat, from the deepest search:"""
+        self.nodes, self.hits, self.solvedDepth = 0, 0, 0
+        marks, deck = len(state.marks), state.deck
+        values: typing.Dict[int, typing.Tuple[float, ...]] = None
+        for depth in range(1, self.depth + 1):
+            self.cutoff = False
+            try:
+                values = {move: self.expect(state, move, depth - 1) for move in state.legal_moves()}
+            except BudgetExceeded:
+                while len(state.marks) > marks:
+                    state.undo()
+                state.deck = deck
+                if values is None: # not even one move deep
+                    raise
+                break
+            self.solvedDepth = depth
+            if not self.cutoff: # every line ended the game, deeper searches give the same values
+                break
+        return values
+
+    def best_move(self, state: GameState) -> int:
+        """Returns the legal move with the highest expected reward for the current player"""
+        seat: int = state.current
+        values: typing.Dict[int, typing.Tuple[float, ...]] = self.solve(state)
+        return max(values, key=lambda move: values[move][seat])
+
+    def value(self, state: GameState, depth: int) -> typing.Tuple[float, ...]:
+        """Expected rewards per seat when everybody plays their best from here :param state: :param moves left:"""
+        if state.is_done():
+            return tuple(score(state))
+        if depth <= 0:
+            self.cutoff = True
+            return tuple(score(state))
+        key: tuple = (bytes(state.counts), bytes(sorted(state.deck)), len(state.pile), bytes(state.placings),
+                      state.current, state.top, state.direction, state.bullyDraw, state.unoCalls)
+        stored: tuple = self.table.get(key)
+        if stored is not None and stored[0] >= depth:
+            self.table.move_to_end(key)
+            self.hits += 1
+            return stored[1]
+
+        seat: int = state.current
+        best: typing.Tuple[float, ...] = None
+        for move in state.legal_moves():
+            rewards: typing.Tuple[float, ...] = self.expect(state, move, depth - 1)
+            if best is None or rewards[seat] > best[seat]:
+                best = rewards
+
+        self.table[key] = (depth, best)
+        self.table.move_to_end(key)
+        if len(self.table) > self.tableSize:
+            self.table.popitem(last=False) # the least recently used position
+        return best
+
+    def expect(self, state: GameState, move: int, depth: int) -> typing.Tuple[float, ...]:
+        """Expected rewards per seat after a move, averaged over the cards it makes anybody draw"""
+        total: typing.List[float] = [0.0] * (state.numPlayers + 1)
+        for chance in self.outcomes(state, move):
+            for seat, reward in enumerate(self.value(state, depth)):
+                total[seat] += chance * reward
+        return tuple(total)
+
+    def outcomes(self, state: GameState, move: int) -> typing.Iterator[float]:
+        """Applies a move once for every different series of cards it can make players draw, and yields the
+        chance of each series while the state is in that position; the state is restored afterwards
+        :param state: :param move: :return generator of chances, which add up to 1:"""
+        deck: typing.List[int] = state.deck
+        counts: typing.Dict[int, int] = collections.Counter(deck)
+        stack: typing.List[typing.Tuple[typing.List[int], float]] = [([], 1.0)] # (cards drawn first, last one first; chance)
+        while stack:
+            drawn, chance = stack.pop()
+            for card in drawn:
+                counts[card] -= 1
+            arranged: typing.List[int] = [card for card, count in counts.items() for _ in range(count)] + drawn
+            for card in drawn:
+                counts[card] += 1
+            state.deck = arranged
+            reshuffles: int = len(state.reshuffles)
+            self.nodes += 1
+            if self.maxNodes and self.nodes > self.maxNodes:
+                raise BudgetExceeded(f'more than {self.maxNodes} positions')
+            state.apply(move)
+            needed: int = len(deck) - len(state.deck) if len(state.reshuffles) == reshuffles else 0
+            if needed <= len(drawn): # every card that was drawn is one of the series, or a reshuffle was sampled
+                yield chance
+                state.undo()
+            else: # one more card is drawn, each card that is left in the deck is a branch
+                state.undo()
+                left: int = len(deck) - len(drawn)
+                for card, count in counts.items():
+                    count -= drawn.count(card)
+                    if count > 0:
+                        stack.append(([card] + drawn, chance * count / left))
+            state.deck = deck
+        return
+
+
+class EndgameComputer(MCTSComputer):
+    """MCTSComputer that switches to the endgame solver when every hand in the game is small"""
+
+    def __init__(self, id: int, endgameCards: int = 3, deals: int = 4, solver: EndgameSolver = None, **kwargs):
+        super().__init__(id, **kwargs)
+        self.endgameCards: int = endgameCards # solves when no player holds more cards than this, 0 never solves
+        self.deals: int = deals # ways of dealing the unseen cards that are solved for one decision
+        self.solver: EndgameSolver = solver or EndgameSolver(maxNodes=400) # about 10 ms per deal
+        self.lastSolved: bool = False # whether the last decision was made by the solver, for tests and benchmarks
+
+    def search(self, root: GameState) -> int:
+        """Solves the position when all hands are small enough (and the solver stays within its budget),
+        otherwise searches like MCTSComputer :return move:"""
+        self.lastSolved = False
+        legal: typing.List[int] = root.legal_moves()
+        if len(legal) == 1 or max(root.sizes) > self.endgameCards:
+            return super().search(root)
+        totals: typing.Dict[int, float] = dict.fromkeys(legal, 0.0)
+        try:
+            for _ in range(self.deals):
+                for move, rewards in self.solver.solve(self.determinize(root, self.searchRng)).items():
+                    totals[move] += rewards[self.id]
+        except BudgetExceeded:
+            return super().search(root)
+        self.lastSolved = True
+        self.lastIterations = 0
+        return max(totals, key=totals.get)
+
+    async def search_async(self, root: GameState) -> int:
+        """search for games on an event loop: the solver is not sliced (its budget keeps it short),
+        a search that is not solved is awaited like MCTSComputer's :return move:"""
+        if len(root.legal_moves()) > 1 and max(root.sizes) <= self.endgameCards:
+            return self.search(root)
+        self.lastSolved = False
+        return await super().search_async(root)
@@ -0,0 +1,142 @@
+import typing
+from card import Card
+
+class Event:
+    """Parent class of everything that can happen during a game"""
+    __slots__ = ('playerId',)
+
+    def __init__(self, playerId: int):
+        self.playerId: int = playerId # the player it happened to, 0 when it concerns the whole game
+
+    def __repr__(self) -> str:
+        """Converts the object to a String representation"""
+        fields: str = ', '.join(f'{name}={getattr(self, name)!r}' for cls in type(self).__mro__
+                                for name in getattr(cls, '__slots__', ()))
+        return f'{type(self).__name__}({fields})'
+
+class AlreadyDone(Event):
+    """A finished player's turn came up and was passed over"""
+    __slots__ = ()
+
+class CardPlayed(Event):
+    """A card was played, before its effect (and before a colour is picked for a black card)"""
+    __slots__ = ('card',)
+
+    def __init__(self, playerId: int, card: Card):
+        super().__init__(playerId)
+        self.card: Card = card
+
+class ColourPicked(Event):
+    """A colour was picked for a Wild or a Draw Four"""
+    __slots__ = ('colour',)
+
+    def __init__(self, playerId: int, colour: str):
+        super().__init__(playerId)
+        self.colour: str = colour
+
+class CardsDrawn(Event):
+    """A player took cards from the deck during play (dealing is not an event)"""
+    __slots__ = ('count', 'reason')
+
+    def __init__(self, playerId: int, count: int, reason: str):
+        super().__init__(playerId)
+        self.count: int = count # can be less than asked for, when the deck and the pile ran out
+        self.reason: str = reason # 'stuck' (no valid move), 'bully', 'uno' (forgot to call it), 'wrongcall' or 'timeout'
+
+class Passed(Event):
+    """A player passed instead of playing a card"""
+    __slots__ = ()
+
+class Skipped(Event):
+    """A player was skipped by a Skip card"""
+    __slots__ = ()
+
+class Reversed(Event):
+    """A Reverse card changed the direction of play"""
+    __slots__ = ('direction',)
+
+    def __init__(self, playerId: int, direction: int):
+        super().__init__(playerId)
+        self.direction: int = direction # the new direction, 1 or -1
+
+class TurnStarted(Event):
+    """A player's turn starts, after everything of the turn before happened (players that are done have no turns)"""
+    __slots__ = ()
+
+class UnoCalled(Event):
+    """A player called Uno, correctly or not"""
+    __slots__ = ('correct',)
+
+    def __init__(self, playerId: int, correct: bool):
+        super().__init__(playerId)
+        self.correct: bool = correct
+
+class TimedOut(Event):
+    """A player did not decide before the turn's deadline, and the game's fallback was used (see AsyncGame)"""
+    __slots__ = ('fallback',)
+
+    def __init__(self, playerId: int, fallback: str):
+        super().__init__(playerId)
+        self.fallback: str = fallback # 'pass', 'draw' (a card, then pass) or 'computer' (played like Computer)
+
+class PlayerFinished(Event):
+    """A player emptied their hand"""
+    __slots__ = ('place',)
+
+    def __init__(self, playerId: int, place: int):
+        super().__init__(playerId)
+        self.place: int = place # 1 for the first player to finish
+
+class Reshuffled(Event):
+    """The discard pile (minus its top card) was shuffled into a new deck"""
+    __slots__ = ('cards',)
+
+    def __init__(self, cards: int):
+        super().__init__(0)
+        self.cards: int = cards # size of the new deck
+
+class GameEnded(Event):
+    """The game is over, or was cut off by its turn limit"""
+    __slots__ = ('result',)
+
+    def __init__(self, result: 'Result'):
+        super().__init__(0)
+        self.result: 'Result' = result
+
+EVENT_TYPES: typing.Tuple[type, ...] = (AlreadyDone, TurnStarted, CardPlayed, ColourPicked, CardsDrawn, Passed,
+                                        Skipped, Reversed, UnoCalled, TimedOut, PlayerFinished, Reshuffled, GameEnded)
+
+class EventBus:
+    """Passes game events on to subscribers. Only event types that somebody subscribed to are in self.handlers,
+    so the game checks `EventType in bus.handlers` before it even creates an event: with nobody
+    listening an event costs a single dict lookup"""
+
+    def __init__(self):
+        self.handlers: typing.Dict[type, typing.List[typing.Callable]] = {} # event type -> subscribers, in order
+
+    def subscribe(self, handler: typing.Callable, eventTypes: typing.Iterable[type] = None) -> None:
+        """Calls a handler with every event of the given types :param callable that takes one event:
+        :param event types, all of them by default:"""
+        for eventType in (EVENT_TYPES if eventTypes is None else eventTypes):
+            self.handlers.setdefault(eventType, []).append(handler)
+        return
+
+    def unsubscribe(self, handler: typing.Callable) -> None:
+        """Stops calling a handler, event types without subscribers are dropped altogether"""
+        for eventType in list(self.handlers):
+            handlers: typing.List[typing.Callable] = [other for other in self.handlers[eventType] if other != handler]
+            if handlers:
+                self.handlers[eventType] = handlers
+            else:
+                del self.handlers[eventType]
+        return
+
+    def wants(self, eventType: type) -> bool:
+        """Checks if anybody listens to a type of event"""
+        return eventType in self.handlers
+
+    def emit(self, event: Event) -> None:
+        """Calls every subscriber of the event's type"""
+        for handler in self.handlers.get(type(event), ()):
+            handler(event)
+        return
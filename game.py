@@ -1,22 +1,45 @@
+import random
 import typing
-import numpy as np
-from card import Card
+from card import Card, BULLY_RESPONSES
 from deck import Deck
 from player import Player
 from player import Human
 from player import Computer
 from player import Winner
-from bigvalue import Bigvalue
+from result import Result
+from renderer import Renderer, TerminalLog
+from events import EventBus, AlreadyDone, CardPlayed, ColourPicked, CardsDrawn, Passed, Skipped, Reversed
+from events import PlayerFinished, Reshuffled, GameEnded, TurnStarted
 
 class Game:
-    def __init__(self):
-        self.deck = Deck() # this line generates a deck
+    def __init__(self, headless: bool = False, seed: int = None):
+        self.headless: bool = headless # when True, nothing is printed and nothing is asked
+        self.renderer: Renderer = None if headless else Renderer() # builds the screens, with cached top cards
+        if seed is None: # every game gets a seed of its own, so its result can always be replayed
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed: int = seed # the same seed (and the same moves by humans) replays the same game
+        self.rng: random.Random = random.Random(seed) # the only source of randomness, shared by deck and computers
+        self.deck = Deck(rng=self.rng) # this line generates a deck
+        self.events: EventBus = EventBus() # everything that happens is emitted here, see events.py
+        self.terminalLog: TerminalLog = None if headless else TerminalLog() # the terminal is just one of the subscribers
+        if self.terminalLog:
+            self.events.subscribe(self.terminalLog)
         self.players: typing.List[Player] = [] # a list that contains all of the player instances
         self.pile: typing.List[Card] = [] # discard pile, all played cards get appended to this
         self.direction: int = 1 # for keeping track of the turn direction
         self.currentCard: Card = () # card on top of discard pile, card that needs to be reacted to
         self.bullyDraw: int = 0 # for keeping track of +2's and +4's
         self.winners: int = 0 # keeps track of all players that are finished
+        # ring of active seats: the seats left and right of every seat, indexed by player id (index 0 is unused)
+        # finished players are unlinked, but keep their own links so the ring can still be walked from their seat
+        self.nextSeat: typing.List[int] = [0]
+        self.prevSeat: typing.List[int] = [0]
+        self.humanPlayers: int = 0 # number of (unfinished) Human instances in self.players
+        self.computerPlayers: int = 0 # number of (unfinished) Computer instances in self.players
+        self.placings: typing.List[int] = [] # player ids in the order in which they finished
+        self.cardsDrawn: typing.List[int] = [] # cards drawn during play per player, index is player id - 1
+        self.turns: int = 0 # number of turns played so far
+        self.maxTurns: int = 0 # stops run after this many turns, 0 means no limit
 
     def __call__(self) -> None:
         """Starts the game when called"""
@@ -28,39 +51,84 @@ class Game:
         Initializes the game
         ---
         1. Create player instances
-        2. Shuffle deck ten times
+        2. Shuffle deck
         3. Deal cards to the players
         4. Draw starting card to discard pile
         5. Call function that actually run the game
         """
-        self.create_players()
-        self.deck.shuffle(10)
+        self.setup()
+        self.run()
+        return
+
+    def setup(self, playerCount: tuple = None, players: typing.List[Player] = None) -> None:
+        """Creates the players, shuffles, deals and draws the starting card (steps 1 to 4 of start)
+        :param tuple(total no. players, no. human players): :param or a list of ready-made players:"""
+        if players is not None:
+            self.seat_players(players)
+        else:
+            self.create_players(playerCount)
+        self.deck.shuffle()
         self.deal()
         card: Card = self.deck.draw()
         while not isinstance(card.value, int):
             card = self.deck.redraw(card)
         self.put_on_pile(card)
-        self.run()
         return
+
+    def simulate(self, numPlayers: int = 4, maxTurns: int = 10000, strategies: typing.List[type] = None) -> Result:
+        """Plays a complete game between computer players without any terminal I/O
+        :param no. players, any number from 2 upwards: :param turn limit, protects against games where nobody can finish:
+        :param optionally a Player subclass per seat, which overrides the number of players (default all Computer):
+        :return result of the game:"""
+        if strategies is not None:
+            numPlayers = len(strategies)
+        if numPlayers < 2:
+            raise ValueError('a game needs at least two players')
+        self.headless = True
+        if self.terminalLog:
+            self.events.unsubscribe(self.terminalLog)
+            self.terminalLog = None
+        self.maxTurns = maxTurns
+        if strategies is not None:
+            self.setup(players=[strategy(id = seat) for seat, strategy in enumerate(strategies, start=1)])
+        else:
+            self.setup((numPlayers, 0))
+        self.run()
+        return self.result()
+
+    def result(self) -> Result:
+        """Sums up the game so far, the players that did not finish are placed last in seat order :return result:"""
+        completed: bool = self.number_of_players() - self.winners <= 1
+        losers: typing.List[int] = [player.id for player in self.players if not isinstance(player, Winner)]
+        return Result(self.placings + losers, self.turns, self.cardsDrawn.copy(), completed, self.seed, len(self.placings))
     
     def run(self) -> None:
         """Very large and potentially confusing method that kind of handles everything:
         the main body of class Game that actually runs a Uno game"""
         currentPlayerId: int = 1 # player 1 starts
-        while not self.is_done():
+        headless: bool = self.headless
+        handlers: dict = self.events.handlers # event type -> subscribers, an event is only created if it is in here
+        lastPlayer: Player = None # the player who moved last, the only one who can have finished since
+        while not self.is_done(lastPlayer):
+            if self.maxTurns and self.turns >= self.maxTurns: # only set for simulations
+                break
             
             nextPlayerId = currentPlayerId
             currentPlayer = self.players[currentPlayerId-1] # get current player by their id
+            lastPlayer = currentPlayer
 
             if isinstance(currentPlayer, Winner): # checking if current player is still active
-                print('-' * 64 + f'player {currentPlayerId} is already done')
+                if AlreadyDone in handlers:
+                    self.events.emit(AlreadyDone(currentPlayerId))
                 currentPlayerId = self.next_player_id(currentPlayerId)
                 currentPlayer = self.players[currentPlayerId-1]
                 continue
+            self.turns += 1
+            if TurnStarted in handlers:
+                self.events.emit(TurnStarted(currentPlayerId))
             
             if len(currentPlayer.hand) == 1 and not currentPlayer.calledUno: # checking for forgotten Uno Calls
-                print('-' * 64 + f'player {currentPlayerId} did not call uno and has to draw 3 cards')
-                currentPlayer.draw(self.draw(3))
+                self.give(currentPlayer, 3, 'uno')
             currentPlayer.calledUno = False
                    
             if self.bullyDraw != 0: # checking for "active" bullying
@@ -71,33 +139,41 @@ class Game:
                     continue
             
             # "normal" behavior starts here
-            self.display_options(currentPlayer)
+            if not headless:
+                self.display_options(currentPlayer)
             if not currentPlayer.has_valid_move(self.currentCard):
                 if isinstance(currentPlayer, Human):
-                    _ = input(f'You (player {currentPlayer.id}) currently have no valid moves, press Enter to draw a card: ')
-                print('-' * 64 + f'player {currentPlayerId} could not play')                
-                currentPlayer.draw(self.draw())
-                self.display_options(currentPlayer)
+                    _ = self.prompt(f'You (player {currentPlayer.id}) currently have no valid moves, press Enter to draw a card: ')
+                self.give(currentPlayer, 1, 'stuck')
+                if not headless:
+                    self.display_options(currentPlayer)
             # for the next turn, current player id is set to next player id, which is returned by handle_action
             currentPlayerId = self.handle_action(currentPlayer.choose_move(self.currentCard), currentPlayer)
+        if GameEnded in handlers:
+            self.events.emit(GameEnded(self.result()))
         return
 
-    def handle_action(self, action: typing.Union[Card, str], currentPlayer: Player) -> int:
+    def handle_action(self, action: typing.Union[Card, str], currentPlayer: Player, colour: str = None) -> int:
         """Handles all possible choices a player could make, including passing and calling Uno incorrectly
-        :param card: :param current player: :return next player id:"""
+        :param card: :param current player: :param colour chosen along with a black card, when it is not given
+        the player's pick_colour is asked: :return next player id:"""
         currentPlayerId = currentPlayer.id
+        handlers: dict = self.events.handlers
         
         if action == 'pass': # player passed
-            print('-' * 64 + f'player {currentPlayerId} passed')
+            if Passed in handlers:
+                self.events.emit(Passed(currentPlayerId))
             return self.next_player_id(currentPlayerId)
         elif action == 'wrongcall': # player did an incorrect uno call
-            currentPlayer.draw(self.draw(3))
+            self.give(currentPlayer, 3, 'wrongcall')
             return currentPlayerId
-        else: # player played an actual card
-            print('-' * 64 + f'player {currentPlayerId} played {action}')
+        elif CardPlayed in handlers: # player played an actual card
+            self.events.emit(CardPlayed(currentPlayerId, action))
 
         card = action
         value = card.value
+        chosenColour: str = colour
+        colour = None # only picked for black cards
 
         try:
             int(value)
@@ -106,38 +182,41 @@ class Game:
                 self.bullyDraw += 2
             elif value == 'Draw Four':
                 self.bullyDraw += 4
-                card.colour = self.players[currentPlayerId-1].pick_colour()
+                colour = chosenColour or self.players[currentPlayerId-1].pick_colour()
+                if ColourPicked in handlers:
+                    self.events.emit(ColourPicked(currentPlayerId, colour))
 
             elif value == 'Skip':
                 currentPlayerId = self.next_player_id(currentPlayerId) # skip the active player
-                print('-' * 64 + f'player {currentPlayerId} was skipped')
+                if Skipped in handlers:
+                    self.events.emit(Skipped(currentPlayerId))
             
             elif value == 'Reverse' and self.number_of_players() >= 3:
                 self.direction *= -1
+                if Reversed in handlers:
+                    self.events.emit(Reversed(currentPlayerId, self.direction))
             elif value == 'Reverse' and self.number_of_players() == 2: # special behavior!
                 self.put_on_pile(card) # immediately put the card on pile
                 return currentPlayerId # and return the player's own id
 
             elif value == 'Wild':
-                card.colour = self.players[currentPlayerId-1].pick_colour()
+                colour = chosenColour or self.players[currentPlayerId-1].pick_colour()
+                if ColourPicked in handlers:
+                    self.events.emit(ColourPicked(currentPlayerId, colour))
         
-        self.put_on_pile(card)
+        self.put_on_pile(card, colour)
         return self.next_player_id(currentPlayerId)
 
     def handle_bully_response(self, currentPlayer: Player) -> int:
         """Handles a player's response to being bullied with +2 or +4
         :param current player: :return 0 [falsy] or next player's id [truthy]:"""
         currentPlayerId = currentPlayer.id
-        col, val = self.currentCard.colour, self.currentCard.value
-        aDrawTwo: Card = Card('*', 'Draw Two')
-        aDrawFour: Card = Card('Black', 'Draw Four')
 
-        if (    val == 'Draw Two' and \
-                (currentPlayer.has_card(aDrawTwo) or currentPlayer.has_card(aDrawFour))) or (
-                val == 'Draw Four' and \
-                (currentPlayer.has_card(aDrawFour) or currentPlayer.has_card(Card(col, 'Draw Two')))):
+        # any +2 or +4 answers a +2, a +4 can only be answered by another +4 or a +2 of the picked colour
+        if currentPlayer.has_any(BULLY_RESPONSES[self.currentCard.id]):
 
-            self.display_options(currentPlayer)
+            if not self.headless:
+                self.display_options(currentPlayer)
             chosenMove = currentPlayer.choose_move(self.currentCard)
             if isinstance(chosenMove, Card): # they could technically choose to not play their own +2 or +4
                 if chosenMove.value != 'Draw Two' and chosenMove.value != 'Draw Four':
@@ -151,8 +230,7 @@ class Game:
     def draw_bully(self, currentPlayer: Player) -> None:
         """Makes a player draw the total number of cards that they have been bullied with
         :param current player:"""
-        currentPlayer.draw(self.draw(self.bullyDraw))
-        print('-' * 64 + f'player {currentPlayer.id} had to draw {self.bullyDraw} cards')
+        self.give(currentPlayer, self.bullyDraw, 'bully')
         self.bullyDraw = 0
         return
 
@@ -162,25 +240,25 @@ class Game:
         validInput = False
         while not validInput:
             try:
-                numPlayers = int(input("How many players?:\n>"))
+                numPlayers = int(self.prompt("How many players?:\n>"))
                 while numPlayers < 2 or numPlayers > 10:
-                    numPlayers = int(input("Invalid. Please enter a number between 2-10. How many players?:\n>"))
+                    numPlayers = int(self.prompt("Invalid. Please enter a number between 2-10. How many players?:\n>"))
                 validInput = True
             except ValueError:
-                print("Please use a numerical value")
+                self.say("Please use a numerical value")
                 continue
         validInput = False
         while not validInput:
             try:
-                numHumanPlayers = int(input("How many human players?:\n>"))
+                numHumanPlayers = int(self.prompt("How many human players?:\n>"))
                 while numHumanPlayers < 0 or numHumanPlayers > numPlayers:
-                    numHumanPlayers = int(input(
+                    numHumanPlayers = int(self.prompt(
                         "Invalid. Please enter a number between zero and total number of players. How many human players?:\n>"))
                 validInput = True
             except ValueError:
-                print("Please use a numerical value")
+                self.say("Please use a numerical value")
                 continue
-        print('\n' * 20)
+        self.say('\n' * 20)
         return (numPlayers, numHumanPlayers)
 
     def create_players(self, playerCount: tuple = None) -> None:
@@ -191,10 +269,43 @@ class Game:
             numHumanPlayers = playerCount[1]
         else:
             numPlayers, numHumanPlayers = self.how_many_players()
+        players: typing.List[Player] = []
         for i in range(1, numHumanPlayers+1):
-            self.players.append(Human(id = i))
+            players.append(Human(id = i))
         for i in range(numHumanPlayers+1, numPlayers+1):
-            self.players.append(Computer(id = i))
+            players.append(Computer(id = i))
+        self.seat_players(players)
+        return
+
+    def seat_players(self, players: typing.List[Player]) -> None:
+        """Appends ready-made player instances (of any Player subclass) to self.players,
+        their ids have to match their seats :param list of players:"""
+        if self.headless and any(isinstance(player, Human) for player in players):
+            raise ValueError('a headless game can only be played by computer players')
+        self.players += players
+        for player in self.players:
+            player.join(self)
+        self.cardsDrawn = [0] * len(self.players)
+        self.humanPlayers = len([player for player in self.players if isinstance(player, Human)])
+        self.computerPlayers = len([player for player in self.players if isinstance(player, Computer)])
+        self.link_seats()
+        packsNeeded: int = 1 + (len(self.players) - 1) // 10 # one deck of 108 cards comfortably serves ten players
+        if packsNeeded > self.deck.packs:
+            self.deck = Deck(packsNeeded, self.rng)
+        return
+
+    def link_seats(self) -> None:
+        """(Re)builds the ring of active seats from self.players, in seat order"""
+        numPlayers: int = len(self.players)
+        self.nextSeat = [0] + list(range(2, numPlayers+1)) + [1]
+        self.prevSeat = [0, numPlayers] + list(range(1, numPlayers))
+        return
+
+    def unlink_seat(self, seat: int) -> None:
+        """Takes a finished player's seat out of the ring, in constant time :param seat:"""
+        left, right = self.prevSeat[seat], self.nextSeat[seat]
+        self.nextSeat[left] = right
+        self.prevSeat[right] = left
         return
 
     def deal(self) -> None:
@@ -203,11 +314,12 @@ class Game:
             player.receive_hand(self.draw(7))
         return
 
-    def put_on_pile(self, card: Card) -> None:
-        """Adds a given card to the pile :param card:"""
+    def put_on_pile(self, card: Card, colour: str = None) -> None:
+        """Adds a given card to the pile, the card itself is never changed:
+        a picked colour only ends up in self.currentCard :param card: :param picked colour:"""
         if card:
             self.pile.append(card)
-            self.currentCard = card
+            self.currentCard = card.declare(colour) if colour else card
         return
 
     def top_of_pile(self) -> Card:
@@ -220,11 +332,26 @@ class Game:
         cards: typing.List[Card] = []
         for _ in range(times):
             if self.deck.is_empty():
+                if len(self.pile) <= 1: # all other cards are in the players' hands
+                    break
+                topCard: Card = self.top_of_pile() # stays on the pile, so it is not put back into the deck
                 self.deck.recreate(self.pile)
-                self.pile = [self.top_of_pile()]
+                self.pile = [topCard]
+                if Reshuffled in self.events.handlers:
+                    self.events.emit(Reshuffled(self.deck.count_cards()))
             cards.append(self.deck.draw())
         return cards
 
+    def give(self, player: Player, times: int, reason: str = 'stuck') -> None:
+        """Draws cards from the deck into a player's hand and keeps count of them
+        :param player: :param no. cards: :param why they have to draw, passed on with the CardsDrawn event:"""
+        cards: typing.List[Card] = self.draw(times)
+        player.draw(cards)
+        self.cardsDrawn[player.id-1] += len(cards)
+        if CardsDrawn in self.events.handlers:
+            self.events.emit(CardsDrawn(player.id, len(cards), reason))
+        return
+
     def walk(self, currentPlayerId: int) -> int:
         """Determines what player is next to move
         :param current id: :return next id:"""
@@ -234,117 +361,69 @@ class Game:
         return next
     
     def next_player_id(self, currentPlayerId: int) -> int:
-        """Determines what player is next to move
+        """Determines what player is next to move, using the ring of active seats
         :param current id: :return next id:"""
-        next = self.walk(currentPlayerId)
-        while isinstance(self.players[next-1], Winner):
-            next = self.walk(next)
+        seats: typing.List[int] = self.nextSeat if self.direction == 1 else self.prevSeat
+        next = seats[currentPlayerId]
+        while isinstance(self.players[next-1], Winner): # only when walking from a seat that has been unlinked
+            next = seats[next]
         return next
         
-    def is_done(self) -> bool:
-        """Checks for winners until only one loser is left
-        :return answer to question posed in method name:"""
-        for player in self.players:
-            playerId = player.id
+    def is_done(self, lastPlayer: Player = None) -> bool:
+        """Checks for winners until only one loser is left, when the player who moved last is given
+        only they are checked (nobody else can have emptied their hand), otherwise everybody is
+        :param player who moved last: :return answer to question posed in method name:"""
+        for player in (self.players if lastPlayer is None else (lastPlayer,)):
             if not isinstance(player, Winner) and len(player.hand) == 0: # check for new winners
-                self.winners += 1
-                print('\n|-_-_-_-_-_-_-_-_-_-_-_-|'+
-                f'\n |Player {playerId} is number {self.winners}!|'+
-                '\n|-_-_-_-_-_-_-_-_-_-_-_-|\n')
-                # player's place in game's self.playerslist is overwritten by winner object
-                self.players[playerId-1] = Winner(playerId)
-            if self.number_of_players() - self.winners <= 1: # game is done, only one loser left
-                return True
-        return False
+                self.finish(player)
+        return self.number_of_players() - self.winners <= 1 # game is done, only one loser left
+
+    def finish(self, player: Player) -> None:
+        """Registers a player that has emptied their hand :param player:"""
+        playerId = player.id
+        self.winners += 1
+        self.placings.append(playerId)
+        if PlayerFinished in self.events.handlers:
+            self.events.emit(PlayerFinished(playerId, self.winners))
+        if isinstance(player, Human):
+            self.humanPlayers -= 1
+        elif isinstance(player, Computer):
+            self.computerPlayers -= 1
+        # player's place in game's self.playerslist is overwritten by winner object
+        self.players[playerId-1] = Winner(playerId)
+        self.unlink_seat(playerId)
+        return
 
 
     def display_options(self, currentPlayer: Player) -> None:
         """Displays the card a player need to react to, as well as
         all of the player's options, including Pass & Call Uno"""
-        print('\n' * 17)
-        
-        for player in self.players:
-            if player.calledUno:
-                print('-' * 64 + f'player {player.id} called Uno!\n')
-
-        self.display_top_card()
-        print(f'---player {currentPlayer.id}\'s turn---')
-        if isinstance(currentPlayer, Human) and self.number_of_human_players() >= 2:
-            # so the previous human player can't see the current player's cards after they chose their move
-            _ = input('Press Enter to view your options: ')
-
-        cardsDisplayed: int = 0 # for making multiple lines work
-        shortHand: list = self.to_short_hand(currentPlayer.hand)
-        rowsNeeded: int = 1 + len(currentPlayer.hand) // 15 # only 14 cards fit in one row
-        shortHandDivided: list[np.array] = np.array_split(shortHand, rowsNeeded)
-        for row in range(1, rowsNeeded+1):
-            self.display_hand(shortHandDivided[row-1], cardsDisplayed)
-            cardsDisplayed += len(shortHandDivided[row-1])
-        print('Other options:\n' +
-              f'{len(shortHand)+1} - Pass\n' +
-              f'{len(shortHand)+2} - Call Uno\n')
+        renderer: Renderer = self.renderer or Renderer()
+        # so the previous human player can't see the current player's cards after they chose their move
+        private: bool = isinstance(currentPlayer, Human) and self.number_of_human_players() >= 2
+        renderer.show_turn(self.currentCard, currentPlayer.id, currentPlayer.hand,
+                           [player.id for player in self.players if player.calledUno], private)
+        return
+
+    def prompt(self, prompt: str) -> str:
+        """Asks for a line of input, through the renderer (which may be drawing the whole screen)"""
+        return (self.renderer or Renderer()).ask(prompt)
+
+    def say(self, text: str) -> None:
+        """Shows a message, through the renderer"""
+        (self.renderer or Renderer()).say(text)
         return
 
     def display_hand(self, shortHand: typing.List[tuple], cardsDisplayed: int) -> None:
         """Displays a player's hand, and if needed it does so on multiple rows"""
-        space: str = ' ' # needed to make faststrings work since f'{' ' * n}' is illegal
-        horizontalBound: str = ('+' + '-' * 5 + '+ ') * len(shortHand)
-        line1, line2, line3, optionLine = '', '', '', ''
-        for idx, card in enumerate(shortHand):
-            line1 += f'| {card[0]} | ' # prints the short colour
-            line2 += f'|     | '
-            line3 += f'| {card[1]} | ' # prints the short value
-            optionNumber: str = f'{cardsDisplayed + idx+1}' # gets the correct option nr. for every card
-            optionLine += f'   {optionNumber} {space * (3 - len(optionNumber))} '
-        
-        print(horizontalBound + '\n' +
-              line1 + '\n' +
-              line2 + '\n' +
-              line3 + '\n' +
-              horizontalBound + '\n' +
-              optionLine + '\n')
+        renderer: Renderer = self.renderer or Renderer()
+        renderer.write(renderer.hand(shortHand, cardsDisplayed))
         return
 
     def display_top_card(self) -> None:
-        """Displays a single card with size 34 by 21 (ASCII characters)"""
-        colourDict: dict = {'Black': '#',
-                            'Blue': '\033[0;34m' + 'B' + '\033[0m',
-                            'Red': '\033[0;31m' + 'R' + '\033[0m',
-                            'Yellow': '\033[0;33m' + 'Y' + '\033[0m',
-                            'Green': '\033[0;32m' + 'G' + '\033[0m'}
-        smallValueDict: dict = {'Reverse': '<', 'Skip': '>', 'Draw Four': '+', 'Draw Two': '+', 'Wild': 'W'}
-        bigValueGetter: dict = Bigvalue()
-
-        try:
-            char: str = colourDict[self.currentCard.colour]
-            val: str = self.currentCard.value if isinstance(self.currentCard.value, int) \
-                       else smallValueDict[self.currentCard.value]
-            bigValue: list[str] = bigValueGetter(self.currentCard.value)
-        except KeyError:
-            return
-
-        line1: str = '|' + char * 15 + ' ' * 6 + char * 11 + '|'
-        line2: str = '|' + char * 11 + ' ' * 13 + char * 8 + '|'
-        line3: str = '|' + char * 9 + ' ' * 16 + char * 7 + '|'
-        line4: str = '|' + char * 7 + ' ' * 18 + char * 7 + '|'
-        line5: str = '|' + char * 6 + bigValue[0] + char * 6 + '|'
-        line6: str = '|' + char * 6 + bigValue[1] + char * 6 + '|'
-        line7: str = '|' + char * 6 + bigValue[2] + char * 6 + '|'
-        line8: str = '|' + char * 6 + ' ' * 20 + char * 6 + '|'
-        line9: str = '|' + char * 7 + ' ' * 18 + char * 7 + '|'
-        line10: str = '|' + char * 7 + ' ' * 16 + char * 9 + '|'
-        line11: str = '|' + char * 8 + ' ' * 13 + char * 11 + '|'
-        line12: str = '|' + char * 11 + ' ' * 6 + char * 15 + '|'
-
-        topLine: str = '  ' + '_' * 30 + '\n' + f' /{val}|' + char * 26 + f'|{val}\\'
-        almostFullLine: str = '|--' + char * 28 + '--|'
-        fullLine: str = '|' + char * 32 + '|'
-        bottomLine: str = f' \\{val}|' + char * 26 + f'|{val}/'
-
-        for line in [topLine, almostFullLine, fullLine, fullLine,
-                    line1, line2, line3, line4, line5, line6, line7, line8, line9, line10, line11, line12,
-                    fullLine, fullLine, almostFullLine, bottomLine + '\n']:
-            print(line)
+        """Displays a single card with size 34 by 21 (ASCII characters), from the renderer's cache"""
+        renderer: Renderer = self.renderer or Renderer()
+        renderer.write(renderer.top_card(self.currentCard))
         return
 
     def to_short_hand(self, longHand: typing.List[Card]) -> typing.List[tuple]:
@@ -419,8 +498,8 @@ class Game:
 
     def number_of_human_players(self) -> int:
         """Returns number of human players in the game"""
-        return len([player for player in self.players if isinstance(player, Human)])
+        return self.humanPlayers
     
     def number_of_computer_players(self) -> int:
-        """Returns number of human players in the game"""
-        return len([player for player in self.players if isinstance(player, Computer)])
+        """Returns number of computer players in the game"""
+        return self.computerPlayers
@@ -0,0 +1,167 @@
+"""Compact binary log of games, for archiving every game and scanning them afterwards.
+
+A log file is a 16 byte header followed by fixed width records (little-endian, no padding):
+
+    gameId  uint32   number of the game, given by whoever records it
+    turn    uint32   Game.turns when it happened
+    seat    uint16   player id, 0 when it concerns the whole game
+    action  uint8    one of the action codes below
+    card    uint8    card id (see card.py), NO_CARD when no card is involved
+    count   uint16   number of cards drawn, or what the action table below says
+
+Writing needs nothing but the standard library. Reading maps the file into memory as a numpy
+structured array, so numpy is only imported by read_log (and the rest of the game never needs it).
+"""
+import os
+import struct
+import typing
+from card import COLOUR_CODES
+from events import CardPlayed, ColourPicked, CardsDrawn, Passed, Skipped, Reversed, UnoCalled
+from events import PlayerFinished, Reshuffled, GameEnded
+
+MAGIC: bytes = b'UNOLOG\x00\x01' # file type and format version
+HEADER: bytes = MAGIC + bytes(8) # padded to 16 bytes, room for later versions
+RECORD: struct.Struct = struct.Struct('<IIHBBH')
+FIELDS: typing.List[tuple] = [('gameId', '<u4'), ('turn', '<u4'), ('seat', '<u2'),
+                              ('action', 'u1'), ('card', 'u1'), ('count', '<u2')] # numpy version of RECORD
+NO_CARD: int = 255
+
+# action codes, with what ends up in count when it is not a number of drawn cards
+PLAYED: int = 1 # count is 0
+COLOUR_PICKED: int = 2 # count is the colour code (0 Red, 1 Yellow, 2 Blue, 3 Green)
+DRAWN_STUCK: int = 3 # no valid move
+DRAWN_BULLY: int = 4 # a +2 / +4 chain
+DRAWN_UNO: int = 5 # forgot to call uno
+DRAWN_WRONGCALL: int = 6 # called uno when it was not allowed
+PASSED: int = 7
+SKIPPED: int = 8
+REVERSED: int = 9 # count is 1 for clockwise, 0 for counter-clockwise
+UNO_CALLED: int = 10 # count is 1 for a correct call, 0 for a wrong one
+FINISHED: int = 11 # count is the place
+RESHUFFLED: int = 12 # count is the size of the new deck, seat is 0
+ENDED: int = 13 # count is 1 if the game was completed, seat is the winner (0 if nobody finished)
+DRAWN_TIMEOUT: int = 14 # did not move before the deadline of the turn (see AsyncGame)
+
+ACTIONS: typing.Dict[int, str] = {PLAYED: 'played', COLOUR_PICKED: 'colour picked', DRAWN_STUCK: 'drawn (stuck)',
+                                  DRAWN_BULLY: 'drawn (bully)', DRAWN_UNO: 'drawn (uno)',
+                                  DRAWN_WRONGCALL: 'drawn (wrong call)', PASSED: 'passed', SKIPPED: 'skipped',
+                                  REVERSED: 'reversed', UNO_CALLED: 'uno called', FINISHED: 'finished',
+                                  RESHUFFLED: 'reshuffled', ENDED: 'ended', DRAWN_TIMEOUT: 'drawn (timeout)'}
+DRAW_ACTIONS: typing.Dict[str, int] = {'stuck': DRAWN_STUCK, 'bully': DRAWN_BULLY, 'uno': DRAWN_UNO,
+                                       'wrongcall': DRAWN_WRONGCALL, 'timeout': DRAWN_TIMEOUT} # CardsDrawn.reason -> action code
+
+class GameLogWriter:
+    """Appends the events of any number of games to a log file, buffered so that the game hardly notices"""
+
+    def __init__(self, path: str, bufferSize: int = 1 << 20):
+        self.path: str = path
+        self.file: typing.BinaryIO = open(path, 'ab+') # append only, earlier games are never touched
+        if self.file.tell() == 0:
+            self.file.write(HEADER)
+        else: # only games of the same format are appended
+            self.file.seek(0)
+            if self.file.read(len(MAGIC)) != MAGIC:
+                self.file.close()
+                raise ValueError(f'{path} is not a game log (or one of another version)')
+        self.buffer: bytearray = bytearray() # records that have not been written yet
+        self.bufferSize: int = bufferSize # flushes when the buffer gets this big, in bytes
+        self.records: int = 0 # written by this writer, buffered ones included
+
+    def __enter__(self) -> 'GameLogWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+        return
+
+    def record(self, game: 'Game', gameId: int) -> None:
+        """Subscribes to a game's events until it ends, call before the game is run
+        :param game: :param number under which the game is logged:"""
+        GameRecorder(self, game, gameId)
+        return
+
+    def write(self, gameId: int, turn: int, seat: int, action: int, card: int, count: int) -> None:
+        """Adds one record to the buffer, the fields are explained at the top of this module"""
+        self.buffer += RECORD.pack(gameId, turn, seat, action, card, count)
+        self.records += 1
+        if len(self.buffer) >= self.bufferSize:
+            self.flush()
+        return
+
+    def flush(self) -> None:
+        """Writes the buffered records to the file"""
+        self.file.write(self.buffer)
+        self.file.flush()
+        self.buffer = bytearray()
+        return
+
+    def close(self) -> None:
+        """Flushes and closes the file"""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+        return
+
+
+class GameRecorder:
+    """Turns the events of one game into records, with one handler per event type (so no type checks per event)"""
+
+    def __init__(self, writer: GameLogWriter, game: 'Game', gameId: int):
+        self.writer: GameLogWriter = writer
+        self.game: 'Game' = game # only read for its turn counter
+        self.gameId: int = gameId
+        self.handlers: typing.Dict[type, typing.Callable] = {
+            CardPlayed: self.card_played, ColourPicked: self.colour_picked, CardsDrawn: self.cards_drawn,
+            Passed: self.passed, Skipped: self.skipped, Reversed: self.reversed, UnoCalled: self.uno_called,
+            PlayerFinished: self.player_finished, Reshuffled: self.reshuffled, GameEnded: self.game_ended}
+        for eventType, handler in self.handlers.items():
+            game.events.subscribe(handler, [eventType])
+
+    def card_played(self, event: CardPlayed) -> None:
+        self.writer.write(self.gameId, self.game.turns, event.playerId, PLAYED, event.card.id, 0)
+
+    def colour_picked(self, event: ColourPicked) -> None:
+        self.writer.write(self.gameId, self.game.turns, event.playerId, COLOUR_PICKED, NO_CARD, COLOUR_CODES[event.colour])
+
+    def cards_drawn(self, event: CardsDrawn) -> None:
+        self.writer.write(self.gameId, self.game.turns, event.playerId, DRAW_ACTIONS[event.reason], NO_CARD, event.count)
+
+    def passed(self, event: Passed) -> None:
+        self.writer.write(self.gameId, self.game.turns, event.playerId, PASSED, NO_CARD, 0)
+
+    def skipped(self, event: Skipped) -> None:
+        self.writer.write(self.gameId, self.game.turns, event.playerId, SKIPPED, NO_CARD, 0)
+
+    def reversed(self, event: Reversed) -> None:
+        self.writer.write(self.gameId, self.game.turns, event.playerId, REVERSED, NO_CARD, int(event.direction == 1))
+
+    def uno_called(self, event: UnoCalled) -> None:
+        self.writer.write(self.gameId, self.game.turns, event.playerId, UNO_CALLED, NO_CARD, int(event.correct))
+
+    def player_finished(self, event: PlayerFinished) -> None:
+        self.writer.write(self.gameId, self.game.turns, event.playerId, FINISHED, NO_CARD, event.place)
+
+    def reshuffled(self, event: Reshuffled) -> None:
+        self.writer.write(self.gameId, self.game.turns, 0, RESHUFFLED, NO_CARD, event.cards)
+
+    def game_ended(self, event: GameEnded) -> None:
+        """Writes the last record of the game and stops listening"""
+        result = event.result
+        self.writer.write(self.gameId, self.game.turns, result.winner(), ENDED, NO_CARD, int(result.completed))
+        for handler in self.handlers.values():
+            self.game.events.unsubscribe(handler)
+
+
+def read_log(path: str) -> 'numpy.memmap':
+    """Maps a log file into memory, without reading or copying it
+    :param path: :return structured array with one row per record, fields as in FIELDS:"""
+    import numpy as np # only needed for reading, keeps numpy out of the game's imports
+
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'{path} is not a game log (or one of another version)')
+    dtype = np.dtype(FIELDS)
+    records: int = (os.path.getsize(path) - len(HEADER)) // dtype.itemsize # a record that is still being written is left out
+    if records == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=len(HEADER), shape=(records,))
@@ -0,0 +1,303 @@
+import random
+import typing
+from array import array
+from card import CARDS, NUM_CARDS, DRAW_TWO, REVERSE, SKIP, DRAW_FOUR
+from card import VALID_MOVES, VALID_LAST_MOVES, BULLY_RESPONSES
+from player import Winner
+
+PASS: int = -1 # the move of a player without a card to play
+
+# journal opcodes, an entry is its arguments followed by the opcode, so the journal can be read backwards
+DRAWN, PLAYED, FINISHED, RESHUFFLED = 0, 1, 2, 3
+
+class GameState:
+    """Compact, array-backed copy of a game at the moment a player has to choose a move, for search-based bots.
+
+    Cards are ids (see card.py) and every seat's hand is a row of counts per card id plus a bitmask, so a
+    clone only copies a few flat lists of ints. Moves are card ids, with black cards given as the id of the
+    colour that is picked for them (54-61), or PASS. apply(move) plays a move the way Game.run and
+    Game.handle_action would, including everything that happens automatically until the next player has
+    to choose (forgotten uno calls, drawing bullied cards, drawing when stuck); undo() takes it back.
+    Players are assumed to call uno whenever they are allowed to, like Computer does.
+    Seats are player ids, index 0 of every per-seat list is unused."""
+    __slots__ = ('numPlayers', 'deck', 'pile', 'counts', 'masks', 'sizes', 'nextSeat', 'prevSeat', 'finished',
+                 'placings', 'current', 'top', 'direction', 'bullyDraw', 'turns', 'maxTurns', 'unoCalls',
+                 'rng', 'journal', 'marks', 'reshuffles')
+
+    def __init__(self, numPlayers: int, rng: random.Random = None):
+        self.numPlayers: int = numPlayers # seats, finished players included
+        self.deck: typing.List[int] = [] # card ids, the last one is drawn first
+        self.pile: typing.List[int] = [] # card ids as they sit in a deck (black cards without a colour)
+        self.counts: typing.List[int] = [0] * ((numPlayers + 1) * NUM_CARDS) # per seat and card id: seat * 54 + id
+        self.masks: typing.List[int] = [0] * (numPlayers + 1) # per seat, bit i is set when card i is in hand
+        self.sizes: typing.List[int] = [0] * (numPlayers + 1) # per seat, number of cards in hand
+        self.nextSeat: typing.List[int] = [0] + list(range(2, numPlayers+1)) + [1] # ring of active seats, as in Game
+        self.prevSeat: typing.List[int] = [0, numPlayers] + list(range(1, numPlayers))
+        self.finished: typing.List[bool] = [False] * (numPlayers + 1)
+        self.placings: typing.List[int] = [] # seats in the order in which they finished
+        self.current: int = 1 # seat that has to choose a move
+        self.top: int = -1 # id of the top card state, with the picked colour for black cards
+        self.direction: int = 1
+        self.bullyDraw: int = 0
+        self.turns: int = 0
+        self.maxTurns: int = 0 # the game stops after this many turns, 0 means no limit
+        self.unoCalls: int = 0 # bit s is set when seat s has called uno
+        self.rng: random.Random = rng or random.Random() # only used to shuffle the pile into a new deck
+        self.journal: typing.List[int] = [] # primitive changes since the first apply, see the opcodes above
+        self.marks: typing.List[tuple] = [] # per applied move: journal length and the scalars before the move
+        self.reshuffles: typing.List[tuple] = [] # (deck, pile) lists that were replaced by a reshuffle
+
+    @classmethod
+    def from_game(cls, game: 'Game', current: int, rng: random.Random = None) -> 'GameState':
+        """Captures a game at the moment a player has to choose a move (from their choose_move)
+        :param game: :param id of the player that has to choose: :param rng for reshuffles, a new one by default:"""
+        state = cls(game.number_of_players(), rng)
+        state.deck = [card.id for card in game.deck.cardDeck]
+        state.pile = [card.id for card in game.pile]
+        for player in game.players:
+            seat: int = player.id
+            state.counts[seat * NUM_CARDS:(seat + 1) * NUM_CARDS] = player.cardCounts
+            state.masks[seat] = player.handMask
+            state.sizes[seat] = len(player.hand)
+            state.finished[seat] = isinstance(player, Winner)
+            if player.calledUno:
+                state.unoCalls |= 1 << seat
+        state.nextSeat = game.nextSeat.copy()
+        state.prevSeat = game.prevSeat.copy()
+        state.placings = game.placings.copy()
+        state.current = current
+        state.top = game.currentCard.id
+        state.direction = game.direction
+        state.bullyDraw = game.bullyDraw
+        state.turns = game.turns
+        state.maxTurns = game.maxTurns
+        return state
+
+    def clone(self) -> 'GameState':
+        """Copies the state, in time linear in its size; the copy starts without any moves to undo"""
+        state = object.__new__(GameState)
+        state.numPlayers = self.numPlayers
+        state.deck = self.deck.copy()
+        state.pile = self.pile.copy()
+        state.counts = self.counts.copy()
+        state.masks = self.masks.copy()
+        state.sizes = self.sizes.copy()
+        state.nextSeat = self.nextSeat.copy()
+        state.prevSeat = self.prevSeat.copy()
+        state.finished = self.finished.copy()
+        state.placings = self.placings.copy()
+        state.current, state.top, state.direction = self.current, self.top, self.direction
+        state.bullyDraw, state.turns, state.maxTurns, state.unoCalls = self.bullyDraw, self.turns, self.maxTurns, self.unoCalls
+        state.rng = self.rng
+        state.journal, state.marks, state.reshuffles = [], [], []
+        return state
+
+    def pack(self) -> tuple:
+        """Compact copy to send to another process: card ids as bytes, seats and counts as 16-bit arrays
+        (tables can have more than 255 seats), without the rng and the moves that can be undone
+        :return tuple for unpack:"""
+        return (self.numPlayers, bytes(self.deck), bytes(self.pile), array('H', self.counts), array('H', self.nextSeat),
+                array('H', self.prevSeat), bytes(self.finished), array('H', self.placings), self.current, self.top,
+                self.direction, self.bullyDraw, self.turns, self.maxTurns, self.unoCalls)
+
+    @classmethod
+    def unpack(cls, packed: tuple, rng: random.Random = None) -> 'GameState':
+        """Rebuilds a state made by pack, the hand bitmasks are worked out from the counts
+        :param tuple from pack: :param rng for reshuffles, a new one by default:"""
+        numPlayers, deck, pile, counts, nextSeat, prevSeat, finished, placings, *scalars = packed
+        state = cls(numPlayers, rng)
+        state.deck, state.pile, state.counts = list(deck), list(pile), list(counts)
+        state.nextSeat, state.prevSeat, state.placings = list(nextSeat), list(prevSeat), list(placings)
+        state.finished = [bool(done) for done in finished]
+        state.current, state.top, state.direction, state.bullyDraw, state.turns, state.maxTurns, state.unoCalls = scalars
+        for seat in range(1, numPlayers + 1):
+            base: int = seat * NUM_CARDS
+            state.sizes[seat] = sum(counts[base:base + NUM_CARDS])
+            state.masks[seat] = sum(1 << id for id in range(NUM_CARDS) if counts[base + id])
+        return state
+
+    def hand(self, seat: int) -> typing.List[int]:
+        """Lists the card ids in a seat's hand, in id order"""
+        base: int = seat * NUM_CARDS
+        return [id for id in range(NUM_CARDS) for _ in range(self.counts[base + id])]
+
+    def is_done(self) -> bool:
+        """Checks if only one player is left, or the turn limit has been reached"""
+        return self.numPlayers - len(self.placings) <= 1 or (self.maxTurns and self.turns >= self.maxTurns)
+
+    def result(self) -> typing.List[int]:
+        """Returns the seats in finishing order, the players that did not finish last in seat order"""
+        return self.placings + [seat for seat in range(1, self.numPlayers+1) if not self.finished[seat]]
+
+    def move_mask(self) -> int:
+        """Returns the bitmask of the card ids the current player may play (black cards without a colour)"""
+        seat: int = self.current
+        if self.sizes[seat] == 1: # the last card has to be a number
+            return self.masks[seat] & VALID_LAST_MOVES[self.top]
+        return self.masks[seat] & VALID_MOVES[self.top]
+
+    def legal_moves(self) -> typing.List[int]:
+        """Lists the moves of the current player: every playable card, a black card once for every colour
+        that can be picked for it, or only PASS when there is nothing to play (nobody passes on purpose)"""
+        moves: typing.List[int] = []
+        mask: int = self.move_mask()
+        while mask:
+            bit: int = mask & -mask
+            id: int = bit.bit_length() - 1
+            if id < NUM_CARDS - 2:
+                moves.append(id)
+            else: # a Draw Four (52) or Wild (53) in each of the four colours
+                moves += [NUM_CARDS + colourCode * 2 + id - 52 for colourCode in range(4)]
+            mask ^= bit
+        return moves or [PASS]
+
+    def apply(self, move: int) -> None:
+        """Plays a move of the current player and continues until the next player has to choose
+        :param card id (a coloured state for black cards) or PASS:"""
+        self.marks.append((len(self.journal), self.current, self.top, self.direction,
+                           self.bullyDraw, self.turns, self.unoCalls))
+        seat: int = self.current
+        if self.sizes[seat] <= 2 and self.masks[seat] & VALID_MOVES[self.top]: # calls uno whenever it is correct
+            self.unoCalls |= 1 << seat
+        if move == PASS:
+            self.current = self.next_seat(seat)
+            self.start_turn()
+            return
+
+        card: int = 52 + (move - NUM_CARDS) % 2 if move >= NUM_CARDS else move # black cards lose their colour
+        valueCode: int = CARDS[card].valueCode
+        if self.bullyDraw and valueCode != DRAW_TWO and valueCode != DRAW_FOUR: # did not bully back, so draws first
+            self.draw(seat, self.bullyDraw)
+            self.bullyDraw = 0
+        self.play(seat, card, move)
+
+        nextSeat: int = seat
+        if valueCode == DRAW_TWO:
+            self.bullyDraw += 2
+        elif valueCode == DRAW_FOUR:
+            self.bullyDraw += 4
+        elif valueCode == SKIP:
+            nextSeat = self.next_seat(seat)
+        elif valueCode == REVERSE:
+            if self.numPlayers >= 3:
+                self.direction *= -1
+            else: # with two players a Reverse means playing again
+                self.current = seat
+                self.start_turn()
+                return
+        self.current = self.next_seat(nextSeat)
+        if self.sizes[seat] == 0:
+            self.finish(seat)
+        self.start_turn()
+        return
+
+    def undo(self) -> None:
+        """Takes back the last applied move, everything it caused included"""
+        start, self.current, self.top, self.direction, self.bullyDraw, self.turns, self.unoCalls = self.marks.pop()
+        journal: typing.List[int] = self.journal
+        counts: typing.List[int] = self.counts
+        while len(journal) > start:
+            op: int = journal.pop()
+            if op == DRAWN:
+                card: int = journal.pop()
+                seat: int = journal.pop()
+                self.deck.append(card)
+                self.take(seat, card)
+            elif op == PLAYED:
+                card = journal.pop()
+                seat = journal.pop()
+                self.pile.pop()
+                counts[seat * NUM_CARDS + card] += 1
+                self.masks[seat] |= 1 << card
+                self.sizes[seat] += 1
+            elif op == FINISHED:
+                seat = journal.pop()
+                self.finished[seat] = False
+                self.placings.pop()
+                self.nextSeat[self.prevSeat[seat]] = seat
+                self.prevSeat[self.nextSeat[seat]] = seat
+            elif op == RESHUFFLED:
+                self.deck, self.pile = self.reshuffles.pop()
+        return
+
+    def start_turn(self) -> None:
+        """Does what happens at the start of a turn before the player has to choose, see Game.run,
+        skips over finished players and stops when the game is over"""
+        while not self.is_done():
+            seat: int = self.current
+            if self.finished[seat]:
+                self.current = self.next_seat(seat)
+                continue
+            self.turns += 1
+            bit: int = 1 << seat
+            if self.sizes[seat] == 1 and not self.unoCalls & bit: # forgot to call uno
+                self.draw(seat, 3)
+            self.unoCalls &= ~bit
+            if self.bullyDraw:
+                if self.masks[seat] & BULLY_RESPONSES[self.top]:
+                    return # has to choose whether to bully back
+                self.draw(seat, self.bullyDraw)
+                self.bullyDraw = 0
+            if not self.masks[seat] & VALID_MOVES[self.top]:
+                self.draw(seat, 1)
+            return
+        return
+
+    def next_seat(self, seat: int) -> int:
+        """Returns the next active seat in the current direction, see Game.next_player_id"""
+        seats: typing.List[int] = self.nextSeat if self.direction == 1 else self.prevSeat
+        next: int = seats[seat]
+        while self.finished[next]:
+            next = seats[next]
+        return next
+
+    def draw(self, seat: int, times: int) -> None:
+        """Moves cards from the deck to a hand, the pile is shuffled into a new deck when needed (see Game.draw)"""
+        for _ in range(times):
+            if not self.deck:
+                if len(self.pile) <= 1:
+                    break
+                self.reshuffle()
+            card: int = self.deck.pop()
+            self.counts[seat * NUM_CARDS + card] += 1
+            self.masks[seat] |= 1 << card
+            self.sizes[seat] += 1
+            self.journal += (seat, card, DRAWN)
+        return
+
+    def reshuffle(self) -> None:
+        """Shuffles all but the top card of the pile into a new deck, the old lists are kept for undo"""
+        self.reshuffles.append((self.deck, self.pile))
+        deck: typing.List[int] = self.pile[:-1]
+        self.rng.shuffle(deck)
+        self.deck, self.pile = deck, self.pile[-1:]
+        self.journal.append(RESHUFFLED)
+        return
+
+    def play(self, seat: int, card: int, move: int) -> None:
+        """Moves a card from a hand to the pile :param seat: :param card id: :param top card state it becomes:"""
+        self.take(seat, card)
+        self.pile.append(card)
+        self.top = move
+        self.journal += (seat, card, PLAYED)
+        return
+
+    def take(self, seat: int, card: int) -> None:
+        """Removes one card from a hand, keeping the mask up to date"""
+        idx: int = seat * NUM_CARDS + card
+        self.counts[idx] -= 1
+        if not self.counts[idx]:
+            self.masks[seat] &= ~(1 << card)
+        self.sizes[seat] -= 1
+        return
+
+    def finish(self, seat: int) -> None:
+        """Registers a seat that emptied its hand and takes it out of the ring, see Game.finish"""
+        self.finished[seat] = True
+        self.placings.append(seat)
+        self.unoCalls &= ~(1 << seat) # Game replaces the player by a Winner, who has not called uno
+        left, right = self.prevSeat[seat], self.nextSeat[seat]
+        self.nextSeat[left] = right
+        self.prevSeat[right] = left
+        self.journal += (seat, FINISHED)
+        return
@@ -1,5 +1,19 @@
+import os
+import typing
 from game import Game
 
+# UNO_PROFILE=profile.json (or .prom for Prometheus) times every phase of the games, see profiling.py
+PROFILER = None
+if os.environ.get('UNO_PROFILE'):
+    from profiling import Profiler
+    PROFILER = Profiler(os.environ['UNO_PROFILE'])
+
+# UNO_RENDERER=curses draws the game on curses and only repaints what changed, see cursesrenderer.py
+CURSES: bool = os.environ.get('UNO_RENDERER') == 'curses'
+
+# UNO_SPECTATE=/dev/pts/3,finals.jsonl shows every turn (hands hidden) on other terminals or in files, see spectator.py
+SPECTATE: typing.List[str] = [path for path in os.environ.get('UNO_SPECTATE', '').split(',') if path]
+
 def main():
     """
     "Activates" Game.__call__
@@ -36,8 +50,36 @@ IMPORTANT:
     
     _ = input('\nGood luck and have fun\nPlease hit Enter to start the game:\n>')
     mainGame = Game()
+    if PROFILER is not None:
+        PROFILER.attach(mainGame)
+    spectator = None # a spectator.Spectator, when UNO_SPECTATE is set
+    if SPECTATE:
+        from spectator import Spectator, FileViewer
+        spectator = Spectator()
+        for path in SPECTATE:
+            spectator.add(FileViewer(path, 'json' if path.endswith('.jsonl') else 'text'))
+        spectator.watch(mainGame)
+    screen = None # a CursesRenderer, when UNO_RENDERER=curses and curses can drive this terminal
+    if CURSES:
+        from cursesrenderer import CursesRenderer, open_screen
+        screen = open_screen()
+        if isinstance(screen, CursesRenderer):
+            screen.attach(mainGame)
+        else:
+            screen = None
 
-    if mainGame():
+    try:
+        playAgain: bool = mainGame()
+        if screen is not None: # the screen goes away with curses
+            screen.ask('The game is over, press Enter to leave: ')
+    finally:
+        if screen is not None:
+            screen.stop()
+        if spectator is not None:
+            spectator.close()
+    if PROFILER is not None:
+        PROFILER.export()
+    if playAgain:
         main()
     else:
         quit
@@ -0,0 +1,283 @@
+"""Computer player that searches: information set Monte Carlo tree search (ISMCTS) on GameState.
+
+Every iteration deals the cards this player cannot see (the other hands and the deck) at random,
+respecting how many cards everybody holds, walks down a tree of moves that is shared by all of these
+deals, and finishes with a quick rollout in which everybody plays like Computer does. Rollouts are cut
+off after a number of moves and scored by the places and hand sizes at that point, which gives many
+more rollouts within the time budget than playing every game to the end.
+"""
+import asyncio
+import math
+import random
+import time
+import typing
+from card import Card, CARDS, COLOURS, NUM_CARDS, PREFERRED_MOVES, DRAW_TWO
+from gamestate import GameState, PASS
+from player import Computer
+
+ACTION_CARD_IDS: typing.List[int] = [card.id for card in CARDS[:NUM_CARDS] if card.valueCode >= DRAW_TWO]
+ACTION_WEIGHT: float = 0.5 # extra weight of an action or black card in a hand, when a rollout is scored
+SLICE: float = 0.005 # seconds an awaited search runs before it lets the other games on the event loop go
+
+class Node:
+    """A move in the search tree, with the statistics of the player who made it"""
+    __slots__ = ('move', 'seat', 'parent', 'children', 'visits', 'reward', 'avails')
+
+    def __init__(self, move: int, seat: int, parent: 'Node'):
+        self.move: int = move
+        self.seat: int = seat # the player who made the move
+        self.parent: Node = parent
+        self.children: typing.Dict[int, Node] = {} # move -> node
+        self.visits: int = 0
+        self.reward: float = 0.0 # summed over all visits, from the point of view of self.seat
+        self.avails: int = 0 # number of visits of the parent in which this move was legal
+
+    def select(self, legal: typing.List[int], exploration: float) -> 'Node':
+        """Picks the child with the highest upper confidence bound, among the moves that are legal in this deal"""
+        best, bestScore = None, -1.0
+        for move in legal:
+            child: Node = self.children[move]
+            child.avails += 1
+            score: float = child.reward / child.visits + exploration * math.sqrt(math.log(child.avails) / child.visits)
+            if score > bestScore:
+                best, bestScore = child, score
+        return best
+
+class MCTSComputer(Computer):
+    """Chooses its moves (and colours) by ISMCTS, within a time budget, a rollout budget or both"""
+
+    def __init__(self, id: int, timeLimit: float = 0.04, rollouts: int = 0, depth: int = 10, exploration: float = 0.7,
+                 pool: 'SearchPool' = None):
+        super().__init__(id)
+        self.timeLimit: float = timeLimit # seconds per decision, 0 means no time limit
+        self.rollouts: int = rollouts # iterations per decision, 0 means as many as fit in the time limit
+        self.depth: int = depth # moves per rollout before the position is scored
+        self.exploration: float = exploration # UCB constant, rewards are between 0 and 1
+        self.pool: 'SearchPool' = pool # worker processes that search next to this one, see searchpool.py
+        self.game: 'Game' = None # set by join
+        self.searchRng: random.Random = random.Random() # reseeded from the game's rng by join
+        self.colour: str = 'Red' # picked together with a black card, handed out by pick_colour
+        self.lastIterations: int = 0 # iterations of the last search, for benchmarks
+
+    def join(self, game: 'Game') -> None:
+        """Keeps the game to look at it, and seeds its own rng from the game so a seeded game stays reproducible"""
+        super().join(game)
+        self.game = game
+        self.searchRng = random.Random(game.rng.getrandbits(64))
+        return
+
+    def choose_move(self, currentCard: Card) -> typing.Union[Card, str]:
+        """Searches for the best move, the uno call is made the way Computer makes it"""
+        return self.to_action(self.search(self.root(currentCard)))
+
+    async def choose_move_async(self, currentCard: Card) -> typing.Union[Card, str]:
+        """choose_move for games on an event loop: the search runs in slices, with the other games going on in between"""
+        return self.to_action(await self.search_async(self.root(currentCard)))
+
+    def root(self, currentCard: Card) -> GameState:
+        """Calls uno when it is allowed, like Computer does :return the state to search from:"""
+        if self.correct_uno_call(currentCard):
+            self.calledUno = True
+            self.handle_uno_call(currentCard)
+        return GameState.from_game(self.game, self.id, self.searchRng)
+
+    def to_action(self, move: int) -> typing.Union[Card, str]:
+        """Turns the move that was found into a card from the hand (and the colour to pick), or a pass"""
+        if move == PASS:
+            return 'pass'
+        if move >= NUM_CARDS: # a black card, the move tells what colour to pick
+            self.colour = COLOURS[(move - NUM_CARDS) // 2]
+        return self.play(CARDS[move].undeclared())
+
+    def pick_colour(self) -> str:
+        """Returns the colour that was chosen together with the black card"""
+        return self.colour
+
+    def search(self, root: GameState) -> int:
+        """Runs ISMCTS from a state in which this player has to choose, on the worker pool when there is one
+        :return the move with the most visits:"""
+        legal: typing.List[int] = root.legal_moves()
+        if len(legal) == 1:
+            self.lastIterations = 0
+            return legal[0]
+        if self.pool is not None:
+            stats: typing.Dict[int, typing.List[float]] = self.pool.search(self, root)
+        else:
+            stats = root_stats(self.grow(root, self.timeLimit, self.rollouts, self.searchRng))
+        self.lastIterations = sum(visits for visits, _ in stats.values())
+        return max(stats, key=lambda move: stats[move][0])
+
+    async def search_async(self, root: GameState) -> int:
+        """search, giving the event loop back every SLICE seconds (and while the pool's workers finish)
+        :return the move with the most visits:"""
+        legal: typing.List[int] = root.legal_moves()
+        if len(legal) == 1:
+            self.lastIterations = 0
+            return legal[0]
+        if self.pool is not None:
+            stats: typing.Dict[int, typing.List[float]] = await self.pool.search_async(self, root)
+        else:
+            stats = root_stats(await self.grow_async(root, self.timeLimit, self.rollouts))
+        self.lastIterations = sum(visits for visits, _ in stats.values())
+        return max(stats, key=lambda move: stats[move][0])
+
+    async def grow_async(self, root: GameState, timeLimit: float, rollouts: int) -> Node:
+        """grow in slices of at most SLICE seconds, the same iterations in the same order (so with a rollout budget
+        the tree is the same as grow's) :param state: :param seconds, 0 for no limit: :param iterations, 0 for no limit:
+        :return the root node:"""
+        deadline: float = time.perf_counter() + timeLimit if timeLimit else math.inf
+        tree: Node = self.grow(root, min(SLICE, timeLimit or SLICE), rollouts, self.searchRng)
+        while True:
+            done: int = sum(child.visits for child in tree.children.values())
+            left: float = deadline - time.perf_counter()
+            if (rollouts and done >= rollouts) or left <= 0:
+                return tree
+            await asyncio.sleep(0)
+            tree = self.grow(root, min(SLICE, left), rollouts - done if rollouts else 0, self.searchRng, tree)
+
+    def grow(self, root: GameState, timeLimit: float, rollouts: int, rng: random.Random, tree: Node = None) -> Node:
+        """Builds a search tree from a state in which this player has to choose
+        :param state: :param seconds, 0 for no limit: :param iterations, 0 for no limit: :param rng:
+        :param tree of an earlier call to go on with, by default a new one: :return the root node, its children are this player's moves:"""
+        tree = tree or Node(PASS, 0, None)
+        deadline: float = time.perf_counter() + timeLimit if timeLimit else math.inf
+        iterations: int = 0
+        while (not rollouts or iterations < rollouts) and (iterations == 0 or time.perf_counter() < deadline):
+            state: GameState = self.determinize(root, rng)
+            node: Node = tree
+
+            # selection: down the tree while every legal move has been tried in some earlier deal
+            while not state.is_done():
+                moves: typing.List[int] = state.legal_moves()
+                untried: typing.List[int] = [move for move in moves if move not in node.children]
+                if untried: # expansion
+                    move: int = untried[int(rng.random() * len(untried))]
+                    child = Node(move, state.current, node)
+                    for other in moves:
+                        if other in node.children:
+                            node.children[other].avails += 1
+                    child.avails = 1
+                    node.children[move] = child
+                    node = child
+                    state.apply(move)
+                    break
+                node = node.select(moves, self.exploration)
+                state.apply(node.move)
+
+            rewards: typing.List[float] = self.rollout(state, rng)
+            while node is not tree: # backpropagation
+                node.visits += 1
+                node.reward += rewards[node.seat]
+                node = node.parent
+            iterations += 1
+        return tree
+
+    def determinize(self, root: GameState, rng: random.Random) -> GameState:
+        """Clones the state and deals the cards this player cannot see at random: the other hands and the deck.
+        Only the cards that are dealt and the top of the deck (as far as a rollout is likely to draw) are shuffled,
+        the bottom of the deck keeps the order it had in the game"""
+        state: GameState = root.clone()
+        counts: typing.List[int] = state.counts
+        hidden: typing.List[int] = state.deck.copy()
+        dealt: int = 0
+        for seat in range(1, state.numPlayers + 1):
+            if seat != self.id and state.sizes[seat]:
+                hidden += state.hand(seat)
+                counts[seat * NUM_CARDS:(seat + 1) * NUM_CARDS] = [0] * NUM_CARDS
+                state.masks[seat] = 0
+                dealt += state.sizes[seat]
+        partial_shuffle(hidden, dealt + min(len(state.deck), 2 * self.depth), rng)
+        start: int = len(hidden) - dealt
+        state.deck = hidden[:start]
+        for seat in range(1, state.numPlayers + 1):
+            size: int = state.sizes[seat]
+            if seat != self.id and size:
+                base: int = seat * NUM_CARDS
+                mask: int = 0
+                for card in hidden[start:start + size]:
+                    counts[base + card] += 1
+                    mask |= 1 << card
+                state.masks[seat] = mask
+                start += size
+        return state
+
+    def rollout(self, state: GameState, rng: random.Random) -> typing.List[float]:
+        """Lets everybody play like Computer for a number of moves :return reward per seat, between 0 and 1:"""
+        for _ in range(self.depth):
+            if state.is_done():
+                break
+            state.apply(policy_move(state, rng))
+        return score(state)
+
+
+def root_stats(tree: Node) -> typing.Dict[int, typing.List[float]]:
+    """Returns the statistics of the root moves, which is all that is needed to merge searches
+    :return move -> [visits, summed reward]:"""
+    return {move: [child.visits, child.reward] for move, child in tree.children.items()}
+
+
+def merge_stats(stats: typing.Dict[int, typing.List[float]], other: typing.Dict[int, typing.List[float]]) -> None:
+    """Adds the root statistics of another search to stats, in place"""
+    for move, (visits, reward) in other.items():
+        total: typing.List[float] = stats.setdefault(move, [0, 0.0])
+        total[0] += visits
+        total[1] += reward
+    return
+
+
+def partial_shuffle(items: list, count: int, rng: random.Random) -> None:
+    """Shuffles the last count items of a list in place, they become a uniformly random selection of all items
+    in a uniformly random order (the first steps of a Fisher-Yates shuffle)"""
+    for idx in range(len(items) - 1, len(items) - 1 - count, -1):
+        other: int = int(rng.random() * (idx + 1))
+        items[idx], items[other] = items[other], items[idx]
+    return
+
+
+def policy_move(state: GameState, rng: random.Random) -> int:
+    """Chooses a move for the current player of a state the way Computer.choose_move and pick_colour do:
+    a +2 on a +2 and a +4 on a +4 when possible, otherwise any valid card (every copy in hand equally likely)"""
+    seat: int = state.current
+    base: int = seat * NUM_CARDS
+    counts: typing.List[int] = state.counts
+    mask: int = state.masks[seat] & PREFERRED_MOVES[state.top]
+    if not mask or state.sizes[seat] == 1:
+        mask = state.move_mask()
+    if not mask:
+        return PASS
+    options: typing.List[int] = []
+    while mask:
+        bit: int = mask & -mask
+        card: int = bit.bit_length() - 1
+        options += [card] * counts[base + card]
+        mask ^= bit
+    card = options[int(rng.random() * len(options))]
+    if card < NUM_CARDS - 2:
+        return card
+    # a black card: the colour the hand has most of, in the order Computer.pick_colour checks them
+    choice, maxCount = 0, 0
+    for colourCode in (0, 1, 3, 2): # Red, Yellow, Green, Blue
+        count: int = sum(counts[base + colourCode * 13:base + colourCode * 13 + 13])
+        if count > maxCount:
+            choice, maxCount = colourCode, count
+    return NUM_CARDS + choice * 2 + card - 52
+
+
+def score(state: GameState) -> typing.List[float]:
+    """Rewards per seat: finished players by their place, the others by their expected place, where a player
+    with a cards beats one with b cards with a chance of b / (a + b). Action and black cards count for
+    1 + ACTION_WEIGHT cards, since a hand cannot be finished with them :return list indexed by seat, from 0 to 1:"""
+    numPlayers: int = state.numPlayers
+    rewards: typing.List[float] = [0.0] * (numPlayers + 1)
+    for place, seat in enumerate(state.placings):
+        rewards[seat] = (numPlayers - 1 - place) / (numPlayers - 1)
+    left: typing.List[int] = [seat for seat in range(1, numPlayers + 1) if not state.finished[seat]]
+    counts: typing.List[int] = state.counts
+    sizes: typing.Dict[int, float] = {seat: state.sizes[seat] + ACTION_WEIGHT *
+                                      sum(counts[seat * NUM_CARDS + card] for card in ACTION_CARD_IDS)
+                                      for seat in left}
+    first: int = len(state.placings) # place (counting from 0) of the best player that has not finished
+    for seat in left:
+        beaten: float = sum(sizes[seat] / (sizes[seat] + sizes[other]) for other in left if other != seat)
+        rewards[seat] = (numPlayers - 1 - first - beaten) / (numPlayers - 1)
+    return rewards
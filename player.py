@@ -1,6 +1,7 @@
 import random
 import typing
-from card import Card
+from events import EventBus, UnoCalled
+from card import Card, VALID_MOVES, VALID_LAST_MOVES, PREFERRED_MOVES, NUM_CARDS, COLOUR_CODES, VALUE_CODES
 
 class Player():
     """Parent class, contains the shared methods of both human and computer players"""
@@ -8,7 +9,36 @@ class Player():
     def __init__ (self, id: int):
         self.id: int = id # for differentiating between instances
         self.hand: typing.List[Card] = [] # for keeping track of their hand
+        # index of the hand, kept up to date by draw, receive_hand and play (so never change self.hand directly)
+        self.cardCounts: typing.List[int] = [0] * NUM_CARDS # per card id
+        self.colourCounts: typing.List[int] = [0] * 5 # per colour code, black included
+        self.valueCounts: typing.List[int] = [0] * 15 # per value code
+        self.handMask: int = 0 # card.bit is set for every card id that is in hand at least once
         self.calledUno: bool = False # for checking whether or not they called uno
+        self.headless: bool = False # set by Game, silences all printing
+        self.rng: random.Random = random # replaced by the game's own rng when the player is seated
+        self.events: EventBus = EventBus() # replaced by the game's event bus when the player is seated
+        self.renderer: 'Renderer' = None # the game's renderer, through which a human is asked for input
+
+    def join(self, game: 'Game') -> None:
+        """Takes a seat in a game: shares its rng, event bus and renderer, and goes quiet when the game is headless"""
+        self.headless = game.headless
+        self.rng = game.rng
+        self.events = game.events
+        self.renderer = game.renderer
+        return
+
+    def ask(self, prompt: str) -> str:
+        """Asks the player to type a line, on the game's screen :param prompt: :return what they typed:"""
+        return self.renderer.ask(prompt) if self.renderer else input(prompt)
+
+    def say(self, text: str) -> None:
+        """Shows a message to the player, on the game's screen"""
+        if self.renderer:
+            self.renderer.say(text)
+        else:
+            print(text)
+        return
 
     def choose_move(self, currentCard: Card) -> typing.Union[Card, str]:
         """Overwritten by child classes"""
@@ -18,6 +48,16 @@ class Player():
         """Overwritten by child classes"""
         return ''
 
+    async def choose_move_async(self, currentCard: Card) -> typing.Union[Card, str]:
+        """Awaitable version of choose_move, for games on an event loop (see asyncgame.py): by default the
+        decision is made at once, players that wait for something (a remote human, another process, a search)
+        override it so that other games can go on in the meantime"""
+        return self.choose_move(currentCard)
+
+    async def pick_colour_async(self) -> str:
+        """Awaitable version of pick_colour, asked right after a black card was chosen"""
+        return self.pick_colour()
+
     def is_valid_choice(self, choiceInput: int, topCard: Card) -> bool:
         """Checks whether a certain card can be played on the current top card,
         also checks if the the card is a valid last move (when there is only one move left"""
@@ -34,29 +74,60 @@ class Player():
 
     def has_valid_move(self, topCard: Card) -> bool:
         """Checks if a player has any valid moves"""
-        for card in self.hand:
-            if card.is_valid_move(topCard):
-                return True
-        return False
+        return self.handMask & VALID_MOVES[topCard.id] != 0
+
+    def has_any(self, mask: int) -> bool:
+        """Checks if a player has any of the cards in a move mask (see card.py)"""
+        return self.handMask & mask != 0
+
+    def valid_moves(self, topCard: Card) -> typing.List[Card]:
+        """Lists all cards in hand that can be played on the top card,
+        when only one card is left it has to be a valid last move"""
+        mask: int = VALID_LAST_MOVES[topCard.id] if len(self.hand) == 1 else VALID_MOVES[topCard.id]
+        return [card for card in self.hand if mask & card.bit]
 
     def has_card(self, card: Card) -> bool:
-        """Checks if a player has a specific move"""
-        for candidate in self.hand:
-            if candidate == card:
-                return True
-            elif (card.colour == "*" and card.value == candidate.value) or \
-                 (card.value == "*" and card.colour == candidate.colour):
-                return True
-        return False
+        """Checks if a player has a specific move, '*' matches any colour or any value"""
+        if card.colour == "*":
+            return card.value in VALUE_CODES and self.valueCounts[VALUE_CODES[card.value]] > 0
+        elif card.value == "*":
+            return card.colour in COLOUR_CODES and self.colourCounts[COLOUR_CODES[card.colour]] > 0
+        return self.handMask & card.bit != 0
 
     def draw(self, cards: typing.List[Card]) -> None:
         """Makes a player draw one or multiple card(s)"""
         self.hand += cards
+        for card in cards:
+            self.count(card, 1)
         return
 
     def receive_hand(self, hand: typing.List[Card]) -> None:
         """Initializes a player's hand"""
         self.hand = hand
+        self.cardCounts = [0] * NUM_CARDS
+        self.colourCounts = [0] * 5
+        self.valueCounts = [0] * 15
+        self.handMask = 0
+        for card in hand:
+            self.count(card, 1)
+        return
+
+    def play(self, card: Card) -> Card:
+        """Takes a card out of the hand :return the same card:"""
+        self.hand.remove(card)
+        self.count(card, -1)
+        return card
+
+    def count(self, card: Card, change: int) -> None:
+        """Updates the hand index for one card that was added (+1) or removed (-1)"""
+        self.colourCounts[card.colourCode] += change
+        self.valueCounts[card.valueCode] += change
+        remaining: int = self.cardCounts[card.id] + change
+        self.cardCounts[card.id] = remaining
+        if remaining:
+            self.handMask |= card.bit
+        else:
+            self.handMask &= ~card.bit
         return
 
     def correct_uno_call(self, topCard: Card) -> bool:
@@ -64,13 +135,11 @@ class Player():
         return len(self.hand) <= 2 and self.has_valid_move(topCard)
 
     def handle_uno_call(self, currentCard: Card) -> bool:
-        """Handle what happens when a player calls uno: prints information to the right"""
-        if self.correct_uno_call(currentCard):
-            print('-' * 64 + f'player {self.id} called uno correctly')
-            return True
-        else:
-            print('-' * 64 + f'player {self.id} called uno incorrectly and has to draw 3 cards')
-            return False
+        """Handle what happens when a player calls uno: emits an UnoCalled event (printed to the right in the terminal)"""
+        correct: bool = self.correct_uno_call(currentCard)
+        if UnoCalled in self.events.handlers:
+            self.events.emit(UnoCalled(self.id, correct))
+        return correct
 
 class Human(Player):
     """Inherits most methods from the parent class, but introduces two interactive methods"""
@@ -82,9 +151,9 @@ class Human(Player):
         validInput = False
         while not validInput:
             try:
-                inp = int(input('Choose option (enter number):\n>'))
+                inp = int(self.ask('Choose option (enter number):\n>'))
                 while not self.is_valid_choice(inp, currentCard): # move has to exist, and be valid
-                    inp = int(input('Invalid (move)\nPlease enter one of the displayed numbers:\n>'))
+                    inp = int(self.ask('Invalid (move)\nPlease enter one of the displayed numbers:\n>'))
                 validInput = True
                 if inp == len(self.hand) + 1: # Pass
                     return 'pass'
@@ -96,17 +165,16 @@ class Human(Player):
                         continue # the player can now input the actual move they want to play
                     return 'wrongcall' # false Uno Call gets returned to Game class' function
             except ValueError:
-                print('Please use a numerical value')
+                self.say('Please use a numerical value')
                 continue
         choice = self.hand[inp-1]
-        self.hand.remove(choice)
-        return choice # returns the corresponding card
+        return self.play(choice) # returns the corresponding card
     
     def pick_colour(self) -> str:
         """Prompts a new colour to be picked (generally after playing a wildcard)"""
         colour: str = 'Purple'
         while colour.upper() not in ['BLUE', 'RED', 'GREEN', 'YELLOW']:
-            colour = input('Pick a colour from:\nblue, yellow, green or red\n>')
+            colour = self.ask('Pick a colour from:\nblue, yellow, green or red\n>')
             if colour.upper() == 'BLUE':
                 return 'Blue'
             elif colour.upper() == 'RED':
@@ -128,37 +196,24 @@ class Computer(Player):
             self.handle_uno_call(currentCard)
 
         validMoves: list = []
-        currentVal: str = currentCard.value
-
-        if currentVal == 'Draw Four':
-            for i in range(1, len(self.hand)+1):
-                card = self.hand[i-1]
-                if card.value == 'Draw Four':
-                    validMoves.append(card)
-        elif currentVal == 'Draw Two':
-            for i in range(1, len(self.hand)+1):
-                card = self.hand[i-1]
-                if card.value == 'Draw Two':
-                    validMoves.append(card)
+        preferred: int = PREFERRED_MOVES[currentCard.id] # bully back with a +2 on a +2 and a +4 on a +4
+
+        if self.handMask & preferred and len(self.hand) > 1: # a last card has to be a number, valid_moves takes care of that
+            validMoves = [card for card in self.hand if preferred & card.bit]
         if not validMoves:
-            for i in range(1, len(self.hand)+1):
-                card = self.hand[i-1]
-                if self.is_valid_choice(i, currentCard):
-                    validMoves.append(card)
+            validMoves = self.valid_moves(currentCard)
 
-        print('COMPUTER MOVE')
+        if not self.headless:
+            self.say('COMPUTER MOVE')
         if not validMoves:
             return 'pass'
-        choice = random.choice(validMoves)
-        self.hand.remove(choice)
-        return choice
+        return self.play(self.rng.choice(validMoves))
 
     def pick_colour(self) -> str:
         """Makes the computer player picks a new colour, based on what it has most of in its hand"""
         choice, maxCount = 'Red', 0 # default choice has to be a colour, for if there's no colours left in hand
-        coloursInHand: list = [card.colour for card in self.hand] # make a list with all of the colours
         for colour in ['Red', 'Yellow', 'Green', 'Blue']:
-            count: int = coloursInHand.count(colour) # the amount of times a colour is in the hand
+            count: int = self.colourCounts[COLOUR_CODES[colour]] # the amount of times a colour is in the hand
             if count > maxCount:
                 choice, maxCount = colour, count # variables should be updated
         return choice
@@ -0,0 +1,150 @@
+"""Opt-in instrumentation of Game.run: where the time goes per phase, plus a few counters, with snapshots
+written to a json file or a Prometheus text file (for the node exporter's textfile collector).
+
+Phases are timed exclusively (time spent in a nested phase only counts for that phase):
+    choose   Computer.choose_move and pick_colour (and any other bot's)
+    input    Human.choose_move and pick_colour, which is mostly waiting for the player to type
+    bully    Game.handle_bully_response
+    draw     Game.draw, shuffling the pile into a new deck included
+    render   Game.display_options
+    other    the rest of Game.run (the prompt to draw a card when a human player is stuck included)
+
+    profiler = Profiler('profile.prom', interval=10)
+    profiler.attach(game) # before the game is set up or run, any number of games in a row
+    game.start()
+    profiler.export()
+
+Attaching puts timed wrappers on the game object and its players, and the counters come from the game's
+events, so a game without a profiler runs exactly the same code as before.
+"""
+import json
+import os
+import time
+import typing
+from events import UnoCalled, GameEnded
+from player import Human
+from stats import GameStats
+
+PHASES: typing.Tuple[str, ...] = ('choose', 'input', 'bully', 'draw', 'render', 'other')
+
+class Profiler:
+    """Per-phase timings and counters over any number of games, exported now and then"""
+
+    def __init__(self, path: str = None, format: str = None, interval: float = 10.0):
+        """:param file to export to, None to only collect: :param 'json' or 'prometheus', by default
+        prometheus for a .prom file and json otherwise: :param seconds between exports while a game runs:"""
+        self.path: str = path
+        self.format: str = format or ('prometheus' if path and path.endswith('.prom') else 'json')
+        if self.format not in ('json', 'prometheus'):
+            raise ValueError(f'unknown export format {self.format}')
+        self.interval: float = interval
+        self.nextExport: float = time.perf_counter() + interval
+        self.seconds: typing.Dict[str, float] = dict.fromkeys(PHASES, 0.0) # exclusive time per phase
+        self.calls: typing.Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.nested: typing.List[float] = [] # per timed call in progress, the time spent in the calls inside it
+        self.stats: GameStats = GameStats() # games, turns, reshuffles and bully chains
+        self.wrongUnoCalls: int = 0
+        self.redraws: int = 0 # starting cards that had to be redrawn, from Deck.redraw
+
+    def attach(self, game: 'Game') -> None:
+        """Instruments a game, before it is set up (players seated later are instrumented when they sit down)"""
+        game.draw = self.timed('draw', game.draw)
+        game.display_options = self.timed('render', game.display_options)
+        game.handle_bully_response = self.timed('bully', game.handle_bully_response)
+        game.run = self.timed('other', game.run)
+        seat_players: typing.Callable = game.seat_players
+
+        def instrument(player: 'Player') -> None:
+            phase: str = 'input' if isinstance(player, Human) else 'choose'
+            player.choose_move = self.timed(phase, player.choose_move)
+            player.pick_colour = self.timed(phase, player.pick_colour)
+
+        def seat_and_instrument(players: list) -> None:
+            seat_players(players)
+            for player in players:
+                instrument(player)
+        game.seat_players = seat_and_instrument
+        for player in game.players:
+            instrument(player)
+
+        self.stats.watch(game)
+        game.events.subscribe(self.uno_called, [UnoCalled])
+
+        def game_ended(event: GameEnded) -> None:
+            self.redraws += game.deck.redraws
+            game.events.unsubscribe(self.uno_called)
+            game.events.unsubscribe(game_ended)
+        game.events.subscribe(game_ended, [GameEnded])
+        return
+
+    def timed(self, phase: str, function: typing.Callable) -> typing.Callable:
+        """Wraps a function so that its time (minus the time of timed calls inside it) counts for a phase"""
+        clock: typing.Callable = time.perf_counter
+        nested: typing.List[float] = self.nested
+
+        def wrapper(*args, **kwargs):
+            start: float = clock()
+            nested.append(0.0)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed: float = clock() - start
+                self.seconds[phase] += elapsed - nested.pop()
+                self.calls[phase] += 1
+                if nested:
+                    nested[-1] += elapsed
+                if self.path and start >= self.nextExport:
+                    self.export()
+        return wrapper
+
+    def uno_called(self, event: UnoCalled) -> None:
+        if not event.correct:
+            self.wrongUnoCalls += 1
+
+    def snapshot(self) -> dict:
+        """Returns the timings and counters so far as a plain dict"""
+        turns: int = self.stats.turns
+        return {'time': time.time(),
+                'games': self.stats.games,
+                'turns': turns,
+                'seconds': self.seconds.copy(),
+                'calls': self.calls.copy(),
+                'secondsPerTurn': {phase: seconds / turns for phase, seconds in self.seconds.items()} if turns else {},
+                'reshuffles': self.stats.reshuffles,
+                'bullyChains': {length: count for length, count in enumerate(self.stats.bullyChains) if count},
+                'wrongUnoCalls': self.wrongUnoCalls,
+                'redraws': self.redraws}
+
+    def prometheus(self) -> str:
+        """Returns a snapshot in the Prometheus text exposition format"""
+        snapshot: dict = self.snapshot()
+        lines: typing.List[str] = []
+
+        def metric(name: str, help: str, samples: typing.List[tuple]) -> None:
+            lines.extend([f'# HELP uno_{name} {help}', f'# TYPE uno_{name} counter'])
+            lines.extend(f'uno_{name}{labels} {value}' for labels, value in samples)
+        metric('phase_seconds_total', 'Time spent in each phase of Game.run.',
+               [(f'{{phase="{phase}"}}', seconds) for phase, seconds in snapshot['seconds'].items()])
+        metric('phase_calls_total', 'Timed calls per phase of Game.run.',
+               [(f'{{phase="{phase}"}}', calls) for phase, calls in snapshot['calls'].items()])
+        metric('games_total', 'Games that ended.', [('', snapshot['games'])])
+        metric('turns_total', 'Turns played in games that ended.', [('', snapshot['turns'])])
+        metric('reshuffles_total', 'Times the pile was shuffled into a new deck.', [('', snapshot['reshuffles'])])
+        metric('bully_chains_total', 'Draw Two / Draw Four chains that ended in a draw, by number of cards in the chain.',
+               [(f'{{length="{length}"}}', count) for length, count in snapshot['bullyChains'].items()])
+        metric('wrong_uno_calls_total', 'Uno calls that were not allowed.', [('', snapshot['wrongUnoCalls'])])
+        metric('redraws_total', 'Starting cards that were put back because they were not a number.',
+               [('', snapshot['redraws'])])
+        return '\n'.join(lines) + '\n'
+
+    def export(self) -> None:
+        """Writes a snapshot to the file, replacing the previous one in one go so readers never see half a file"""
+        self.nextExport = time.perf_counter() + self.interval
+        if not self.path:
+            return
+        text: str = self.prometheus() if self.format == 'prometheus' else json.dumps(self.snapshot())
+        temporary: str = self.path + '.tmp'
+        with open(temporary, 'w') as file:
+            file.write(text)
+        os.replace(temporary, self.path)
+        return
@@ -0,0 +1,218 @@
+import sys
+import typing
+from card import Card, CARDS
+from bigvalue import Bigvalue
+from events import Event, AlreadyDone, CardPlayed, CardsDrawn, Passed, Skipped, UnoCalled, TimedOut, PlayerFinished
+
+class Renderer:
+    """Builds the screens of the terminal interface as strings. Every possible top card is rendered
+    once (the first time a Renderer is made) and a screen is written to the terminal in one go."""
+
+    frames: typing.List[str] = None # big top card per card id, shared by all instances
+    shortCards: typing.List[tuple] = None # (short colour, short value) per card id, shared by all instances
+
+    colourChars: dict = {'Black': '#',
+                         'Blue': '\033[0;34m' + 'B' + '\033[0m',
+                         'Red': '\033[0;31m' + 'R' + '\033[0m',
+                         'Yellow': '\033[0;33m' + 'Y' + '\033[0m',
+                         'Green': '\033[0;32m' + 'G' + '\033[0m'}
+    smallValues: dict = {'Reverse': '<', 'Skip': '>', 'Draw Four': '+', 'Draw Two': '+', 'Wild': 'W'}
+    shortColours: dict = {'Black': 'blk',
+                          'Blue': '\033[0;34m' + 'blu' + '\033[0m',
+                          'Yellow': '\033[0;33m' + 'ylw' + '\033[0m',
+                          'Red': '\033[0;31m' + 'red' + '\033[0m',
+                          'Green': '\033[0;32m' + 'grn' + '\033[0m'}
+    shortValues: dict = {'Reverse': 'rev', 'Skip': 'skp', 'Draw Two': '+ 2', 'Draw Four': '+ 4', 'Wild': 'wld'}
+
+    def __init__(self, out: typing.TextIO = None):
+        self.out: typing.TextIO = out # None means whatever sys.stdout is at the moment of writing
+        if Renderer.frames is None:
+            bigValueGetter: Bigvalue = Bigvalue()
+            Renderer.frames = [self.render_top_card(card, bigValueGetter) for card in CARDS]
+            Renderer.shortCards = [(self.shortColours[card.colour],
+                                    self.shortValues.get(card.value, f' {card.value} ')) for card in CARDS]
+
+    def write(self, screen: str) -> None:
+        """Sends a complete screen (or part of one) to the terminal with a single write"""
+        out: typing.TextIO = self.out or sys.stdout
+        out.write(screen)
+        out.flush()
+        return
+
+    def show_turn(self, topCard: Card, seat: int, hand: typing.List[Card], unoCalls: typing.List[int],
+                  private: bool = False) -> None:
+        """Shows the screen of a turn: who called Uno, the top card and the player's options
+        :param top card: :param player whose turn it is: :param their hand: :param players who called Uno:
+        :param whether the hand may only be shown after the player pressed Enter (when humans share the screen):"""
+        screen: str = '\n' * 18
+        for playerId in unoCalls:
+            screen += '-' * 64 + f'player {playerId} called Uno!\n\n'
+        screen += self.top_card(topCard)
+        screen += f'---player {seat}\'s turn---\n'
+        if private:
+            self.write(screen)
+            screen = ''
+            self.ask('Press Enter to view your options: ')
+        screen += self.options(hand)
+        self.write(screen) # one write for the whole screen
+        return
+
+    def log(self, text: str) -> None:
+        """Shows a line of the event log"""
+        self.write(text + '\n')
+        return
+
+    def say(self, text: str) -> None:
+        """Shows a message to the player"""
+        self.write(text + '\n')
+        return
+
+    def ask(self, prompt: str) -> str:
+        """Asks the player to type a line :param prompt: :return what they typed:"""
+        return input(prompt)
+
+    def top_card(self, card: Card) -> str:
+        """Returns the cached big picture of a top card, or nothing if there is no (real) card"""
+        if not isinstance(card, Card) or card.id < 0:
+            return ''
+        return self.frames[card.id]
+
+    def short_hand(self, hand: typing.List[Card]) -> typing.List[tuple]:
+        """Converts a hand to (short colour, short value) pairs, straight from the cache"""
+        shortCards: typing.List[tuple] = self.shortCards
+        return [shortCards[card.id] for card in hand]
+
+    def split_rows(self, items: list, rowsNeeded: int) -> typing.List[list]:
+        """Splits a hand into rows of (nearly) equal length, the first rows get the extra cards
+        (same split as numpy.array_split, without needing numpy)"""
+        size, extra = divmod(len(items), rowsNeeded)
+        rows: typing.List[list] = []
+        start: int = 0
+        for row in range(rowsNeeded):
+            end: int = start + size + (1 if row < extra else 0)
+            rows.append(items[start:end])
+            start = end
+        return rows
+
+    def hand(self, shortHand: typing.List[tuple], cardsDisplayed: int) -> str:
+        """Returns one row of a player's hand, with the option numbers below the cards"""
+        space: str = ' ' # needed to make faststrings work since f'{' ' * n}' is illegal
+        horizontalBound: str = ('+' + '-' * 5 + '+ ') * len(shortHand)
+        line1, line2, line3, optionLine = '', '', '', ''
+        for idx, card in enumerate(shortHand):
+            line1 += f'| {card[0]} | ' # the short colour
+            line2 += f'|     | '
+            line3 += f'| {card[1]} | ' # the short value
+            optionNumber: str = f'{cardsDisplayed + idx+1}' # gets the correct option nr. for every card
+            optionLine += f'   {optionNumber} {space * (3 - len(optionNumber))} '
+        return (horizontalBound + '\n' +
+                line1 + '\n' +
+                line2 + '\n' +
+                line3 + '\n' +
+                horizontalBound + '\n' +
+                optionLine + '\n\n')
+
+    def options(self, hand: typing.List[Card]) -> str:
+        """Returns a player's hand with an option number below every card (on as many rows as needed),
+        followed by the other options: Pass and Call Uno"""
+        screen: str = ''
+        cardsDisplayed: int = 0 # for making multiple lines work
+        shortHand: list = self.short_hand(hand)
+        rowsNeeded: int = 1 + len(hand) // 15 # only 14 cards fit in one row
+        for row in self.split_rows(shortHand, rowsNeeded):
+            screen += self.hand(row, cardsDisplayed)
+            cardsDisplayed += len(row)
+        return (screen + 'Other options:\n' +
+                f'{len(shortHand)+1} - Pass\n' +
+                f'{len(shortHand)+2} - Call Uno\n\n')
+
+    def render_top_card(self, card: Card, bigValueGetter: Bigvalue) -> str:
+        """Renders a single card with size 34 by 21 (ASCII characters), only used to fill the cache"""
+        char: str = self.colourChars[card.colour]
+        val: str = card.value if isinstance(card.value, int) else self.smallValues[card.value]
+        bigValue: list[str] = bigValueGetter(card.value)
+
+        line1: str = '|' + char * 15 + ' ' * 6 + char * 11 + '|'
+        line2: str = '|' + char * 11 + ' ' * 13 + char * 8 + '|'
+        line3: str = '|' + char * 9 + ' ' * 16 + char * 7 + '|'
+        line4: str = '|' + char * 7 + ' ' * 18 + char * 7 + '|'
+        line5: str = '|' + char * 6 + bigValue[0] + char * 6 + '|'
+        line6: str = '|' + char * 6 + bigValue[1] + char * 6 + '|'
+        line7: str = '|' + char * 6 + bigValue[2] + char * 6 + '|'
+        line8: str = '|' + char * 6 + ' ' * 20 + char * 6 + '|'
+        line9: str = '|' + char * 7 + ' ' * 18 + char * 7 + '|'
+        line10: str = '|' + char * 7 + ' ' * 16 + char * 9 + '|'
+        line11: str = '|' + char * 8 + ' ' * 13 + char * 11 + '|'
+        line12: str = '|' + char * 11 + ' ' * 6 + char * 15 + '|'
+
+        topLine: str = '  ' + '_' * 30 + '\n' + f' /{val}|' + char * 26 + f'|{val}\\'
+        almostFullLine: str = '|--' + char * 28 + '--|'
+        fullLine: str = '|' + char * 32 + '|'
+        bottomLine: str = f' \\{val}|' + char * 26 + f'|{val}/'
+
+        lines: typing.List[str] = [topLine, almostFullLine, fullLine, fullLine,
+                                   line1, line2, line3, line4, line5, line6, line7, line8, line9, line10, line11, line12,
+                                   fullLine, fullLine, almostFullLine, bottomLine + '\n']
+        return '\n'.join(lines) + '\n'
+
+
+class TerminalLog:
+    """Subscriber that prints game events to the right of the screen, the way the terminal game always has"""
+
+    def __init__(self, out: typing.TextIO = None):
+        self.out: typing.TextIO = out # None means whatever sys.stdout is at the moment of writing
+        self.formats: dict = {AlreadyDone: self.already_done, CardPlayed: self.card_played, CardsDrawn: self.cards_drawn,
+                              Passed: self.passed, Skipped: self.skipped, UnoCalled: self.uno_called,
+                              TimedOut: self.timed_out, PlayerFinished: self.player_finished} # event type -> method that formats it
+
+    def __call__(self, event: Event) -> None:
+        """Prints an event, if it is one that the terminal shows"""
+        message: str = self.format(event)
+        if message:
+            print(message, file=self.out or sys.stdout)
+        return
+
+    def format(self, event: Event) -> str:
+        """Returns the line the terminal shows for an event, or an empty string for events it does not show"""
+        formatter: typing.Callable = self.formats.get(type(event))
+        return formatter(event) if formatter else ''
+
+    @staticmethod
+    def unpadded(text: str) -> typing.List[str]:
+        """Splits what the terminal shows for an event into lines, without the padding that puts them on the right"""
+        return [line[64:] if line.startswith('-' * 64) else line.rstrip() for line in text.split('\n') if line.strip()]
+
+    def already_done(self, event: AlreadyDone) -> str:
+        return '-' * 64 + f'player {event.playerId} is already done'
+
+    def card_played(self, event: CardPlayed) -> str:
+        return '-' * 64 + f'player {event.playerId} played {event.card}'
+
+    def cards_drawn(self, event: CardsDrawn) -> str:
+        if event.reason == 'stuck':
+            return '-' * 64 + f'player {event.playerId} could not play'
+        elif event.reason == 'bully':
+            return '-' * 64 + f'player {event.playerId} had to draw {event.count} cards'
+        elif event.reason == 'uno':
+            return '-' * 64 + f'player {event.playerId} did not call uno and has to draw {event.count} cards'
+        return '' # a wrong uno call was already announced by UnoCalled, a timeout by TimedOut
+
+    def passed(self, event: Passed) -> str:
+        return '-' * 64 + f'player {event.playerId} passed'
+
+    def skipped(self, event: Skipped) -> str:
+        return '-' * 64 + f'player {event.playerId} was skipped'
+
+    def uno_called(self, event: UnoCalled) -> str:
+        if event.correct:
+            return '-' * 64 + f'player {event.playerId} called uno correctly'
+        return '-' * 64 + f'player {event.playerId} called uno incorrectly and has to draw 3 cards'
+
+    def timed_out(self, event: TimedOut) -> str:
+        fallbacks: dict = {'pass': 'passes', 'draw': 'draws a card', 'computer': 'is played by the computer'}
+        return '-' * 64 + f'player {event.playerId} ran out of time and {fallbacks[event.fallback]}'
+
+    def player_finished(self, event: PlayerFinished) -> str:
+        return ('\n|-_-_-_-_-_-_-_-_-_-_-_-|'+
+                f'\n |Player {event.playerId} is number {event.place}!|'+
+                '\n|-_-_-_-_-_-_-_-_-_-_-_-|\n')
@@ -0,0 +1,27 @@
+import typing
+
+class Result:
+    """Structured outcome of a single (headless) game"""
+
+    def __init__(self, placings: typing.List[int], turns: int, cardsDrawn: typing.List[int], completed: bool = True,
+                 seed: int = None, finished: int = None):
+        self.placings: typing.List[int] = placings # player ids in finishing order, the loser(s) last
+        self.turns: int = turns # number of turns that were actually played
+        self.cardsDrawn: typing.List[int] = cardsDrawn # cards drawn per player, index is player id - 1
+        self.completed: bool = completed # False when the game was cut off by a turn limit
+        self.seed: int = seed # Game(seed=seed) plays this very game again
+        # players that emptied their hand, the first ones in placings (the others are in seat order)
+        self.finished: int = finished if finished is not None else (len(placings) - 1 if completed else 0)
+
+    def __str__(self) -> str:
+        """Converts the object to a String representation"""
+        return f'Result(placings={self.placings}, turns={self.turns}, cardsDrawn={self.cardsDrawn})'
+
+    def winner(self) -> int:
+        """Returns the id of the player that finished first, 0 when the game was cut off before anybody finished"""
+        return self.placings[0] if self.finished else 0
+
+    def to_dict(self) -> dict:
+        """Returns a plain dict, handy for json dumps or pickling across processes"""
+        return {'placings': self.placings, 'turns': self.turns,
+                'cardsDrawn': self.cardsDrawn, 'completed': self.completed, 'seed': self.seed, 'finished': self.finished}
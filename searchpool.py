@@ -0,0 +1,165 @@
+"""Persistent worker processes for search-based bots, so that one decision can use every core.
+
+Every decision is split into one independent search per process (root parallelisation): the bot's
+own process searches as well, each worker gets the root state (packed, see GameState.pack) and a seed of
+its own, and only the statistics of the root moves come back to be added up. The workers are started
+and warmed up once, when the pool is made, so a decision does not pay for starting processes or imports.
+
+    with SearchPool() as pool:
+        Game(headless=True).simulate(strategies=[lambda id: MCTSComputer(id, pool=pool), Computer, Computer])
+
+A pool is shared by any number of bots in the same process, as long as they do not search at the same time
+(awaited searches, in games on an event loop, wait for each other).
+"""
+import asyncio
+import multiprocessing
+import multiprocessing.connection
+import os
+import random
+import time
+import typing
+from gamestate import GameState
+from mcts import MCTSComputer, root_stats, merge_stats
+
+class SearchPool:
+    """A fixed set of worker processes that each run a part of every search"""
+
+    def __init__(self, workers: int = None):
+        """Starts and warms up the workers :param number of worker processes, one less than the cores by default:"""
+        self.workers: int = max((os.cpu_count() or 1) - 1, 0) if workers is None else workers
+        self.connections: typing.List[multiprocessing.connection.Connection] = []
+        self.processes: typing.List[multiprocessing.Process] = []
+        for _ in range(self.workers):
+            connection, workerConnection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=serve, args=(workerConnection,), daemon=True)
+            process.start()
+            workerConnection.close()
+            self.connections.append(connection)
+            self.processes.append(process)
+        self.outstanding: typing.List[multiprocessing.connection.Connection] = [] # workers whose answer was not read yet
+        self.lock: asyncio.Lock = None # one awaited search at a time, made on the event loop that needs it
+        self.lockLoop: asyncio.AbstractEventLoop = None
+        self.ping() # waits for the warm-up
+        self.overhead: float = 2 * self.ping() # seconds to hand out a search and collect it, with a margin
+
+    def __enter__(self) -> 'SearchPool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+        return
+
+    def ping(self) -> float:
+        """Waits until every worker is ready (the first time that includes its imports and warm-up)
+        :return seconds for the slowest round trip:"""
+        start: float = time.perf_counter()
+        for connection in self.connections:
+            connection.send(())
+        for connection in self.connections:
+            connection.recv()
+        return time.perf_counter() - start
+
+    def search(self, player: MCTSComputer, root: GameState) -> typing.Dict[int, typing.List[float]]:
+        """Runs a search for a player on every worker and in this process, within the player's budget.
+        A rollout budget is divided over the processes, a time limit is shortened by the measured overhead
+        :param player: :param state in which the player has to choose: :return move -> [visits, summed reward]:"""
+        timeLimit, rollouts = self.hand_out(player, root)
+        stats: typing.Dict[int, typing.List[float]] = root_stats(player.grow(root, timeLimit, rollouts, player.searchRng))
+        while self.outstanding:
+            merge_stats(stats, self.outstanding.pop().recv())
+        return stats
+
+    async def search_async(self, player: MCTSComputer, root: GameState) -> typing.Dict[int, typing.List[float]]:
+        """search for games on an event loop: this process searches in slices (see MCTSComputer.grow_async) and
+        the workers' answers are awaited, one search at a time however many games share the pool. A search that is
+        cancelled (at the deadline of a turn) leaves its answers behind, they are thrown away by the next search
+        :param player: :param state in which the player has to choose: :return move -> [visits, summed reward]:"""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self.lock is None or self.lockLoop is not loop:
+            self.lock, self.lockLoop = asyncio.Lock(), loop
+        async with self.lock:
+            await self.drain_async()
+            timeLimit, rollouts = self.hand_out(player, root)
+            stats: typing.Dict[int, typing.List[float]] = root_stats(await player.grow_async(root, timeLimit, rollouts))
+            while self.outstanding:
+                await self.readable(self.outstanding[-1])
+                merge_stats(stats, self.outstanding.pop().recv())
+        return stats
+
+    async def drain_async(self) -> None:
+        """Throws away what is left of a search that was cancelled, awaiting the workers that are still
+        searching instead of blocking the event loop until they are done"""
+        while self.outstanding:
+            await self.readable(self.outstanding[-1])
+            self.outstanding.pop().recv()
+        return
+
+    @staticmethod
+    async def readable(connection: multiprocessing.connection.Connection) -> None:
+        """Waits on the running event loop until a worker's answer can be read without blocking"""
+        if connection.poll():
+            return
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        ready: asyncio.Future = loop.create_future()
+        loop.add_reader(connection.fileno(), lambda: ready.done() or ready.set_result(None))
+        try:
+            await ready
+        finally:
+            loop.remove_reader(connection.fileno())
+        return
+
+    def hand_out(self, player: MCTSComputer, root: GameState) -> typing.Tuple[float, int]:
+        """Sends every worker its part of a search, after reading what is left of a search that was cancelled
+        (awaited searches have done that with drain_async already, so the event loop is not blocked here)
+        :return tuple(time limit, rollouts) of each part, the part of this process included:"""
+        while self.outstanding:
+            self.outstanding.pop().recv()
+        shares: int = self.workers + 1
+        rollouts: int = -(-player.rollouts // shares) # rounded up, 0 stays 0
+        timeLimit: float = max(player.timeLimit - self.overhead, player.timeLimit / 2) if player.timeLimit else 0.0
+        task: tuple = (root.pack(), player.id, timeLimit, rollouts, player.depth, player.exploration)
+        for connection in self.connections:
+            connection.send(task + (player.searchRng.getrandbits(64),))
+        self.outstanding = self.connections.copy()
+        return timeLimit, rollouts
+
+    def close(self) -> None:
+        """Stops the workers"""
+        for connection in self.connections:
+            connection.send(None)
+            connection.close()
+        for process in self.processes:
+            process.join()
+        self.connections, self.processes, self.outstanding = [], [], []
+        return
+
+
+def serve(connection: 'multiprocessing.connection.Connection') -> None:
+    """Worker loop: answers searches until it gets None, an empty task is a ping
+    :param this worker's end of the pipe:"""
+    warm_up()
+    while True:
+        task: tuple = connection.recv()
+        if task is None:
+            break
+        if not task:
+            connection.send(())
+            continue
+        packed, seat, timeLimit, rollouts, depth, exploration, seed = task
+        searcher = MCTSComputer(seat, timeLimit, rollouts, depth, exploration)
+        rng = random.Random(seed)
+        connection.send(root_stats(searcher.grow(GameState.unpack(packed, rng), timeLimit, rollouts, rng)))
+    connection.close()
+    return
+
+
+def warm_up() -> None:
+    """Runs a small search, so the first real one does not pay for the first use of the code"""
+    from game import Game
+    from player import Computer
+
+    game = Game(headless=True, seed=0)
+    game.setup(players=[Computer(1), Computer(2), Computer(3)])
+    searcher = MCTSComputer(1, timeLimit=0, rollouts=20)
+    searcher.grow(GameState.from_game(game, 1), 0, 20, random.Random(0))
+    return
@@ -0,0 +1,240 @@
+"""Game server: any number of tables in one process, with one asyncio task per running game, over TCP or a
+Unix socket. Every message is one json object on one line.
+
+    client -> server
+        {"type": "join", "table": "office", "seats": 4, "humans": 2}   first message, table/seats/humans optional
+        {"type": "play", "card": 17, "colour": "Red"}                   card id, colour only for black cards
+        {"type": "pass"}
+        {"type": "uno"}                                                  then play, like option n+2 in the terminal
+        {"type": "watch", "table": "office"}                             first message of a spectator instead of join
+    server -> client
+        {"type": "joined", "table": ..., "seat": ..., "seats": ..., "humans": ...}
+        {"type": "turn", "seat": ..., "top": ..., "hand": [...], "valid": [...], ...}   see RemotePlayer.turn_message
+        {"type": "log", "text": ...}                                     what the terminal game prints, per event
+        {"type": "error", "text": ...}
+        {"type": "end", "placings": [...], "turns": ..., "completed": ..., "finished": ...}
+    server -> spectator
+        {"type": "frame", "turn": ..., "seat": ..., "top": ..., "hands": [...], ...}   see Spectator.frame
+
+A table starts as soon as its human seats are taken, the other seats are played by bots. Players that join
+a table by the same name sit at the same table (the first one decides the number of seats), and once it has
+started the name is free for the next table. Spectators can watch a table by its name, whether it is still
+waiting or already playing; every turn they get the public state of the game (see spectator.py), and a
+spectator that falls behind loses frames instead of slowing the table down.
+Run with: python server.py [--port 7777 | --unix PATH]
+"""
+import argparse
+import asyncio
+import json
+import typing
+from asyncgame import AsyncGame, RemotePlayer
+from player import Player, Computer
+from renderer import TerminalLog
+from spectator import Spectator, StreamViewer
+from tournament import STRATEGIES, game_seed
+
+class Table:
+    """Players waiting for a game to start"""
+
+    def __init__(self, name: str, seats: int, humans: int):
+        self.name: str = name
+        self.seats: int = seats # players in the game
+        self.humans: int = humans # remote players needed to start, the other seats are bots
+        self.players: typing.List[RemotePlayer] = [] # in seat order
+        self.spectator: Spectator = Spectator() # watches the game once it starts, spectators can join before
+
+class GameServer:
+    """Seats connections at tables and runs the games, all in one event loop"""
+
+    def __init__(self, bot: type = Computer, botDelay: float = 0.0, seed: int = None, maxTurns: int = 10000,
+                 turnTimeout: float = 0.0, fallback: str = 'pass'):
+        """:param Player subclass that fills the empty seats: :param seconds a bot waits before it moves:
+        :param base seed, games are then seeded by their number (see tournament.game_seed), None for random games:
+        :param turn limit per game: :param seconds per decision, 0 for no limit: :param fallback when time runs out,
+        see AsyncGame:"""
+        self.bot: type = bot
+        self.botDelay: float = botDelay
+        self.turnTimeout: float = turnTimeout
+        self.fallback: str = fallback
+        self.seed: int = seed
+        self.maxTurns: int = maxTurns
+        self.tables: typing.Dict[str, Table] = {} # tables that are waiting for players, by name
+        self.watched: typing.Dict[str, Spectator] = {} # spectators of the games in progress, by table name
+        self.running: typing.Set[asyncio.Task] = set() # one task per game in progress
+        self.started: int = 0 # games started so far
+        self.finished: int = 0 # games ended so far
+        self.log: TerminalLog = TerminalLog() # only used to format events
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 7777, path: str = None,
+                    backlog: int = 4096) -> asyncio.AbstractServer:
+        """Starts listening on a TCP port, or on a Unix socket when a path is given
+        :param host: :param port: :param path: :param connections that can wait to be accepted (asyncio's default is 100,
+        too few when a whole tournament connects at once): :return the asyncio server:"""
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path, backlog=backlog)
+        return await asyncio.start_server(self.handle, host, port, backlog=backlog)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serves one connection: the first message joins a table, all later ones go to the player's seat"""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        pending: typing.List[bytes] = [] # messages of this turn of the event loop, written together
+
+        def flush() -> None:
+            if pending and not writer.is_closing():
+                writer.write(b''.join(pending))
+            pending.clear()
+
+        def send(message: dict) -> None:
+            if not pending:
+                loop.call_soon(flush)
+            pending.append(json.dumps(message).encode() + b'\n')
+
+        def close() -> None:
+            flush()
+            writer.close()
+
+        player: RemotePlayer = None
+        viewer: StreamViewer = None
+        try:
+            async for line in reader:
+                try:
+                    message: dict = json.loads(line)
+                except ValueError:
+                    send({'type': 'error', 'text': 'every message has to be one json object per line'})
+                    continue
+                if player is not None:
+                    player.receive(message)
+                elif viewer is not None: # spectators only listen
+                    continue
+                elif message.get('type') == 'join':
+                    player = self.join(message, send, close)
+                elif message.get('type') == 'watch':
+                    viewer = self.watch(message, writer, send)
+                else:
+                    send({'type': 'error', 'text': 'join a table first'})
+        except (ConnectionError, ValueError): # hung up, or sent a line that is too long
+            pass
+        finally:
+            if player is not None:
+                self.leave(player)
+            close()
+        return
+
+    def join(self, message: dict, send: typing.Callable[[dict], None], close: typing.Callable[[], None]) -> RemotePlayer:
+        """Seats a connection at the table it asked for, and starts the game once the table is full
+        :param join message: :param function that sends to the connection: :param function that closes it:
+        :return player, or None when the table cannot be joined:"""
+        try:
+            seats: int = int(message.get('seats', 4))
+            humans: int = int(message.get('humans', 1))
+        except (TypeError, ValueError):
+            seats, humans = 0, 0
+        if not (2 <= seats <= 10 and 1 <= humans <= seats):
+            send({'type': 'error', 'text': 'a table has 2 to 10 seats and 1 human player or more'})
+            return None
+        name: str = str(message.get('table') or f'{seats}-{humans}')
+        table: Table = self.tables.setdefault(name, Table(name, seats, humans))
+        player = RemotePlayer(len(table.players) + 1, send, close)
+        table.players.append(player)
+        send({'type': 'joined', 'table': name, 'seat': player.id, 'seats': table.seats, 'humans': table.humans})
+        if len(table.players) == table.humans:
+            self.start(table)
+        return player
+
+    def watch(self, message: dict, writer: asyncio.StreamWriter, send: typing.Callable[[dict], None]) -> StreamViewer:
+        """Lets a connection watch a table, waiting or playing, it is forgotten once it hangs up
+        :param watch message: :param the connection: :param function that sends to it:
+        :return viewer, or None when there is no such table:"""
+        name: str = str(message.get('table'))
+        spectator: Spectator = self.tables[name].spectator if name in self.tables else self.watched.get(name)
+        if spectator is None:
+            send({'type': 'error', 'text': f'there is no table {name} to watch'})
+            return None
+        viewer = StreamViewer(writer)
+        spectator.add(viewer)
+        return viewer
+
+    def leave(self, player: RemotePlayer) -> None:
+        """A connection is gone: it gives up its seat at a waiting table, or a bot takes over in a running game"""
+        for table in self.tables.values():
+            if player in table.players:
+                table.players.remove(player)
+                for seat, waiting in enumerate(table.players, start=1):
+                    waiting.id = seat
+                if not table.players:
+                    del self.tables[table.name]
+                return
+        player.disconnect()
+        return
+
+    def start(self, table: Table) -> None:
+        """Fills the other seats with bots and runs the game in a task of its own"""
+        del self.tables[table.name]
+        game = AsyncGame(headless=True, seed=None if self.seed is None else game_seed(self.seed, self.started),
+                         botDelay=self.botDelay, turnTimeout=self.turnTimeout, fallback=self.fallback)
+        game.maxTurns = self.maxTurns
+        bots: typing.List[Player] = [self.bot(id = seat) for seat in range(table.humans + 1, table.seats + 1)]
+        game.setup(players=table.players + bots)
+        humans: typing.List[RemotePlayer] = table.players
+
+        def broadcast(event) -> None:
+            text: str = self.log.format(event)
+            if text:
+                for player in humans:
+                    player.send({'type': 'log', 'text': text})
+        game.events.subscribe(broadcast)
+        table.spectator.watch(game)
+        self.watched[table.name] = table.spectator
+
+        self.started += 1
+        task: asyncio.Task = asyncio.get_running_loop().create_task(self.play(game, humans, table))
+        self.running.add(task)
+        task.add_done_callback(self.running.discard)
+        return
+
+    async def play(self, game: AsyncGame, humans: typing.List[RemotePlayer], table: Table) -> None:
+        """Runs a game to the end and tells the players how it went, then hangs up on them and the spectators"""
+        try:
+            await game.run_async()
+            result = game.result()
+            for player in humans:
+                player.send({'type': 'end', 'placings': result.placings, 'turns': result.turns,
+                             'completed': result.completed, 'finished': result.finished})
+        finally:
+            self.finished += 1
+            for player in humans:
+                player.close()
+            table.spectator.close()
+            if self.watched.get(table.name) is table.spectator: # the name can be in use by a newer game
+                del self.watched[table.name]
+        return
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Hosts Uno tables for clients that connect over TCP or a Unix socket')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    parser.add_argument('--port', type=int, default=7777, help='TCP port to listen on')
+    parser.add_argument('--unix', default=None, metavar='PATH', help='listen on a Unix socket instead of TCP')
+    parser.add_argument('--bots', default='random', choices=list(STRATEGIES), help='strategy of the bots in empty seats')
+    parser.add_argument('--bot-delay', type=float, default=0.5, help='seconds a bot waits before it moves')
+    parser.add_argument('--seed', type=int, default=None, help='base seed, for games that can be replayed')
+    parser.add_argument('--turn-timeout', type=float, default=0.0, help='seconds per decision, 0 for no limit')
+    parser.add_argument('--fallback', default='pass', choices=AsyncGame.FALLBACKS, help='what happens when time runs out')
+    args = parser.parse_args()
+
+    async def run() -> None:
+        server = GameServer(STRATEGIES[args.bots], args.bot_delay, args.seed, turnTimeout=args.turn_timeout,
+                            fallback=args.fallback)
+        listener: asyncio.AbstractServer = await server.serve(args.host, args.port, args.unix)
+        print(f'serving on {args.unix or f"{args.host}:{args.port}"}')
+        async with listener:
+            await listener.serve_forever()
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,249 @@
+"""Spectators: at the start of every turn the public state of a game (top card, number of cards per player,
+Uno calls, placings and what happened during the turn before, never the cards in anybody's hand) is put in a
+frame, which goes out to any number of viewers: files, other terminals and connections of the game server
+(server.py, {"type": "watch"}).
+
+A frame is encoded at most once per format, however many viewers there are: 'text' (the screen of a spectator,
+the same for everybody) and 'json' (one line, for remote viewers that draw it themselves with screen()). All
+viewers get the same bytes through a hand-off that never waits, so the cost of a turn stays the same when more
+viewers watch, and a viewer that cannot keep up loses frames (counted in dropped) instead of stalling the game.
+
+    spectator = Spectator()
+    spectator.add(FileViewer('/dev/pts/3')) # another terminal, a file or a pipe
+    spectator.watch(game) # before the game is run
+    game.start()
+    spectator.close()
+"""
+import json
+import queue
+import threading
+import time
+import typing
+from card import CARDS
+from events import TurnStarted, GameEnded
+from renderer import Renderer, TerminalLog
+
+KINDS: typing.Tuple[str, ...] = ('text', 'json') # formats a frame can be encoded in
+
+class Frame:
+    """The public state of a game at the start of a turn (or at its end), encoded once per format"""
+
+    def __init__(self, state: dict, renderer: Renderer):
+        self.state: dict = state # also the json message of the game server, see Spectator.frame
+        self.renderer: Renderer = renderer
+        self.encoded: typing.Dict[str, bytes] = {} # format -> bytes, shared by all viewers of that format
+
+    def encode(self, kind: str) -> bytes:
+        """:param 'text' or 'json': :return the frame in that format, encoded the first time it is asked for:"""
+        data: bytes = self.encoded.get(kind)
+        if data is None:
+            data = (json.dumps(self.state) + '\n' if kind == 'json' else screen(self.state, self.renderer)).encode()
+            self.encoded[kind] = data
+        return data
+
+
+def screen(state: dict, renderer: Renderer) -> str:
+    """Draws a frame the way spectators see it: what happened, who called Uno, the top card and how many
+    cards every player holds :param state of a frame: :param renderer with the cached top cards: :return screen:"""
+    text: str = '\n' * 18
+    for line in state['events']:
+        text += line + '\n'
+    text += '\n'
+    for playerId in state['uno']:
+        text += '-' * 64 + f'player {playerId} called Uno!\n\n'
+    text += renderer.top_card(CARDS[state['top']])
+    if state['over']:
+        text += f'---the game is over after {state["turn"]} turns---\n'
+    else:
+        text += f'---turn {state["turn"]}, player {state["seat"]}\'s turn---\n'
+    places: typing.Dict[int, int] = {seat: place for place, seat in enumerate(state['placings'], start=1)}
+    for seat, cards in enumerate(state['hands'], start=1):
+        marker: str = '>' if seat == state['seat'] else ' '
+        status: str = f'number {places[seat]}' if seat in places else f'{cards} card{"" if cards == 1 else "s"}'
+        text += f'{marker} player {seat}: {status}\n'
+    return text
+
+
+class Viewer:
+    """Somewhere frames go, in one format"""
+
+    def __init__(self, kind: str = 'text'):
+        if kind not in KINDS:
+            raise ValueError(f'a viewer takes one of the formats {", ".join(KINDS)}')
+        self.kind: str = kind
+        self.sent: int = 0 # frames that went out
+        self.dropped: int = 0 # frames that were skipped because the viewer was behind
+        self.closed: bool = False
+
+    def offer(self, frame: Frame) -> bool:
+        """Overwritten by child classes: hands a frame over without waiting for the viewer
+        :return False once the viewer is gone:"""
+        return not self.closed
+
+    def close(self) -> None:
+        self.closed = True
+        return
+
+
+class FileViewer(Viewer):
+    """Writes frames to a file, a pipe or another terminal from a thread of its own, so a slow reader
+    only holds up that thread: frames that do not fit in the backlog are dropped"""
+
+    def __init__(self, file: typing.Union[str, typing.BinaryIO], kind: str = 'text', backlog: int = 8):
+        """:param path, or a file opened for writing bytes: :param 'text' or 'json': :param frames that can wait:"""
+        super().__init__(kind)
+        self.owned: bool = isinstance(file, str) # files that were opened here are closed here
+        self.file: typing.BinaryIO = open(file, 'wb') if self.owned else file
+        self.backlog: queue.Queue = queue.Queue(backlog)
+        self.writer: threading.Thread = threading.Thread(target=self.write, daemon=True)
+        self.writer.start()
+
+    def offer(self, frame: Frame) -> bool:
+        if self.closed:
+            return False
+        try:
+            self.backlog.put_nowait(frame.encode(self.kind))
+        except queue.Full:
+            self.dropped += 1
+        return True
+
+    def write(self) -> None:
+        """Writes frames until close() sends None"""
+        while True:
+            data: bytes = self.backlog.get()
+            if data is None:
+                break
+            try:
+                self.file.write(data)
+                self.file.flush()
+            except (OSError, ValueError): # the reader went away, or the file was closed
+                self.closed = True
+                break
+            self.sent += 1
+        return
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Writes the frames that are waiting and closes the file
+        :param seconds to wait for a reader that is stuck, its thread is left behind after that:"""
+        deadline: float = time.monotonic() + timeout
+        while self.writer.is_alive() and time.monotonic() < deadline:
+            try:
+                self.backlog.put(None, timeout=0.05)
+                break
+            except queue.Full:
+                continue
+        self.writer.join(max(0.0, deadline - time.monotonic()))
+        super().close()
+        if self.owned:
+            self.file.close()
+        return
+
+
+class StreamViewer(Viewer):
+    """Sends frames to an asyncio connection: asyncio buffers what the socket cannot take yet,
+    and while more than limit bytes are waiting in that buffer new frames are dropped"""
+
+    def __init__(self, writer: 'asyncio.StreamWriter', kind: str = 'json', limit: int = 65536):
+        super().__init__(kind)
+        self.writer: 'asyncio.StreamWriter' = writer # only its own methods are used, so asyncio is not imported here
+        self.limit: int = limit # bytes
+
+    def offer(self, frame: Frame) -> bool:
+        if self.closed or self.writer.is_closing():
+            self.closed = True
+            return False
+        if self.writer.transport.get_write_buffer_size() > self.limit:
+            self.dropped += 1
+        else:
+            self.writer.write(frame.encode(self.kind))
+            self.sent += 1
+        return True
+
+    def close(self) -> None:
+        super().close()
+        self.writer.close()
+        return
+
+
+class Spectator:
+    """Subscriber that makes a frame of a game's public state every turn and hands it to all viewers"""
+
+    def __init__(self):
+        self.renderer: Renderer = Renderer() # only used to draw text frames, with the cached top cards
+        self.log: TerminalLog = TerminalLog() # only used to format events
+        self.viewers: typing.List[Viewer] = []
+        self.game: 'Game' = None
+        self.events: typing.List[str] = [] # lines of what happened since the last frame
+        self.last: Frame = None # the latest frame, the first one a new viewer gets
+        self.frames: int = 0 # frames made so far
+
+    def watch(self, game: 'Game') -> None:
+        """Subscribes to a game's events, call before the game is run"""
+        self.game = game
+        game.events.subscribe(self.happened, list(self.log.formats))
+        game.events.subscribe(self.turn_started, [TurnStarted])
+        game.events.subscribe(self.game_ended, [GameEnded])
+        return
+
+    def add(self, viewer: Viewer) -> None:
+        """Lets a viewer watch from the latest frame on"""
+        self.viewers.append(viewer)
+        if self.last is not None:
+            viewer.offer(self.last)
+        return
+
+    def remove(self, viewer: Viewer) -> None:
+        if viewer in self.viewers:
+            self.viewers.remove(viewer)
+        return
+
+    def happened(self, event) -> None:
+        text: str = self.log.format(event)
+        if text:
+            self.events += TerminalLog.unpadded(text)
+        return
+
+    def turn_started(self, event: TurnStarted) -> None:
+        self.publish(self.frame(event.playerId))
+        return
+
+    def game_ended(self, event: GameEnded) -> None:
+        self.publish(self.frame(0, event.result))
+        return
+
+    def frame(self, seat: int, result: 'Result' = None) -> Frame:
+        """Takes a picture of the public state of the game :param player whose turn starts:
+        :param result of the game, once it is over: :return frame:"""
+        game: 'Game' = self.game
+        state: dict = {'type': 'frame',
+                       'turn': game.turns,
+                       'seat': seat,
+                       'top': game.currentCard.id,
+                       'hands': [len(player.hand) for player in game.players], # the number of cards, never the cards
+                       'uno': [player.id for player in game.players if player.calledUno],
+                       'placings': result.placings[:result.finished] if result else list(game.placings), # only finishers
+                       'direction': game.direction,
+                       'deck': len(game.deck.cardDeck),
+                       'events': self.events,
+                       'over': result is not None}
+        self.events = []
+        self.frames += 1
+        return Frame(state, self.renderer)
+
+    def publish(self, frame: Frame) -> None:
+        """Hands a frame to every viewer, and forgets viewers that are gone"""
+        self.last = frame
+        gone: typing.List[Viewer] = []
+        for viewer in self.viewers:
+            if not viewer.offer(frame):
+                gone.append(viewer)
+        for viewer in gone:
+            self.viewers.remove(viewer)
+        return
+
+    def close(self) -> None:
+        """Closes all viewers, after the frames they are waiting for"""
+        for viewer in self.viewers:
+            viewer.close()
+        self.viewers = []
+        return
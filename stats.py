@@ -0,0 +1,197 @@
+"""Streaming statistics over many games: how often every card is played, game length, win rate per seat,
+the length of +2 / +4 chains and how often the pile has to be reshuffled into a new deck.
+
+GameStats can be fed live (watch a game's events) or from a game log (add_records, in chunks of any size).
+It only keeps counters, so memory does not grow with the number of games, and GameStats objects made
+in different processes or on different machines can be merged without going back to the raw games.
+
+Run on a log file with: python stats.py games.log [--chunk N] [--json]
+"""
+import argparse
+import json
+import typing
+from card import CARDS, NUM_CARDS, DRAW_TWO, DRAW_FOUR
+from events import CardPlayed, CardsDrawn, Reshuffled, GameEnded
+import gamelog
+
+BULLY_CARD_IDS: typing.List[int] = [card.id for card in CARDS if card.valueCode in (DRAW_TWO, DRAW_FOUR)]
+
+
+def add(counts: typing.List[int], idx: int, count: int) -> None:
+    """Adds to a growing list of counters :param list: :param index: :param amount:"""
+    if idx >= len(counts):
+        counts.extend([0] * (idx + 1 - len(counts)))
+    counts[idx] += count
+    return
+
+
+class GameStats:
+    """Mergeable counters over any number of games"""
+
+    def __init__(self):
+        self.games: int = 0
+        self.completed: int = 0 # games that ended before the turn limit
+        self.turns: int = 0 # summed over all games
+        self.turnsSquared: int = 0 # summed over all games, for the spread of the game length
+        self.cardPlays: typing.List[int] = [0] * NUM_CARDS # per card id
+        self.wins: typing.List[int] = [] # per seat, index is player id - 1, grows with the largest table seen
+        self.bullyChains: typing.List[int] = [] # number of +2 / +4 chains per chain length (in cards), grows as needed
+        self.bullyCards: int = 0 # cards drawn because of a chain, summed over all games
+        self.reshuffles: int = 0 # summed over all games
+        self.carry: int = 0 # bully cards played since the last chain was drawn, while reading a log in chunks
+
+    def watch(self, game: 'Game') -> None:
+        """Counts a game as it is being played, call before the game is run :param game:"""
+        StatsRecorder(self, game)
+        return
+
+    def add_game(self, turns: int, winner: int, completed: bool) -> None:
+        """Counts the end of one game :param no. turns: :param winner's id, 0 for none: :param completed or cut off:"""
+        self.games += 1
+        self.completed += completed
+        self.turns += turns
+        self.turnsSquared += turns * turns
+        if winner:
+            add(self.wins, winner-1, 1)
+        return
+
+    def add_chain(self, length: int, cards: int) -> None:
+        """Counts one +2 / +4 chain that ended with a player drawing :param no. cards in chain: :param cards drawn:"""
+        add(self.bullyChains, length, 1)
+        self.bullyCards += cards
+        return
+
+    def add_records(self, records: 'numpy.ndarray') -> None:
+        """Counts a chunk of game log records (see gamelog.py), chunks have to be added in the order of the log,
+        and the records of one game have to be contiguous, which is how GameLogWriter writes them
+        when games are played one after the other :param structured array of records:"""
+        import numpy as np # only needed for logs, keeps numpy out of the game's imports
+
+        action: np.ndarray = records['action']
+        card: np.ndarray = records['card']
+        played: np.ndarray = action == gamelog.PLAYED
+        self.add_counts(self.cardPlays, np.bincount(card[played], minlength=256)[:NUM_CARDS])
+
+        ended: np.ndarray = action == gamelog.ENDED
+        self.games += int(ended.sum())
+        self.completed += int(records['count'][ended].sum())
+        turns: np.ndarray = records['turn'][ended].astype(np.int64)
+        self.turns += int(turns.sum())
+        self.turnsSquared += int((turns * turns).sum())
+        winners: np.ndarray = records['seat'][ended].astype(np.int64)
+        self.add_counts(self.wins, np.bincount(winners[winners > 0] - 1)) # seat 0: nobody finished
+        self.reshuffles += int((action == gamelog.RESHUFFLED).sum())
+
+        # a chain is every +2 / +4 played since the previous chain was drawn (or the previous game ended)
+        bullyPlays: np.ndarray = np.cumsum(played & np.isin(card, BULLY_CARD_IDS))
+        drawn: np.ndarray = action == gamelog.DRAWN_BULLY
+        resets: np.ndarray = np.flatnonzero(drawn | ended)
+        if resets.size:
+            before: np.ndarray = bullyPlays[resets]
+            lengths: np.ndarray = before - np.concatenate(([0], before[:-1]))
+            lengths[0] += self.carry
+            self.add_counts(self.bullyChains, np.bincount(lengths[drawn[resets]]))
+            self.carry = int(bullyPlays[-1] - before[-1])
+        elif len(records):
+            self.carry += int(bullyPlays[-1])
+        self.bullyCards += int(records['count'][drawn].sum())
+        return
+
+    def add_counts(self, counts: typing.List[int], extra: typing.Iterable[int]) -> None:
+        """Adds counts (numpy or not) to a list of counters element-wise, the list grows when needed"""
+        for idx, count in enumerate(extra):
+            if count:
+                add(counts, idx, int(count))
+        return
+
+    def merge(self, other: 'GameStats') -> None:
+        """Adds the counts of another GameStats to this one :param other stats:"""
+        self.games += other.games
+        self.completed += other.completed
+        self.turns += other.turns
+        self.turnsSquared += other.turnsSquared
+        self.bullyCards += other.bullyCards
+        self.reshuffles += other.reshuffles
+        self.add_counts(self.cardPlays, other.cardPlays)
+        self.add_counts(self.wins, other.wins)
+        self.add_counts(self.bullyChains, other.bullyChains)
+        return
+
+    def report(self) -> dict:
+        """Returns the statistics as a plain dict, handy for json dumps"""
+        games: int = max(self.games, 1)
+        meanTurns: float = self.turns / games
+        chains: int = max(sum(self.bullyChains), 1)
+        plays: int = max(sum(self.cardPlays), 1)
+        return {'games': self.games,
+                'completed': self.completed,
+                'meanTurns': meanTurns,
+                'stdTurns': max(self.turnsSquared / games - meanTurns ** 2, 0) ** 0.5,
+                'winRate': [wins / games for wins in self.wins],
+                'cardPlayRate': {str(CARDS[id]): count / plays for id, count in enumerate(self.cardPlays)},
+                'bullyChains': {length: count / chains for length, count in enumerate(self.bullyChains) if count},
+                'meanBullyDraw': self.bullyCards / chains,
+                'reshufflesPerGame': self.reshuffles / games}
+
+
+class StatsRecorder:
+    """Counts the events of one game, with one handler per event type"""
+
+    def __init__(self, stats: GameStats, game: 'Game'):
+        self.stats: GameStats = stats
+        self.game: 'Game' = game
+        self.chain: int = 0 # +2 / +4 cards played since the last chain was drawn
+        self.handlers: typing.Dict[type, typing.Callable] = {CardPlayed: self.card_played, CardsDrawn: self.cards_drawn,
+                                                             Reshuffled: self.reshuffled, GameEnded: self.game_ended}
+        for eventType, handler in self.handlers.items():
+            game.events.subscribe(handler, [eventType])
+
+    def card_played(self, event: CardPlayed) -> None:
+        card = event.card
+        self.stats.cardPlays[card.id] += 1
+        if card.valueCode == DRAW_TWO or card.valueCode == DRAW_FOUR:
+            self.chain += 1
+
+    def cards_drawn(self, event: CardsDrawn) -> None:
+        if event.reason == 'bully':
+            self.stats.add_chain(self.chain, event.count)
+            self.chain = 0
+
+    def reshuffled(self, event: Reshuffled) -> None:
+        self.stats.reshuffles += 1
+
+    def game_ended(self, event: GameEnded) -> None:
+        """Counts the end of the game and stops listening"""
+        result = event.result
+        self.stats.add_game(result.turns, result.winner(), result.completed)
+        for handler in self.handlers.values():
+            self.game.events.unsubscribe(handler)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Computes statistics over a game log, in constant memory')
+    parser.add_argument('log', help='a log file written by gamelog.GameLogWriter')
+    parser.add_argument('--chunk', type=int, default=1 << 22, help='records per chunk')
+    parser.add_argument('--json', action='store_true', help='print the statistics as json')
+    args = parser.parse_args()
+
+    stats = GameStats()
+    records = gamelog.read_log(args.log)
+    for start in range(0, len(records), args.chunk):
+        stats.add_records(records[start:start + args.chunk])
+    report: dict = stats.report()
+    if args.json:
+        print(json.dumps(report))
+        return
+    print(f'{report["games"]} games ({report["completed"]} completed), '
+          f'length {report["meanTurns"]:.1f} +- {report["stdTurns"]:.1f} turns, '
+          f'{report["reshufflesPerGame"]:.2f} reshuffles per game')
+    print('win rate per seat: ' + ', '.join(f'{seat+1}: {rate:.3f}' for seat, rate in enumerate(report['winRate'])))
+    print('+2/+4 chain lengths: ' + ', '.join(f'{length}: {share:.3f}' for length, share in report['bullyChains'].items())
+          + f' (mean draw {report["meanBullyDraw"]:.2f} cards)')
+    print('most played cards: ' + ', '.join(f'{card} {rate:.3f}' for card, rate in
+                                           sorted(report['cardPlayRate'].items(), key=lambda item: -item[1])[:5]))
+
+
+if __name__ == '__main__':
+    main()
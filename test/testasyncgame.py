@@ -0,0 +1,199 @@
+import asyncio
+import time
+import unittest
+
+from asyncgame import AsyncGame, RemotePlayer
+from card import Card
+from events import TimedOut, CardsDrawn
+from mcts import MCTSComputer
+from player import Computer
+from renderer import Renderer
+
+
+class Typist(Renderer):
+    """
+    renderer that answers every prompt with the next of a list of lines, as if they were typed
+    """
+
+    def __init__(self, lines: list):
+        super().__init__()
+        self.lines = lines
+        self.said = []
+
+    def ask(self, prompt: str) -> str:
+        return self.lines.pop(0)
+
+    def say(self, text: str) -> None:
+        self.said.append(text)
+
+
+def autoplay(player: RemotePlayer, sent: list):
+    """
+    returns a send function that records every message and answers turns like a simple client would:
+    call uno when it is allowed, then play the first valid card (red for black cards), or pass
+    """
+    def send(message):
+        sent.append(message)
+        if message['type'] != 'turn':
+            return
+        if not message['valid']:
+            player.receive({'type': 'pass'})
+            return
+        if len(message['hand']) == 2:
+            player.receive({'type': 'uno'})
+        player.receive({'type': 'play', 'card': message['valid'][0], 'colour': 'Red'})
+    return send
+
+
+def scripted(player: RemotePlayer, sent: list, answers: list):
+    """
+    returns a send function that records every message and answers every turn with the next list of messages
+    """
+    def send(message):
+        sent.append(message)
+        if message['type'] == 'turn' and answers:
+            for answer in answers.pop(0):
+                player.receive(answer)
+    return send
+
+
+class TestAsyncGame(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        """
+        seat a remote player and a computer in a game at the start of each test
+        """
+        self.sent = []
+        self.player = RemotePlayer(1, lambda message: self.sent.append(message))
+        self.game = AsyncGame(seed=3)
+        self.game.setup(players=[self.player, Computer(2)])
+
+    async def test_invalid_answers(self):
+        """
+        tests if moves that are not allowed are refused, the screen is sent again after every refusal,
+        and answers that were sent before the turn are ignored
+        """
+        self.player.receive_hand([Card('Black', 'Wild'), Card('Blue', 4), Card('Green', 7)])
+        self.player.receive({'type': 'pass'})  # too late for an earlier turn
+        self.player.send = scripted(self.player, self.sent, [[{'type': 'play', 'card': Card('Green', 7).id}],
+                                                             [{'type': 'play', 'card': Card('Black', 'Wild').id}],
+                                                             [{'type': 'shout'}],
+                                                             [{'type': 'play', 'card': Card('Black', 'Wild').id,
+                                                               'colour': 'Green'}]])
+
+        self.assertEqual(await self.player.choose_move_async(Card('Blue', 1)), Card('Black', 'Wild'))
+        self.assertEqual(await self.player.pick_colour_async(), 'Green')
+        self.assertEqual([message['type'] for message in self.sent], ['turn', 'error'] * 3 + ['turn'])
+        self.assertEqual(self.sent[0]['valid'], [Card('Black', 'Wild').id, Card('Blue', 4).id])
+        self.assertEqual(len(self.player.hand), 2)
+
+    async def test_uno_call(self):
+        """
+        tests if a correct uno call is followed by the move without a new screen, and a wrong one ends the turn
+        """
+        self.player.receive_hand([Card('Blue', 4), Card('Green', 7)])
+        self.player.send = scripted(self.player, self.sent, [[{'type': 'uno'}, {'type': 'play', 'card': Card('Blue', 4).id}],
+                                                             [{'type': 'uno'}]])
+
+        self.assertEqual(await self.player.choose_move_async(Card('Blue', 1)), Card('Blue', 4))
+        self.assertTrue(self.player.calledUno)
+        self.assertEqual(len(self.sent), 1)
+
+        self.player.receive_hand([Card('Blue', 4), Card('Green', 7), Card('Red', 2)])
+        self.assertEqual(await self.player.choose_move_async(Card('Blue', 1)), 'wrongcall')
+
+    async def test_timeout(self):
+        """
+        tests if a player who does not answer in time gets the game's fallback
+        """
+        events = []
+        self.game.events.subscribe(events.append, [TimedOut, CardsDrawn])
+        self.game.turnTimeout = 0.01
+        self.player.receive_hand([Card('Blue', 4), Card('Green', 7)])
+        self.game.put_on_pile(Card('Blue', 1))
+        for fallback in AsyncGame.FALLBACKS:
+            self.game.fallback = fallback
+            move, colour = await self.game.ask(self.player)
+            self.assertEqual(move, Card('Blue', 4) if fallback == 'computer' else 'pass')
+        self.assertEqual(self.game.timeouts, 3)
+        self.assertEqual([type(event) for event in events], [TimedOut, TimedOut, CardsDrawn, TimedOut])
+        self.assertEqual(events[2].reason, 'timeout')
+        self.assertEqual(len(self.player.hand), 2)  # one card drawn, one played
+        with self.assertRaises(ValueError):
+            AsyncGame(fallback='wait')
+
+    def test_prompted_setup(self):
+        """
+        tests if the synchronous setup of Game, which asks how many players there are, also works on an AsyncGame
+        """
+        game = AsyncGame(seed=3)
+        game.renderer = Typist(['three', '3', '0'])
+        game.create_players()
+
+        self.assertEqual([type(player) for player in game.players], [Computer] * 3)
+        self.assertEqual(game.renderer.said[0], 'Please use a numerical value')
+
+    async def test_colour_comes_with_card(self):
+        """
+        tests if the colour sent along with a black card ends up on the pile, without asking pick_colour
+        """
+        self.game.handle_action(Card('Black', 'Wild'), self.player, 'Yellow')
+        self.assertEqual(self.game.currentCard, Card('Yellow', 'Wild'))
+        self.game.handle_action(Card('Red', 3), self.player, 'Yellow')
+        self.assertEqual(self.game.currentCard, Card('Red', 3))
+
+    async def test_whole_game(self):
+        """
+        tests if games with remote players are played to the end, and a seat that disconnects is taken over
+        """
+        for seed in range(5):
+            sent = [[], []]
+            players = [RemotePlayer(1), RemotePlayer(2), Computer(3)]
+            for player, messages in zip(players, sent):
+                player.send = autoplay(player, messages)
+            game = AsyncGame(seed=seed)
+            game.setup(players=players)
+            if seed % 2:
+                players[1].disconnect()
+            await game.run_async()
+
+            self.assertTrue(game.result().completed)
+            self.assertEqual(sorted(game.result().placings), [1, 2, 3])
+            self.assertTrue(sent[0])
+            self.assertEqual(bool(sent[1]), seed % 2 == 0)
+
+    async def test_search_yields(self):
+        """
+        tests if a search bot lets other coroutines run while it searches, and finds the same move as choose_move
+        """
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0)
+
+        game = AsyncGame(seed=4)
+        game.setup(players=[MCTSComputer(1, timeLimit=0, rollouts=300), Computer(2), Computer(3)])
+        twin = AsyncGame(seed=4)
+        twin.setup(players=[MCTSComputer(1, timeLimit=0, rollouts=300), Computer(2), Computer(3)])
+
+        task = asyncio.get_running_loop().create_task(ticker())
+        move = await game.players[0].choose_move_async(game.currentCard)
+        task.cancel()
+        self.assertEqual(move, twin.players[0].choose_move(twin.currentCard))
+        self.assertEqual(game.players[0].lastIterations, 300)
+        self.assertGreater(len(ticks), 1)
+
+        timed = MCTSComputer(1, timeLimit=0.05)
+        timed.join(twin)
+        timed.receive_hand(list(twin.players[0].hand))
+        twin.turnTimeout = 0.02
+        start = time.perf_counter()
+        move, _ = await twin.ask(timed)
+        self.assertLess(time.perf_counter() - start, 0.04)
+        self.assertEqual((move, timed.hand, twin.timeouts), ('pass', twin.players[0].hand, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
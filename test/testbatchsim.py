@@ -0,0 +1,51 @@
+import unittest
+
+try:
+    import numpy as np
+    from batchsim import BatchSimulator
+except ImportError:  # the batch simulator is the only part of the game that needs numpy
+    np = None
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestBatchSimulator(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        create a small batch of three-player games at the start of each test
+        """
+        self.batch = BatchSimulator(60, 3, slots=20, seed=7, maxTurns=2000)
+
+    def count_cards(self) -> np.ndarray:
+        """
+        counts every card per slot: deck, hands, pile and the top card
+        """
+        inDeck = np.array([self.batch.deckLen[game] for game in range(20)])
+        return inDeck + self.batch.hands.sum(axis=(1, 2)) + self.batch.pileCounts.sum(axis=1) + 1
+
+    def test_deal(self):
+        """
+        tests if every seat is dealt seven cards and a number card is turned up
+        """
+        self.assertTrue((self.batch.handSize == 7).all())
+        self.assertTrue((self.batch.top < 52).all())
+        self.assertTrue((self.batch.top % 13 < 10).all())
+
+    def test_cards_are_conserved(self):
+        """
+        tests if no card is ever lost or duplicated, also not when the pile is reshuffled
+        """
+        for _ in range(300):
+            self.batch.step()
+            self.assertTrue((self.count_cards() == 108).all())
+            self.assertTrue((self.batch.hands.sum(axis=2) == self.batch.handSize).all())
+
+    def test_run(self):
+        """
+        tests if all games are played and every game has a winner
+        """
+        standings = self.batch.run()
+
+        self.assertEqual(standings.games, 60)
+        self.assertEqual(sum(standings.wins), 60)
+        self.assertEqual(sum(standings.placeSum), 60 * (1 + 2 + 3))
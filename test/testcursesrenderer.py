@@ -0,0 +1,147 @@
+import curses
+import unittest
+
+from card import Card
+from cursesrenderer import CursesRenderer, CursesLog, open_screen
+from events import CardPlayed, PlayerFinished
+from game import Game
+from player import Human
+from renderer import Renderer
+
+
+class FakeWindow:
+    """
+    stands in for a curses window: keeps the characters on the screen, counts writes and hands out scripted keys
+    """
+
+    def __init__(self, rows: int, cols: int, keys: list = ()):
+        self.rows, self.cols = rows, cols
+        self.keys = list(keys)
+        self.writes = 0
+        self.clear()
+
+    def getmaxyx(self):
+        return self.rows, self.cols
+
+    def addstr(self, row, col, text, attr=0):
+        self.writes += 1
+        line = self.screen[row]
+        self.screen[row] = line[:col] + text + line[col + len(text):]
+
+    def clear(self):
+        self.screen = [' ' * self.cols for _ in range(self.rows)]
+
+    def move(self, row, col):
+        pass
+
+    def refresh(self):
+        pass
+
+    def get_wch(self):
+        key = self.keys.pop(0)
+        if key == curses.KEY_RESIZE:
+            self.rows, self.cols = 20, 50
+        return key
+
+    def text(self) -> str:
+        return '\n'.join(line.rstrip() for line in self.screen)
+
+
+class TestCursesRenderer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        create a renderer on a big fake window at the start of each test
+        """
+        self.window = FakeWindow(50, 120)
+        self.renderer = CursesRenderer(self.window)
+        self.hand = [Card('Red', 5), Card('Blue', 'Skip'), Card('Black', 'Wild')]
+
+    def test_only_changes_are_painted(self):
+        """
+        tests if a turn that looks the same writes nothing, and a new top card only repaints the card
+        """
+        self.renderer.show_turn(Card('Red', 3), 1, self.hand, [])
+        self.assertIn('| red | | blu | | blk |', self.window.text())
+        self.assertIn('4 - Pass', self.window.text())
+        writes = self.window.writes
+
+        self.renderer.show_turn(Card('Red', 3), 1, self.hand, [])
+        self.assertEqual(self.window.writes, writes)
+
+        self.renderer.show_turn(Card('Red', 4), 1, self.hand, [])
+        self.assertEqual(self.renderer.repaints, {'card': 2, 'title': 1, 'hand': 1, 'options': 1})
+
+        self.renderer.show_turn(Card('Red', 4), 1, self.hand[:2], [2])
+        self.assertEqual(self.renderer.repaints['banners'], 1)
+        self.assertIn('player 2 called Uno!', self.window.text())
+        self.assertNotIn('blk', self.window.text())  # the hand moved down, the old one is wiped
+        self.assertIn('3 - Pass', self.window.text())
+
+    def test_log_and_prompt(self):
+        """
+        tests if events end up in the log next to the card, and a prompt is read with backspace and Enter
+        """
+        self.window.keys = ['1', 'x', '\x7f', '2', '\n']
+        game = Game()
+        self.renderer.attach(game)
+        self.assertIsInstance(game.terminalLog, CursesLog)
+        game.setup(players=[Human(1), Human(2)])
+        self.assertIs(game.players[0].renderer, self.renderer)
+        self.renderer.show_turn(game.currentCard, 1, game.players[0].hand, [])
+        game.events.emit(CardPlayed(2, Card('Green', 7)))
+
+        game.events.emit(PlayerFinished(1, 1))
+        self.assertEqual(self.renderer.logLines, ['player 2 played [Green | 7]', '|-_-_-_-_-_-_-_-_-_-_-_-|',
+                                                  ' |Player 1 is number 1!|', '|-_-_-_-_-_-_-_-_-_-_-_-|'])
+        self.assertIn('player 2 played [Green | 7]', self.window.screen[0][38:])
+        self.assertEqual(game.players[0].ask('Choose option (enter number):\n>'), '12')
+        self.assertEqual(self.renderer.message, 'Choose option (enter number):')
+
+    def test_resize(self):
+        """
+        tests if a resize repaints the whole screen, with the small top card and the log below it
+        """
+        self.renderer.show_turn(Card('Green', 'Draw Two'), 2, self.hand, [])
+        self.renderer.log('-' * 64 + 'player 1 passed')
+        self.window.keys = [curses.KEY_RESIZE, '\n']
+        self.renderer.ask('>')
+
+        self.assertEqual(self.renderer.repaints['title'], 2)
+        self.assertEqual(self.window.screen[0].rstrip(), 'top of pile: [Green | Draw Two]')
+        self.assertIn('player 1 passed', self.window.text())
+        self.assertIn('| skp |', self.window.text())
+
+    def test_private_turn(self):
+        """
+        tests if the hand stays hidden until Enter is pressed when humans share the screen
+        """
+        hidden = []
+        self.window.get_wch = lambda: hidden.append('hand' in self.renderer.painted) or '\n'
+        game = Game()
+        self.renderer.attach(game)
+        game.setup(players=[Human(1), Human(2)])
+        game.display_options(game.players[0])
+
+        self.assertEqual(hidden, [False])
+        self.assertIn('hand', self.renderer.painted)
+        self.assertIn(f'{len(game.players[0].hand) + 2} - Call Uno', self.window.text())
+
+    def test_no_terminal(self):
+        """
+        tests if a terminal curses cannot drive gets a plain renderer instead of an error
+        """
+        def initscr():
+            raise curses.error('setupterm: could not find terminal')
+
+        initscrBefore = curses.initscr
+        curses.initscr = initscr
+        try:
+            renderer = open_screen()
+        finally:
+            curses.initscr = initscrBefore
+        self.assertIs(type(renderer), Renderer)
+
+
+if __name__ == '__main__':
+    unittest.main()
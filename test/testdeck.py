@@ -1,5 +1,7 @@
+import random
 import unittest
 
+from card import Card
 from deck import Deck
 
 
@@ -10,13 +12,13 @@ class TestDeck(unittest.TestCase):
         For each testcase:
         Create a Deck object, create lists of lefthands and righthands of cards in there
         """
-        self.deck = Deck() #instantiate a deck object for testing
+        self.deck = Deck(rng=random.Random(2)) # seeded, redrawing the very same kind of card would make the redraw tests fail
 
         self.card_lefthand = []
         self.card_righthand = []
         for el in self.deck.cardDeck:
-            self.card_lefthand.append(el[0])
-            self.card_righthand.append(el[1])
+            self.card_lefthand.append(el.colour)
+            self.card_righthand.append(el.value)
 
     def test_to_String(self):
         self.assertIsInstance(self.deck.__str__(), str)
@@ -69,7 +71,7 @@ class TestDeck(unittest.TestCase):
         """"
         tests if the deck properly gets recreated from pile/shuffled
         """
-        pseudo_card_pile = ['card 1', 'card 2', 'card 3', "card 4"]
+        pseudo_card_pile = [Card('Red', 1), Card('Blue', 'Skip'), Card('Green', 9), Card('Yellow', 'Reverse')]
 
         self.deck.recreate(pseudo_card_pile)
         for el in pseudo_card_pile:
@@ -80,11 +82,13 @@ class TestDeck(unittest.TestCase):
         """"
         tests if upon deck recreation black cards are properly restored
         """
-        pile = [('Purple', 'Draw Four'), ('Purple', "Wild")]
+        pile = [Card('Red', 'Draw Four'), Card('Blue', "Wild")]  # colours that were picked for the black cards
+        self.deck.cardDeck = []
         self.deck.recreate(pile)
 
-        self.assertIn(('Black', 'Draw Four'), self.deck.cardDeck)
-        self.assertIn(("Black", "Wild"), self.deck.cardDeck)
+        self.assertIn(Card('Black', 'Draw Four'), self.deck.cardDeck)
+        self.assertIn(Card("Black", "Wild"), self.deck.cardDeck)
+        self.assertNotIn(Card('Red', 'Draw Four'), self.deck.cardDeck)
 
     def test_shuffle(self):
         """"
@@ -92,7 +96,7 @@ class TestDeck(unittest.TestCase):
         """
         second_deck = Deck()
 
-        self.deck.shuffle(1)  # one time, deck should be properly shuffled after one time
+        self.deck.shuffle()  # one time, deck should be properly shuffled after one time
         self.assertNotEqual(self.deck.cardDeck, second_deck.cardDeck)
 
     def test_draw(self):
@@ -102,7 +106,7 @@ class TestDeck(unittest.TestCase):
         initial_deck_size = self.deck.count_cards()
         drawn_card = self.deck.draw()
 
-        self.assertIsInstance(drawn_card, tuple)
+        self.assertIsInstance(drawn_card, Card)
         self.assertEqual(self.deck.count_cards(), initial_deck_size - 1)
 
     def test_redraw_new_card(self):
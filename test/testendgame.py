@@ -0,0 +1,114 @@
+import random
+import unittest
+
+from card import Card, NUM_CARDS
+from endgame import EndgameComputer, EndgameSolver, BudgetExceeded
+from game import Game
+from gamestate import GameState
+from player import Computer
+
+
+def make_state(hands: list, top: Card, deck: list) -> GameState:
+    """
+    builds a state from a list of hands (player 1 first, player 1 to move), the top card and the deck
+    """
+    state = GameState(len(hands), random.Random(0))
+    for seat, hand in enumerate(hands, start=1):
+        for card in hand:
+            state.counts[seat * NUM_CARDS + card.id] += 1
+            state.masks[seat] |= card.bit
+        state.sizes[seat] = len(hand)
+        if len(hand) == 1:  # called uno in time
+            state.unoCalls |= 1 << seat
+    state.top = top.id
+    state.pile = [top.undeclared().id]
+    state.deck = [card.id for card in deck]
+    return state
+
+
+class TestEndgame(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        make a solver that searches far enough to finish the small positions below
+        """
+        self.solver = EndgameSolver(depth=12)
+
+    def test_last_card_rule(self):
+        """
+        tests if the solver keeps a number card for last, since the game cannot be finished with a Skip
+        """
+        state = make_state([[Card('Red', 5), Card('Red', 'Skip')], [Card('Green', 3)] * 3], Card('Red', 1),
+                           [Card('Yellow', 9)] * 6)
+        values = self.solver.solve(state)
+
+        self.assertEqual(self.solver.best_move(state), Card('Red', 'Skip').id)
+        self.assertEqual(values[Card('Red', 'Skip').id][1], 1.0)
+        self.assertLess(values[Card('Red', 5).id][1], 1.0)
+
+    def test_two_player_reverse(self):
+        """
+        tests if the solver knows that a Reverse between two players means playing again
+        """
+        state = make_state([[Card('Red', 'Reverse'), Card('Blue', 'Reverse'), Card('Blue', 5)], [Card('Green', 3)] * 3],
+                           Card('Red', 1), [Card('Green', 9)] * 6)
+
+        self.assertEqual(self.solver.best_move(state), Card('Red', 'Reverse').id)
+        self.assertEqual(self.solver.solve(state)[Card('Red', 'Reverse').id][1], 1.0)
+
+    def test_outcomes(self):
+        """
+        tests if the cards a move makes somebody draw are enumerated with the right chances, and the state is restored
+        """
+        state = make_state([[Card('Red', 5), Card('Blue', 7)], [Card('Green', 3)]], Card('Red', 1),
+                           [Card('Red', 2), Card('Red', 2), Card('Yellow', 9)])
+        before = (state.deck.copy(), state.counts.copy())
+        drawn = {}
+        for chance in self.solver.outcomes(state, Card('Red', 5).id):
+            drawn[tuple(state.hand(2))] = chance
+
+        self.assertEqual(len(drawn), 2)
+        self.assertAlmostEqual(drawn[(Card('Red', 2).id, Card('Green', 3).id)], 2 / 3)
+        self.assertAlmostEqual(drawn[(Card('Yellow', 9).id, Card('Green', 3).id)], 1 / 3)
+        self.assertEqual((state.deck, state.counts), before)
+
+    def test_table_size(self):
+        """
+        tests if the transposition table stays within its size, and a smaller budget searches less deep
+        """
+        solver = EndgameSolver(depth=8, tableSize=20)
+        state = make_state([[Card('Red', 5), Card('Blue', 7), Card('Red', 'Skip')], [Card('Green', 3), Card('Red', 8)]],
+                           Card('Red', 1), [Card('Blue', 2), Card('Red', 2), Card('Yellow', 9), Card('Green', 'Skip')])
+        solver.solve(state)
+        self.assertLessEqual(len(solver.table), 20)
+
+        small = EndgameSolver(depth=8, maxNodes=200)
+        small.solve(state)
+        self.assertLess(small.solvedDepth, solver.solvedDepth)
+        with self.assertRaises(BudgetExceeded):
+            EndgameSolver(depth=8, maxNodes=1).solve(state)
+        self.assertEqual(state.deck, [card.id for card in (Card('Blue', 2), Card('Red', 2), Card('Yellow', 9),
+                                                           Card('Green', 'Skip'))])
+
+    def test_switches_to_solver(self):
+        """
+        tests if the endgame player solves once all hands are small, and plays whole games
+        """
+        solved = []
+
+        class Recorder(EndgameComputer):
+            def search(self, root):
+                move = super().search(root)
+                solved.append(self.lastSolved)
+                return move
+
+        for seed in range(3):
+            result = Game(headless=True, seed=seed).simulate(
+                maxTurns=500, strategies=[lambda id: Recorder(id, timeLimit=0, rollouts=20, endgameCards=4, deals=2), Computer])
+            self.assertEqual(sorted(result.placings), [1, 2])
+        self.assertIn(True, solved)
+        self.assertIn(False, solved)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from card import Card
+from events import EventBus, CardPlayed, CardsDrawn, PlayerFinished, GameEnded, Skipped
+from game import Game
+
+
+class TestEvents(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        create a seeded headless game that records every event at the start of each test
+        """
+        self.game = Game(headless=True, seed=3)
+        self.received = []
+        self.game.events.subscribe(self.received.append)
+
+    def of_type(self, eventType: type) -> list:
+        return [event for event in self.received if type(event) is eventType]
+
+    def test_events_match_result(self):
+        """
+        tests if the events of a whole game add up to its result
+        """
+        result = self.game.simulate(3)
+
+        self.assertEqual([event.playerId for event in self.of_type(PlayerFinished)], result.placings[:self.game.winners])
+        for seat in range(3):
+            drawn = sum(event.count for event in self.of_type(CardsDrawn) if event.playerId == seat + 1)
+            self.assertEqual(drawn, result.cardsDrawn[seat])
+        self.assertEqual(self.of_type(GameEnded)[0].result.to_dict(), result.to_dict())
+
+    def test_subscribe_to_some_types(self):
+        """
+        tests if a subscriber only gets the event types it asked for, and unsubscribing drops unwanted types
+        """
+        played = []
+        self.game.events.subscribe(played.append, [CardPlayed])
+        self.game.simulate(3)
+
+        self.assertTrue(played)
+        self.assertTrue(all(type(event) is CardPlayed for event in played))
+        self.game.events.unsubscribe(self.received.append)
+        self.assertEqual(list(self.game.events.handlers), [CardPlayed])
+
+    def test_no_subscribers(self):
+        """
+        tests if an event bus without subscribers wants nothing, so the game does not even create events
+        """
+        bus = EventBus()
+        self.assertFalse(bus.wants(CardPlayed))
+        bus.emit(CardPlayed(1, Card('Red', 1)))  # nobody to call, no error
+
+    def test_skip_event(self):
+        """
+        tests if playing a skip emits who was skipped, after the card itself
+        """
+        self.game.create_players((3, 0))
+        self.game.put_on_pile(Card('Red', 1))
+        self.game.handle_action(Card('Red', 'Skip'), self.game.players[0])
+
+        self.assertEqual([type(event) for event in self.received], [CardPlayed, Skipped])
+        self.assertEqual(self.received[1].playerId, 2)
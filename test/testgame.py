@@ -1,5 +1,6 @@
 import unittest
 
+from card import Card
 from game import Game
 from player import *
 
@@ -16,7 +17,7 @@ class TestGame(unittest.TestCase):
         """
         self.game = Game()
 
-        self.game.deck.shuffle(10)
+        self.game.deck.shuffle()
         self.game.create_players((2, 0))
         self.game.deal()
 
@@ -24,8 +25,8 @@ class TestGame(unittest.TestCase):
         """
         tests the case when a player cant respond to a bully card
         """
-        self.game.put_on_pile(('any colour', 'Draw Two'))
-        self.game.players[0].receive_hand([('Red', 0)])  # magic carding, need a player with a hand with no response
+        self.game.put_on_pile(Card('Blue', 'Draw Two'))
+        self.game.players[0].receive_hand([Card('Red', 0)])  # magic carding, need a player with a hand with no response
         self.game.bullyDraw = 2
 
         self.assertFalse(self.game.handle_bully_response(self.game.players[0]))
@@ -35,8 +36,8 @@ class TestGame(unittest.TestCase):
         """
         tests if a bully happens in game and can be responded to +2
         """
-        self.game.put_on_pile(('any colour', 'Draw Two'))
-        self.game.players[0].receive_hand([('Red', 'Draw Two'), ('Second', 'Card')])
+        self.game.put_on_pile(Card('Blue', 'Draw Two'))
+        self.game.players[0].receive_hand([Card('Red', 'Draw Two'), Card('Green', 5)])
         self.game.bullyDraw = 2
 
         self.assertTrue(self.game.handle_bully_response(self.game.players[0]))
@@ -46,8 +47,8 @@ class TestGame(unittest.TestCase):
         """
         tests if a bully happens in game and can be responded to +4
         """
-        self.game.put_on_pile(('any colour', 'Draw Four'))
-        self.game.players[0].receive_hand([('Black', 'Draw Four'), ('Second', 'Card')])
+        self.game.put_on_pile(Card('Black', 'Draw Four'), 'Blue')
+        self.game.players[0].receive_hand([Card('Black', 'Draw Four'), Card('Green', 5)])
         self.game.bullyDraw = 4
 
         self.assertTrue(self.game.handle_bully_response(self.game.players[0]))
@@ -76,7 +77,7 @@ class TestGame(unittest.TestCase):
         single_card = self.game.draw(1)[0]
 
         self.assertEqual(cards_in_deck - 1, self.game.deck.count_cards())
-        self.assertIsInstance(single_card, tuple)
+        self.assertIsInstance(single_card, Card)
 
     def test_draw_multiple_cards(self):
         """
@@ -88,7 +89,7 @@ class TestGame(unittest.TestCase):
         self.assertEqual(len(cards), 4)
         self.assertEqual(self.game.deck.count_cards(), cards_in_deck - 4)
         for el in cards:
-            self.assertIsInstance(el, tuple)
+            self.assertIsInstance(el, Card)
 
     def test_draw_deck_is_empty(self):
         """"
@@ -100,9 +101,9 @@ class TestGame(unittest.TestCase):
         self.assertEqual(self.game.deck.count_cards(), 1)
         cards = self.game.draw(2)
         self.assertEqual(len(cards), 2)
-        self.assertEqual(self.game.deck.count_cards(), len(full_deck) - 1)
+        self.assertEqual(self.game.deck.count_cards(), len(full_deck) - 2)  # the top card stays on the pile
         for el in cards:
-            self.assertIsInstance(el, tuple)
+            self.assertIsInstance(el, Card)
 
     def test_player_count(self):
         """
@@ -145,7 +146,7 @@ class TestGame(unittest.TestCase):
         tests handle action based on a normal card
         """
         card = self.game.draw(1)[0]  # will always return a list with a single item
-        while not isinstance(card[1], int):
+        while not isinstance(card.value, int):
             card = self.game.deck.redraw(card)
 
         self.assertEqual(self.game.handle_action(card, self.game.players[0]), 2)
@@ -156,7 +157,7 @@ class TestGame(unittest.TestCase):
         tests handle action based on a draw two
         """
         card = self.game.draw(1)[0]
-        while not card[1] == 'Draw Two':
+        while not card.value == 'Draw Two':
             card = self.game.deck.redraw(card)
 
         self.assertEqual(self.game.handle_action(card, self.game.players[0]), 2)
@@ -168,11 +169,12 @@ class TestGame(unittest.TestCase):
         Tests handle action based on a draw four
         """
         card = self.game.draw(1)[0]
-        while not card[1] == 'Draw Four':
+        while not card.value == 'Draw Four':
             card = self.game.deck.redraw(card)
 
         self.assertEqual(self.game.handle_action(card, self.game.players[0]), 2)
-        self.assertEqual(self.game.top_of_pile()[1], card[1])  # the computer will choose a colour
+        self.assertNotEqual(self.game.currentCard.colour, 'Black')  # the computer will choose a colour
+        self.assertEqual(self.game.top_of_pile(), card)
         self.assertEqual(self.game.bullyDraw, 4)
 
     def test_handle_action_skip(self):
@@ -180,7 +182,7 @@ class TestGame(unittest.TestCase):
         Tests handle action based on a skip
         """
         card = self.game.draw(1)[0]
-        while not card[1] == 'Skip':
+        while not card.value == 'Skip':
             card = self.game.deck.redraw(card)
 
         self.assertEqual(self.game.handle_action(card, self.game.players[0]), 1)
@@ -198,7 +200,7 @@ class TestGame(unittest.TestCase):
 
         self.assertIsInstance(winnersgame.players[1], Winner)
         card = winnersgame.draw(1)[0]
-        while not card[1] == 'Skip':
+        while not card.value == 'Skip':
             card = winnersgame.deck.redraw(card)
 
         self.assertEqual(winnersgame.handle_action(card, winnersgame.players[0]), 1)
@@ -208,7 +210,7 @@ class TestGame(unittest.TestCase):
         tests if handle action properly stays on turn with 2 players
         """
         card = self.game.draw(1)[0]
-        while not card[1] == 'Reverse':
+        while not card.value == 'Reverse':
             card = self.game.deck.redraw(card)
 
         self.assertEqual(self.game.handle_action(card, self.game.players[0]), 1)  # stays on turn as there is only 2 players
@@ -218,7 +220,7 @@ class TestGame(unittest.TestCase):
         tests if handle action properly reverses turn order
         """
         card = self.game.draw(1)[0]
-        while not card[1] == 'Reverse':
+        while not card.value == 'Reverse':
             card = self.game.deck.redraw(card)
 
         self.game.create_players((1, 0))
@@ -231,26 +233,87 @@ class TestGame(unittest.TestCase):
         tests handle action on a wildcard
         """
         card = self.game.draw(1)[0]
-        while not card[1] == 'Wild':
+        while not card.value == 'Wild':
             card = self.game.deck.redraw(card)
 
         self.assertEqual(self.game.handle_action(card, self.game.players[0]), 2)
-        self.assertNotEqual(self.game.top_of_pile()[0], 'Black')  # computer needs to have changed the colour
+        self.assertNotEqual(self.game.currentCard.colour, 'Black')  # computer needs to have picked a colour
+        self.assertEqual(self.game.top_of_pile().colour, 'Black')  # but the card itself is left untouched
 
     def test_handle_action_pass(self):
         """"
         Tests handle action on a turn being passed
         """
-        passing_card = ()  # use an empty tuple to signify a pass
+        passing_card = 'pass'  # what player.choose_move() yields on a pass
         self.assertEqual(self.game.handle_action(passing_card, self.game.players[0]), 2)
 
     def test_handle_action_incorrect_uno(self):
         """"
         Tests handle action based on an incorrect uno call having happened
         """
-        card = ('Uno', False)  # the tuple yielded by player.choose_move() on a bad uno call
+        card = 'wrongcall'  # what player.choose_move() yields on a bad uno call
 
         self.assertEqual(self.game.handle_action(card, self.game.players[0]), 1)
         self.assertEqual(len(self.game.players[0].hand), 10)
 
 
+
+    def test_simulate_headless(self):
+        """"
+        tests if a headless simulation runs a full game and returns its result
+        """
+        result = Game(seed=2).simulate(4)  # a seed known to play to the end
+
+        self.assertTrue(result.completed)
+        self.assertEqual(result.finished, 3)
+        self.assertEqual(sorted(result.placings), [1, 2, 3, 4])
+        self.assertGreater(result.turns, 0)
+        self.assertEqual(len(result.cardsDrawn), 4)
+
+    def test_simulate_rejects_humans(self):
+        """"
+        tests if a headless game refuses human players, since it cannot ask for input
+        """
+        headlessgame = Game(headless=True)
+        with self.assertRaises(ValueError):
+            headlessgame.create_players((2, 1))
+
+    def test_next_playerid_after_finish(self):
+        """"
+        tests if finished players are left out of the ring of seats, in both directions
+        """
+        ringgame = Game()
+        ringgame.create_players((4, 0))
+        ringgame.deal()
+        ringgame.players[2].receive_hand([])
+        ringgame.is_done(ringgame.players[2])
+
+        self.assertEqual(ringgame.next_player_id(2), 4)
+        self.assertEqual(ringgame.next_player_id(3), 4)  # walking from the seat that was just left still works
+        ringgame.direction = -1
+        self.assertEqual(ringgame.next_player_id(4), 2)
+        self.assertEqual(ringgame.number_of_computer_players(), 3)
+
+    def test_simulate_large_table(self):
+        """"
+        tests if simulations are not capped at ten players, the deck grows with the table
+        """
+        largegame = Game()
+        result = largegame.simulate(60, maxTurns=500)
+
+        self.assertEqual(largegame.deck.packs, 6)
+        self.assertEqual(len(result.cardsDrawn), 60)
+
+    def test_seed_replays_game(self):
+        """"
+        tests if a game is reproducible from its seed, without touching the global random module
+        """
+        first = Game(headless=True, seed=42).simulate(3)
+        second = Game(headless=True, seed=42).simulate(3)
+
+        self.assertEqual(first.to_dict(), second.to_dict())
+        self.assertEqual(first.seed, 42)
+
+        unseeded = Game(headless=True).simulate(3)
+        self.assertIsNotNone(unseeded.seed)
+        self.assertEqual(Game(headless=True, seed=unseeded.seed).simulate(3).to_dict(), unseeded.to_dict())
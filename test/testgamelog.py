@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+
+from game import Game
+from gamelog import GameLogWriter, HEADER, RECORD, PLAYED, ENDED, FINISHED, DRAW_ACTIONS, read_log
+
+try:
+    import numpy as np
+except ImportError:  # only reading a log needs numpy
+    np = None
+
+
+class TestGameLog(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        log two seeded games to a temporary file at the start of each test
+        """
+        handle, self.path = tempfile.mkstemp(suffix='.log')
+        os.close(handle)
+        os.remove(self.path)  # the writer creates it, header included
+        self.results = []
+        with GameLogWriter(self.path) as writer:
+            for gameId in (7, 8):
+                game = Game(headless=True, seed=gameId)
+                writer.record(game, gameId)
+                self.results.append(game.simulate(3))
+            self.records = writer.records
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_fixed_width_records(self):
+        """
+        tests if the file is a header followed by whole records only
+        """
+        self.assertEqual(os.path.getsize(self.path), len(HEADER) + self.records * RECORD.size)
+
+    def test_append_only(self):
+        """
+        tests if a second writer appends to the file instead of overwriting it
+        """
+        with GameLogWriter(self.path) as writer:
+            game = Game(headless=True, seed=9)
+            writer.record(game, 9)
+            game.simulate(2)
+            more = writer.records
+        self.assertEqual(os.path.getsize(self.path), len(HEADER) + (self.records + more) * RECORD.size)
+
+    def test_append_checks_header(self):
+        """
+        tests if a writer refuses to append to a file that is not a game log of this version, and leaves it alone
+        """
+        with open(self.path, 'r+b') as file:
+            file.write(b'UNOLOG\x00\x02')  # a later version
+        size = os.path.getsize(self.path)
+        with self.assertRaises(ValueError):
+            GameLogWriter(self.path)
+        self.assertEqual(os.path.getsize(self.path), size)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_read_log(self):
+        """
+        tests if the memory mapped records add up to the results of the games
+        """
+        records = read_log(self.path)
+
+        self.assertIsInstance(records, np.memmap)
+        self.assertEqual(len(records), self.records)
+        for gameId, result in zip((7, 8), self.results):
+            game = records[records['gameId'] == gameId]
+            self.assertEqual(game['action'][-1], ENDED)
+            self.assertEqual(game['seat'][-1], result.winner())
+            self.assertEqual(game['turn'][-1], result.turns)
+            self.assertEqual(list(game['seat'][game['action'] == FINISHED]), result.placings[:len(game[game['action'] == FINISHED])])
+            drawn = np.isin(game['action'], list(DRAW_ACTIONS.values()))
+            for seat in (1, 2, 3):
+                self.assertEqual(game['count'][drawn & (game['seat'] == seat)].sum(), result.cardsDrawn[seat-1])
+        self.assertTrue((records['card'][records['action'] == PLAYED] < 54).all())
@@ -0,0 +1,132 @@
+import random
+import unittest
+
+from card import Card
+from game import Game
+from gamestate import GameState, PASS
+from player import Computer
+
+FIELDS = ('deck', 'pile', 'counts', 'masks', 'sizes', 'nextSeat', 'prevSeat', 'finished', 'placings',
+          'current', 'top', 'direction', 'bullyDraw', 'turns', 'unoCalls')
+
+
+class LockstepComputer(Computer):
+    """Computer that captures a GameState at every decision, together with the move it made"""
+    decisions = []  # (state before the move, move), shared by all seats of a game
+
+    def join(self, game: Game) -> None:
+        super().join(game)
+        self.game = game
+
+    def choose_move(self, currentCard: Card):
+        before = GameState.from_game(self.game, self.id)
+        chosen = super().choose_move(currentCard)
+        before.rng = random.Random()
+        before.rng.setstate(self.game.rng.getstate())  # reshuffles the same way the game will
+        self.decisions.append((before, chosen.id if isinstance(chosen, Card) else PASS))
+        return chosen
+
+    def pick_colour(self) -> str:
+        colour = super().pick_colour()
+        before, move = self.decisions[-1]
+        self.decisions[-1] = (before, Card(colour, 'Wild' if move == 53 else 'Draw Four').id)
+        return colour
+
+
+class TestGameState(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        set up a four player game at the start of each test, and capture it at the first decision
+        """
+        self.game = Game(headless=True, seed=11)
+        self.game.setup((4, 0))
+        self.state = GameState.from_game(self.game, 1, random.Random(0))
+
+    def assertSameState(self, first: GameState, second: GameState, skip: tuple = ()) -> None:
+        for field in FIELDS:
+            if field not in skip:
+                self.assertEqual(getattr(first, field), getattr(second, field), field)
+
+    def test_matches_game(self):
+        """
+        tests if applying the moves of real games gives the same states as capturing those games
+        """
+        for seed in range(20):
+            LockstepComputer.decisions = []
+            game = Game(headless=True, seed=seed)
+            result = game.simulate(maxTurns=3000, strategies=[LockstepComputer] * (2 + seed % 4))
+            decisions = LockstepComputer.decisions
+            for (state, move), (following, _) in zip(decisions, decisions[1:]):
+                if following.turns == state.turns:  # asked twice in one turn (passed on a bully card)
+                    continue
+                state.apply(move)
+                self.assertSameState(state, following)
+            state, move = decisions[-1]
+            state.apply(move)
+            self.assertTrue(state.is_done())
+            self.assertEqual(state.result(), result.placings)
+
+    def test_undo(self):
+        """
+        tests if undoing a series of moves restores the state, also after reshuffles and finished players
+        """
+        rng = random.Random(4)
+        for _ in range(20):
+            before = self.state.clone()
+            moves = 0
+            while not self.state.is_done() and moves < 300:
+                self.state.apply(rng.choice(self.state.legal_moves()))
+                moves += 1
+            while self.state.marks:
+                self.state.undo()
+            self.assertSameState(self.state, before)
+
+    def test_clone_is_independent(self):
+        """
+        tests if a clone does not share its lists with the original
+        """
+        clone = self.state.clone()
+        clone.apply(clone.legal_moves()[0])
+
+        self.assertSameState(self.state, GameState.from_game(self.game, 1))
+        self.assertEqual(self.state.hand(1), sorted(card.id for card in self.game.players[0].hand))
+
+    def test_pack(self):
+        """
+        tests if a packed state unpacks to the same state, also with finished players and the direction reversed
+        """
+        rng = random.Random(7)
+        while not self.state.placings or self.state.direction == 1:
+            self.state.apply(rng.choice(self.state.legal_moves()))
+        unpacked = GameState.unpack(self.state.pack())
+
+        self.assertSameState(unpacked, self.state)
+        self.assertEqual(unpacked.maxTurns, self.state.maxTurns)
+        unpacked.apply(unpacked.legal_moves()[0])
+
+    def test_pack_large_table(self):
+        """
+        tests if a table with more than 255 seats can be packed
+        """
+        game = Game(headless=True, seed=2)
+        game.setup((300, 0))
+        state = GameState.from_game(game, 1)
+        state.apply(state.legal_moves()[0])
+
+        self.assertSameState(GameState.unpack(state.pack()), state)
+
+    def test_legal_moves(self):
+        """
+        tests if black cards are offered once for every colour, and a player without a move can only pass
+        """
+        self.state.counts[54:108] = [0] * 54
+        self.state.counts[54 + 53] = 1
+        self.state.masks[1] = Card('Black', 'Wild').bit
+        self.state.sizes[1] = 1
+        self.assertEqual(self.state.legal_moves(), [PASS])  # a wild is no valid last card
+
+        self.state.counts[54 + 52] = 1
+        self.state.masks[1] |= Card('Black', 'Draw Four').bit
+        self.state.sizes[1] = 2
+        self.assertEqual(sorted(self.state.legal_moves()), list(range(54, 62)))
@@ -0,0 +1,87 @@
+import random
+import unittest
+
+from card import Card
+from game import Game
+from gamestate import GameState, PASS
+from mcts import MCTSComputer, policy_move, score
+from player import Computer
+
+
+class TestMCTS(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        seat a search player and two computers in a game at the start of each test
+        """
+        self.game = Game(headless=True, seed=5)
+        self.game.setup(players=[MCTSComputer(1, timeLimit=0, rollouts=50), Computer(2), Computer(3)])
+        self.player = self.game.players[0]
+        self.state = GameState.from_game(self.game, 1)
+
+    def test_determinize(self):
+        """
+        tests if a deal keeps this player's hand and everybody's hand size, and only moves hidden cards around
+        """
+        deal = self.player.determinize(self.state, random.Random(1))
+
+        self.assertEqual(deal.hand(1), self.state.hand(1))
+        self.assertEqual(deal.sizes, self.state.sizes)
+        hidden = sorted(self.state.deck + self.state.hand(2) + self.state.hand(3))
+        self.assertEqual(sorted(deal.deck + deal.hand(2) + deal.hand(3)), hidden)
+        for seat in (2, 3):
+            self.assertEqual(deal.masks[seat], sum(1 << card for card in set(deal.hand(seat))))
+
+    def test_search_returns_legal_move(self):
+        """
+        tests if the search picks one of the legal moves within its rollout budget
+        """
+        move = self.player.search(self.state)
+
+        self.assertIn(move, self.state.legal_moves())
+        self.assertLessEqual(self.player.lastIterations, 50)
+
+    def test_plays_a_game(self):
+        """
+        tests if a search player can play a whole game, picking a colour along with every black card
+        """
+        result = Game(headless=True, seed=8).simulate(
+            maxTurns=300, strategies=[lambda id: MCTSComputer(id, timeLimit=0, rollouts=20), Computer])
+
+        self.assertEqual(sorted(result.placings), [1, 2])
+
+    def test_policy_move(self):
+        """
+        tests if the rollout policy bullies back like Computer, and passes without a move
+        """
+        self.state.top = Card('Red', 'Draw Two').id
+        self.state.masks[1] = Card('Blue', 'Draw Two').bit | Card('Red', 3).bit
+        self.state.counts[54:108] = [0] * 54
+        self.state.counts[54 + Card('Blue', 'Draw Two').id] = 1
+        self.state.counts[54 + Card('Red', 3).id] = 1
+        self.state.sizes[1] = 2
+        self.assertEqual(policy_move(self.state, random.Random(0)), Card('Blue', 'Draw Two').id)
+
+        self.state.masks[1] = Card('Green', 3).bit
+        self.state.sizes[1] = 1
+        self.assertEqual(policy_move(self.state, random.Random(0)), PASS)
+
+    def test_score(self):
+        """
+        tests if rewards are between 0 and 1, fewer cards in hand is better and action cards weigh more
+        """
+        hands = {1: [Card('Red', 3)], 2: [Card('Red', 4)] * 5, 3: [Card('Blue', 4)] * 5}
+        for seat, hand in hands.items():
+            self.state.counts[seat * 54:(seat + 1) * 54] = [0] * 54
+            for card in hand:
+                self.state.counts[seat * 54 + card.id] += 1
+            self.state.sizes[seat] = len(hand)
+        rewards = score(self.state)
+
+        self.assertGreater(rewards[1], rewards[2])
+        self.assertEqual(rewards[2], rewards[3])
+        self.assertTrue(all(0 <= reward <= 1 for reward in rewards[1:]))
+
+        self.state.counts[3 * 54 + Card('Blue', 4).id] -= 1
+        self.state.counts[3 * 54 + Card('Blue', 'Skip').id] += 1
+        self.assertGreater(score(self.state)[2], score(self.state)[3])
@@ -1,4 +1,5 @@
 import unittest
+from card import Card
 from player import *
 from game import Game
 
@@ -15,18 +16,17 @@ class TestPlayer(unittest.TestCase):
         """
         Tests if the computer successfully reports of being incapable on ending on a bully card
         """
-        self.player.receive_hand([('any', 'Draw Two')])
+        self.player.receive_hand([Card('Red', 'Draw Two')])
 
-        choice = self.player.choose_move(('any', 'Draw Two'))
-        self.assertFalse(choice)
-        self.assertIsInstance(choice, tuple)
+        choice = self.player.choose_move(Card('Blue', 'Draw Two'))
+        self.assertEqual(choice, 'pass')
 
     def test_computer_call_uno(self):
         """
         Tests if computer properly calls uno
         """
-        self.player.receive_hand([('any colour', 'any value'), ('any colour', 'any value')])
-        self.player.choose_move(('any colour', 'any value'))
+        self.player.receive_hand([Card('Red', 1), Card('Red', 2)])
+        self.player.choose_move(Card('Red', 3))
 
         self.assertTrue(self.player.calledUno)
 
@@ -34,58 +34,93 @@ class TestPlayer(unittest.TestCase):
         """
         Tests if computer correctly picks the bully card over other options
         """
-        self.player.receive_hand([('Black', 'Draw Four'), ('Black', 0)])
+        self.player.receive_hand([Card('Black', 'Draw Four'), Card('Red', 0)])
 
-        choice = self.player.choose_move(('Black', 'Draw Four'))
-        self.assertEqual(choice, ('Black', 'Draw Four'))
+        choice = self.player.choose_move(Card('Red', 'Draw Four'))  # a colour has been picked for the top card
+        self.assertEqual(choice, Card('Black', 'Draw Four'))
 
     def test_computer_bullies_draw_two(self):
         """
         Tests if computer correctly picks the bully card over other options
         """
-        self.player.receive_hand([('Red', 'Draw Two'), ('Blue', 0)])
+        self.player.receive_hand([Card('Red', 'Draw Two'), Card('Blue', 0)])
 
-        choice = self.player.choose_move(('Blue', 'Draw Two'))
-        self.assertEqual(choice, ('Red', 'Draw Two'))
+        choice = self.player.choose_move(Card('Blue', 'Draw Two'))
+        self.assertEqual(choice, Card('Red', 'Draw Two'))
 
     def test_computer_no_valid_moves(self):
         """
         tests if the computer correctly reports having no valid moves
         """
-        self.player.receive_hand([('Blue', 1), ('Yellow', 1)])
+        self.player.receive_hand([Card('Blue', 1), Card('Yellow', 1)])
 
-        choice = self.player.choose_move(('Red', 0))
-        self.assertFalse(choice)
-        self.assertIsInstance(choice, tuple)
+        choice = self.player.choose_move(Card('Red', 0))
+        self.assertEqual(choice, 'pass')
 
     def test_has_card_true(self):
         """
         Tests if has_card function works correctly
         """
-        self.player.receive_hand([("red", 0)])
+        self.player.receive_hand([Card("Red", 0)])
 
-        self.assertTrue(self.player.has_card(('red', 0)))
+        self.assertTrue(self.player.has_card(Card('Red', 0)))
 
     def test_has_card_false(self):
         """
         Tests if has card function works properly
         """
-        self.player.receive_hand([("red", 0)])
+        self.player.receive_hand([Card("Red", 0)])
 
-        self.assertFalse(self.player.has_card(('blue', 0)))
+        self.assertFalse(self.player.has_card(Card('Blue', 0)))
 
     def test_handle_uno_call_true(self):
         """
         Tests if handle uno works properly
         """
-        self.player.receive_hand([('Red', 0), ('Blue', 0)])
+        self.player.receive_hand([Card('Red', 0), Card('Blue', 0)])
 
-        self.assertTrue(self.player.handle_uno_call(('Green', 0)))
+        self.assertTrue(self.player.handle_uno_call(Card('Green', 0)))
 
     def test_handle_uno_call_false(self):
         """
         Tests if handle uno works properly
         """
-        self.player.receive_hand([('Red', 0), ('Blue', 0)])
+        self.player.receive_hand([Card('Red', 0), Card('Blue', 0)])
 
-        self.assertFalse(self.player.handle_uno_call(('Green', 1)))
+        self.assertFalse(self.player.handle_uno_call(Card('Green', 1)))
+
+    def test_valid_moves(self):
+        """
+        Tests if the precomputed move masks agree with Card.is_valid_move
+        """
+        self.player.receive_hand([Card('Red', 5), Card('Blue', 5), Card('Blue', 'Skip'), Card('Black', 'Wild')])
+
+        moves = self.player.valid_moves(Card('Red', 'Wild'))  # a wild for which red was picked
+        self.assertEqual(moves, [Card('Red', 5), Card('Black', 'Wild')])
+        self.assertEqual(moves, [card for card in self.player.hand if card.is_valid_move(Card('Red', 'Wild'))])
+
+    def test_valid_moves_last_card(self):
+        """
+        Tests if a last card only counts as a valid move when it is a number
+        """
+        self.player.receive_hand([Card('Blue', 'Skip')])
+
+        self.assertTrue(self.player.has_valid_move(Card('Blue', 3)))
+        self.assertEqual(self.player.valid_moves(Card('Blue', 3)), [])
+
+    def test_hand_index(self):
+        """
+        Tests if the colour, value and card counts follow draws and plays
+        """
+        self.player.receive_hand([Card('Red', 5), Card('Red', 5), Card('Black', 'Wild')])
+        self.player.draw([Card('Blue', 'Draw Two')])
+        self.player.play(Card('Red', 5))
+
+        self.assertEqual(self.player.cardCounts[Card('Red', 5).id], 1)
+        self.assertEqual(self.player.colourCounts, [1, 0, 1, 0, 1])  # red, yellow, blue, green, black
+        self.assertTrue(self.player.has_card(Card('*', 'Draw Two')))
+        self.assertTrue(self.player.has_card(Card('Red', '*')))
+        self.assertFalse(self.player.has_card(Card('Green', '*')))
+        self.player.play(Card('Red', 5))
+        self.assertFalse(self.player.has_card(Card('Red', 5)))
+        self.assertEqual(self.player.pick_colour(), 'Blue')
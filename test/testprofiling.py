@@ -0,0 +1,99 @@
+import json
+import os
+import tempfile
+import unittest
+
+from events import UnoCalled
+from game import Game
+from player import Human, Computer
+from profiling import Profiler, PHASES
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        play a few headless games with one profiler at the start of each test
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.profiler = Profiler(os.path.join(self.directory.name, 'profile.json'))
+        self.games = []
+        for seed in range(5):
+            game = Game(headless=True, seed=seed)
+            self.profiler.attach(game)
+            self.games.append((game, game.simulate(3)))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_timings(self):
+        """
+        tests if every computer move and draw is timed, and the phases add up to the time of the games
+        """
+        snapshot = self.profiler.snapshot()
+
+        self.assertEqual(snapshot['games'], 5)
+        self.assertEqual(snapshot['turns'], sum(result.turns for _, result in self.games))
+        self.assertEqual(snapshot['calls']['other'], 5)
+        self.assertGreaterEqual(snapshot['calls']['choose'], snapshot['turns'])
+        self.assertGreater(snapshot['calls']['draw'], 0)
+        self.assertEqual(snapshot['calls']['input'], 0)
+        self.assertTrue(all(snapshot['seconds'][phase] >= 0 for phase in PHASES))
+
+    def test_colour_picks(self):
+        """
+        tests if picking a colour is timed as input for humans and as choose for computers
+        """
+        profiler = Profiler()
+        game = Game(seed=4)
+        game.renderer.ask = lambda prompt: 'red'
+        profiler.attach(game)
+        game.setup(players=[Human(1), Computer(2)])
+
+        self.assertEqual(game.players[0].pick_colour(), 'Red')
+        game.players[1].pick_colour()
+        self.assertEqual((profiler.calls['input'], profiler.calls['choose']), (1, 1))
+
+    def test_counters(self):
+        """
+        tests if redraws of the starting card and wrong uno calls are counted
+        """
+        game = Game(headless=True, seed=9)
+        self.profiler.attach(game)
+        game.setup((3, 0))
+        game.events.emit(UnoCalled(1, False))
+        game.events.emit(UnoCalled(2, True))
+        game.run()
+
+        self.assertEqual(self.profiler.wrongUnoCalls, 1)
+        self.assertEqual(self.profiler.redraws, sum(game.deck.redraws for game, _ in self.games) + game.deck.redraws)
+
+    def test_export(self):
+        """
+        tests if snapshots are written as json and as Prometheus text
+        """
+        self.profiler.export()
+        with open(self.profiler.path) as file:
+            self.assertEqual(json.load(file)['games'], 5)
+
+        self.profiler.path, self.profiler.format = os.path.join(self.directory.name, 'profile.prom'), 'prometheus'
+        self.profiler.export()
+        with open(self.profiler.path) as file:
+            text = file.read()
+        self.assertIn('uno_games_total 5\n', text)
+        self.assertIn('uno_phase_seconds_total{phase="choose"}', text)
+        self.assertIn('# TYPE uno_turns_total counter', text)
+
+    def test_disabled(self):
+        """
+        tests if a game without a profiler runs the methods of its class, without any wrappers
+        """
+        game = Game(headless=True)
+        game.simulate(3)
+
+        self.assertFalse({'draw', 'run', 'display_options', 'handle_bully_response'} & set(vars(game)))
+        self.assertNotIn('choose_move', vars(game.players[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import io
+import unittest
+
+from card import Card, CARDS
+from game import Game
+from renderer import Renderer, TerminalLog
+
+
+class TestRenderer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        create a renderer that writes to a buffer at the start of each test
+        """
+        self.out = io.StringIO()
+        self.renderer = Renderer(self.out)
+
+    def test_frames_cached(self):
+        """
+        Tests if every top card state has a pre-rendered frame that is shared between renderers
+        """
+        self.assertEqual(len(Renderer.frames), len(CARDS))
+        self.assertIs(Renderer(io.StringIO()).top_card(Card('Red', 5)), self.renderer.top_card(Card('Red', 5)))
+        self.assertIn('R', self.renderer.top_card(Card('Red', 'Wild')))  # a wild for which red was picked
+        self.assertEqual(self.renderer.top_card(()), '')
+
+    def test_display_options_single_write(self):
+        """
+        Tests if a whole screen goes out in one write
+        """
+        writes = []
+        self.out.write = writes.append
+        game = Game()
+        game.renderer = self.renderer
+        game.create_players((2, 0))
+        game.deal()
+        game.put_on_pile(Card('Blue', 3))
+        game.display_options(game.players[0])
+
+        self.assertEqual(len(writes), 1)
+        self.assertIn("---player 1's turn---", writes[0])
+        self.assertIn('9 - Call Uno', writes[0])
+
+    def test_terminal_log(self):
+        """
+        Tests if the terminal subscriber prints the game's events the way the game always has
+        """
+        game = Game()
+        game.events.unsubscribe(game.terminalLog)
+        game.events.subscribe(TerminalLog(self.out))
+        game.create_players((2, 0))
+        game.put_on_pile(Card('Red', 1))
+        game.handle_action('pass', game.players[0])
+        game.handle_action(Card('Red', 2), game.players[1])
+
+        self.assertEqual(self.out.getvalue(), '-' * 64 + 'player 1 passed\n' + '-' * 64 + 'player 2 played [Red | 2]\n')
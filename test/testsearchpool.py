@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+
+from game import Game
+from gamestate import GameState
+from mcts import MCTSComputer
+from player import Computer
+from searchpool import SearchPool
+
+
+class TestSearchPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        start one pool with two workers for all tests, like a bot would keep it for a whole session
+        """
+        cls.pool = SearchPool(workers=2)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.pool.close()
+
+    def setUp(self) -> None:
+        """
+        seat a search player that uses the pool and two computers in a game at the start of each test
+        """
+        self.game = Game(headless=True, seed=5)
+        self.game.setup(players=[MCTSComputer(1, timeLimit=0, rollouts=60, pool=self.pool), Computer(2), Computer(3)])
+        self.player = self.game.players[0]
+        self.state = GameState.from_game(self.game, 1)
+
+    def test_search_is_split(self):
+        """
+        tests if a rollout budget is divided over this process and the workers, and the move is a legal one
+        """
+        move = self.player.search(self.state)
+
+        self.assertIn(move, self.state.legal_moves())
+        self.assertEqual(self.player.lastIterations, 60)
+
+    def test_search_is_reproducible(self):
+        """
+        tests if a seeded game with a search player on the pool plays out the same twice
+        """
+        results = []
+        for _ in range(2):
+            results.append(Game(headless=True, seed=8).simulate(
+                maxTurns=500, strategies=[lambda id: MCTSComputer(id, timeLimit=0, rollouts=30, pool=self.pool), Computer]))
+        self.assertEqual(results[0].placings, results[1].placings)
+        self.assertEqual(results[0].turns, results[1].turns)
+
+    def test_time_limit(self):
+        """
+        tests if a search on the pool can be bounded by time only
+        """
+        self.player.rollouts, self.player.timeLimit = 0, 0.05
+        move = self.player.search(self.state)
+
+        self.assertIn(move, self.state.legal_moves())
+        self.assertGreater(self.player.lastIterations, 2)
+
+    def test_awaited_searches(self):
+        """
+        tests if searches in games on an event loop share the pool one at a time, and a cancelled search
+        does not leave its answers for the next one
+        """
+        async def play():
+            first = asyncio.get_running_loop().create_task(self.player.search_async(self.state))
+            await asyncio.sleep(0)
+            first.cancel()
+            moves = await asyncio.gather(self.player.search_async(self.state), self.player.search_async(self.state))
+            return moves, self.player.lastIterations
+
+        moves, iterations = asyncio.run(play())
+        self.assertTrue(all(move in self.state.legal_moves() for move in moves))
+        self.assertEqual(iterations, 60)
+        self.assertEqual(self.pool.outstanding, [])
+
+    def test_drain_does_not_block(self):
+        """
+        tests if the answers of a cancelled search are awaited, so other games on the event loop go on meanwhile
+        """
+        async def drain():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+            ticker = asyncio.get_running_loop().create_task(tick())
+            await self.pool.drain_async()
+            ticker.cancel()
+            return ticks
+
+        self.player.rollouts, self.player.timeLimit = 0, 0.3
+        self.pool.hand_out(self.player, self.state)  # the workers search for a while, nobody reads their answers
+        self.assertGreater(asyncio.run(drain()), 5)
+        self.assertEqual(self.pool.outstanding, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import asyncio
+import io
+import json
+import os
+import socket
+import tempfile
+import unittest
+
+from card import Card
+from client import Client
+from game import Game
+from player import Computer
+from renderer import Renderer
+from server import GameServer
+
+
+async def play_client(path: str, join: dict, leaveAfter: int = 0) -> list:
+    """
+    connects to the server, joins a table and answers every turn with the first valid card (or a pass),
+    hangs up after a number of turns when leaveAfter is given :return all messages received:
+    """
+    reader, writer = await asyncio.open_unix_connection(path)
+    writer.write(json.dumps(join).encode() + b'\n')
+    received, turns = [], 0
+    async for line in reader:
+        message = json.loads(line)
+        received.append(message)
+        if message['type'] == 'end':
+            break
+        if message['type'] == 'turn':
+            turns += 1
+            if turns == leaveAfter:
+                break
+            answer = {'type': 'pass'}
+            if message['valid']:
+                answer = {'type': 'play', 'card': message['valid'][0], 'colour': 'Blue'}
+            if len(message['hand']) == 2 and message['valid']:
+                writer.write(b'{"type": "uno"}\n')
+            writer.write(json.dumps(answer).encode() + b'\n')
+    writer.close()
+    return received
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        """
+        start a server on a unix socket at the start of each test
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'uno.sock')
+        self.server = GameServer(seed=1)
+        self.listener = await self.server.serve(path=self.path)
+
+    async def asyncTearDown(self) -> None:
+        self.listener.close()
+        await self.listener.wait_closed()
+        self.directory.cleanup()
+
+    async def test_tables(self):
+        """
+        tests if players asking for the same table are seated together, and every table is played to the end
+        """
+        join = {'type': 'join', 'table': 'office', 'seats': 4, 'humans': 2}
+        results = await asyncio.gather(*[play_client(self.path, join) for _ in range(6)],
+                                       play_client(self.path, {'type': 'join', 'seats': 3}))
+        ends = [messages[-1] for messages in results]
+
+        self.assertTrue(all(end['type'] == 'end' for end in ends))
+        self.assertEqual(sorted(len(end['placings']) for end in ends), [3, 4, 4, 4, 4, 4, 4])
+        self.assertEqual([message['seat'] for messages in results for message in messages if message['type'] == 'joined'],
+                         [1, 2, 1, 2, 1, 2, 1])
+        self.assertTrue(any(message['type'] == 'log' for message in results[0]))
+        self.assertEqual((self.server.started, self.server.finished, self.server.tables), (4, 4, {}))
+
+    async def test_leaving(self):
+        """
+        tests if a bot takes over from a player that hangs up during a game, and the other player can finish
+        """
+        join = {'type': 'join', 'table': 'leave', 'seats': 3, 'humans': 2}
+        results = await asyncio.gather(play_client(self.path, join), play_client(self.path, join, leaveAfter=2))
+
+        self.assertEqual(results[0][-1]['type'], 'end')
+        self.assertEqual(sorted(results[0][-1]['placings']), [1, 2, 3])
+        self.assertEqual(results[1][-1]['type'], 'turn')
+
+    async def test_join_errors(self):
+        """
+        tests if a connection has to join a valid table first
+        """
+        reader, writer = await asyncio.open_unix_connection(self.path)
+        writer.write(b'{"type": "pass"}\nnot json\n{"type": "join", "seats": 12}\n')
+        messages = [json.loads(await reader.readline()) for _ in range(3)]
+        writer.close()
+
+        self.assertEqual([message['type'] for message in messages], ['error'] * 3)
+        self.assertEqual(self.server.tables, {})
+
+    async def test_watch(self):
+        """
+        tests if a spectator of a waiting table gets a frame every turn of its game, without anybody's cards
+        """
+        reader, writer = await asyncio.open_unix_connection(self.path)
+        writer.write(b'{"type": "watch", "table": "final"}\n')
+        self.assertEqual(json.loads(await reader.readline())['type'], 'error')  # the table does not exist yet
+
+        reader, writer = await asyncio.open_unix_connection(self.path)
+        join = {'type': 'join', 'table': 'final', 'seats': 3, 'humans': 2}
+        first = asyncio.ensure_future(play_client(self.path, join))
+        while 'final' not in self.server.tables:
+            await asyncio.sleep(0)
+        writer.write(b'{"type": "watch", "table": "final"}\n')
+        results = await asyncio.gather(first, play_client(self.path, join))
+        frames = [json.loads(line) async for line in reader]
+        writer.close()
+
+        end = results[0][-1]
+        self.assertEqual(len(frames), end['turns'] + 1)
+        self.assertTrue(frames[-1]['over'])
+        self.assertTrue(end['completed'])
+        self.assertEqual(frames[-1]['placings'], end['placings'][:end['finished']])  # the loser gets no place
+        self.assertTrue(all(set(frame) == set(frames[0]) and 'valid' not in frame for frame in frames))
+        self.assertEqual(self.server.watched, {})
+
+    async def test_client_screen(self):
+        """
+        tests if the client draws the same screen as the terminal game does for a turn
+        """
+        game = Game(seed=2)
+        game.renderer = Renderer(out=io.StringIO())
+        game.setup((2, 0))
+        player = game.players[0]
+        player.calledUno = True
+        game.display_options(player)
+
+        first, second = socket.socketpair()
+        with first, second:
+            client = Client(first, Renderer(out=io.StringIO()))
+            client.show({'seat': 1, 'top': game.currentCard.id, 'hand': [card.id for card in player.hand],
+                         'calledUno': [1]})
+        self.assertEqual(client.renderer.out.getvalue(), game.renderer.out.getvalue())
+
+    async def test_client_cut_off(self):
+        """
+        tests if the client only ranks the players that finished when the game was cut off
+        """
+        first, second = socket.socketpair()
+        with first, second:
+            client = Client(first, Renderer(out=io.StringIO()))
+            second.sendall(b'{"type": "end", "placings": [3, 1, 2], "turns": 50, "completed": false, "finished": 1}\n')
+            end = client.play('final', 3, 1)
+        self.assertEqual(end['finished'], 1)
+        self.assertIn('the game was cut off after 50 turns: 1. player 3\n', client.renderer.out.getvalue())
+        self.assertNotIn('player 1', client.renderer.out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import json
+import os
+import unittest
+
+from game import Game
+from spectator import Spectator, Viewer, FileViewer, screen
+
+
+class Collector(Viewer):
+    """
+    viewer that keeps every frame it is offered, in its own format
+    """
+
+    def __init__(self, kind: str = 'json'):
+        super().__init__(kind)
+        self.received = []
+
+    def offer(self, frame) -> bool:
+        self.received.append(frame.encode(self.kind))
+        return True
+
+
+class TestSpectator(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        create a seeded headless game that is watched by a spectator at the start of each test
+        """
+        self.game = Game(headless=True, seed=5)
+        self.spectator = Spectator()
+        self.spectator.watch(self.game)
+
+    def test_public_state(self):
+        """
+        tests if there is a frame per turn plus one at the end, with the number of cards but not the cards
+        """
+        viewer = Collector()
+        self.spectator.add(viewer)
+        result = self.game.simulate(3)
+
+        frames = [json.loads(data) for data in viewer.received]
+        self.assertEqual(len(frames), result.turns + 1)
+        self.assertEqual([frame['turn'] for frame in frames[:3]], [1, 2, 3])
+        self.assertTrue(frames[-1]['over'])
+        self.assertTrue(result.completed)
+        self.assertEqual(frames[-1]['placings'], result.placings[:result.finished])
+        self.assertEqual(len(frames[-1]['placings']), 2)
+        self.assertEqual(frames[0]['hands'], [7, 7, 7])
+        self.assertTrue(all(isinstance(cards, int) for frame in frames for cards in frame['hands']))
+        self.assertTrue(any('played' in line for frame in frames for line in frame['events']))
+        self.assertIn('player 1: 7 cards', screen(frames[0], self.spectator.renderer))
+
+    def test_cut_off_game(self):
+        """
+        tests if the last frame of a game that hit the turn limit only places the players that finished
+        """
+        viewer = Collector()
+        self.spectator.add(viewer)
+        result = self.game.simulate(3, maxTurns=5)
+
+        last = json.loads(viewer.received[-1])
+        self.assertFalse(result.completed)
+        self.assertTrue(last['over'])
+        self.assertEqual(last['placings'], [])
+        self.assertNotIn('number', screen(last, self.spectator.renderer))
+
+    def test_encoded_once(self):
+        """
+        tests if every viewer of a format gets the very same bytes, encoded once per frame
+        """
+        viewers = [Collector('json') for _ in range(20)] + [Collector('text') for _ in range(20)]
+        for viewer in viewers:
+            self.spectator.add(viewer)
+        self.game.simulate(3)
+
+        for frame in range(len(viewers[0].received)):
+            self.assertTrue(all(viewer.received[frame] is viewers[0].received[frame] for viewer in viewers[:20]))
+            self.assertTrue(all(viewer.received[frame] is viewers[20].received[frame] for viewer in viewers[20:]))
+        self.assertEqual(self.spectator.frames, len(viewers[0].received))
+        self.assertEqual(sorted(self.spectator.last.encoded), ['json', 'text'])
+        with self.assertRaises(ValueError):
+            Collector('html')
+
+        plain = Viewer()
+        self.assertTrue(plain.offer(self.spectator.last))
+        plain.close()
+        self.assertFalse(plain.offer(self.spectator.last))
+
+    def test_slow_viewer(self):
+        """
+        tests if a viewer that does not read loses frames and the game goes on, and late viewers start at the latest frame
+        """
+        readEnd, writeEnd = os.pipe()
+        pipe = os.fdopen(writeEnd, 'wb', buffering=0)
+        slow = FileViewer(pipe, backlog=2)
+        self.spectator.add(slow)
+        result = self.game.simulate(4)
+
+        self.assertTrue(result.completed)
+        self.assertGreater(slow.dropped, 0)
+        self.assertTrue(os.read(readEnd, 4096).startswith(b'\n' * 18))
+        os.close(readEnd)
+        slow.close(timeout=0.5)
+        pipe.close()
+        self.spectator.publish(self.spectator.last)
+        self.assertNotIn(slow, self.spectator.viewers)
+
+        late = Collector()
+        self.spectator.add(late)
+        self.assertTrue(json.loads(late.received[0])['over'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+
+from game import Game
+from gamelog import GameLogWriter, read_log
+from stats import GameStats
+
+try:
+    import numpy as np
+except ImportError:  # only reading a log needs numpy
+    np = None
+
+
+class TestGameStats(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        play some seeded games at the start of each test, counted live and logged at the same time
+        """
+        handle, self.path = tempfile.mkstemp(suffix='.log')
+        os.close(handle)
+        os.remove(self.path)
+        self.live = GameStats()
+        self.results = []
+        with GameLogWriter(self.path) as writer:
+            for gameId in range(30):
+                game = Game(headless=True, seed=gameId)
+                writer.record(game, gameId)
+                self.live.watch(game)
+                self.results.append(game.simulate(3))
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_live(self):
+        """
+        tests if watching games counts their length and winners
+        """
+        self.assertEqual(self.live.games, 30)
+        self.assertEqual(self.live.turns, sum(result.turns for result in self.results))
+        self.assertEqual(sum(self.live.wins), 30)
+        self.assertGreater(sum(self.live.bullyChains), 0)
+        self.assertEqual(self.live.bullyChains[0], 0)  # a chain has at least one card
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_log_chunks_match_live(self):
+        """
+        tests if reading the log in chunks of any size gives the same statistics as watching the games
+        """
+        records = read_log(self.path)
+        for chunk in (1, 13, len(records)):
+            stats = GameStats()
+            for start in range(0, len(records), chunk):
+                stats.add_records(records[start:start + chunk])
+            self.assertEqual(stats.report(), self.live.report())
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_cut_off_game(self):
+        """
+        tests if a game that was cut off before anybody finished is counted without a winner, live and from the log
+        """
+        path = self.path + '.cut'
+        stats = GameStats()
+        with GameLogWriter(path) as writer:
+            game = Game(headless=True, seed=1)
+            writer.record(game, 0)
+            stats.watch(game)
+            game.simulate(2, maxTurns=3)
+        fromLog = GameStats()
+        fromLog.add_records(read_log(path))
+        os.remove(path)
+
+        self.assertEqual((stats.games, sum(stats.wins)), (1, 0))
+        self.assertEqual(fromLog.report(), stats.report())
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_merge(self):
+        """
+        tests if statistics of two halves of the log merge into those of the whole log
+        """
+        records = read_log(self.path)
+        half = int(np.flatnonzero(records['gameId'] == 15)[0])  # games must not be split over workers
+        first, second = GameStats(), GameStats()
+        first.add_records(records[:half])
+        second.add_records(records[half:])
+        first.merge(second)
+
+        self.assertEqual(first.report(), self.live.report())
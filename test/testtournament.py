@@ -0,0 +1,65 @@
+import unittest
+
+from game import Game
+from tournament import Standings, run_tournament
+
+try:
+    from batchsim import simulate_batches
+except ImportError:  # the batch simulator needs numpy
+    simulate_batches = None
+
+
+class TestTournament(unittest.TestCase):
+
+    def test_run_tournament(self):
+        """
+        tests if a small tournament counts every game and every win
+        """
+        standings = run_tournament(['random'] * 3, 20, workers=1, seed=1, chunkSize=7)
+
+        self.assertEqual(standings.games, 20)
+        self.assertEqual(sum(standings.wins), 20)
+        self.assertAlmostEqual(sum(standings.report()['winRate']), 1.0)
+
+    def test_seeded_chunks_are_reproducible(self):
+        """
+        tests if the same seed gives the same standings, however the games are chunked over workers
+        """
+        first = run_tournament(['random'] * 2, 12, workers=1, seed=5, chunkSize=4)
+        second = run_tournament(['random'] * 2, 12, workers=2, seed=5, chunkSize=5)
+
+        self.assertEqual(first.report(), second.report())
+
+    def test_cut_off_game_has_no_winner(self):
+        """
+        tests if a game that hit the turn limit before anybody finished counts as played but not as a win
+        """
+        result = Game(headless=True, seed=1).simulate(2, maxTurns=3)
+        standings = Standings(2)
+        standings.add(result)
+
+        self.assertFalse(result.completed)
+        self.assertEqual(result.winner(), 0)
+        self.assertEqual((standings.games, standings.wins), (1, [0, 0]))
+
+    @unittest.skipIf(simulate_batches is None, 'numpy is not installed')
+    def test_cut_off_batch_has_no_winner(self):
+        """
+        tests if the batch simulator agrees that games cut off before anybody finished are nobody's win
+        """
+        standings = simulate_batches(10, 2, slots=5, maxTurns=2)
+
+        self.assertEqual((standings.games, standings.completed), (10, 0))
+        self.assertEqual(standings.report()['winRate'], [0.0, 0.0])
+
+    def test_merge(self):
+        """
+        tests if merging standings adds them up
+        """
+        first, second = Standings(2), Standings(2)
+        first.games, first.wins = 3, [2, 1]
+        second.games, second.wins = 1, [0, 1]
+        first.merge(second)
+
+        self.assertEqual(first.games, 4)
+        self.assertEqual(first.wins, [2, 2])
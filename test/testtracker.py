@@ -0,0 +1,83 @@
+import math
+import unittest
+
+from card import Card, NUM_CARDS
+from events import CardPlayed, CardsDrawn, Reshuffled
+from game import Game
+from tracker import CardTracker
+
+
+class TestCardTracker(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        set up a three player game with a tracker for player 1 at the start of each test
+        """
+        self.game = Game(headless=True, seed=3)
+        self.game.maxTurns = 3000
+        self.game.setup((3, 0))
+        self.tracker = CardTracker(self.game, 1)
+
+    def hidden_counts(self, observer: int) -> list:
+        """
+        counts the cards in the deck and in the hands of everybody but the observer, per card id
+        """
+        counts = [0] * NUM_CARDS
+        for card in self.game.deck.cardDeck:
+            counts[card.id] += 1
+        for player in self.game.players:
+            if player.id != observer:
+                for card in player.hand:
+                    counts[card.id] += 1
+        return counts
+
+    def test_follows_game(self):
+        """
+        tests if every player's tracker matches the real unseen cards and hand sizes after every play and draw,
+        also across reshuffles
+        """
+        reshuffles = []
+        for seed in range(6):
+            self.game = Game(headless=True, seed=seed)
+            self.game.maxTurns = 3000
+            self.game.setup((2 + seed % 3, 0))
+            trackers = [CardTracker(self.game, player.id) for player in self.game.players]
+            checks = []
+
+            def check(event) -> None:
+                for tracker in trackers:
+                    self.assertEqual(tracker.unseen, self.hidden_counts(tracker.observer))
+                    self.assertEqual(tracker.hidden, sum(tracker.unseen))
+                    self.assertEqual(tracker.sizes[1:], [len(player.hand) for player in self.game.players])
+                checks.append(event)
+            self.game.events.subscribe(check, [CardPlayed, CardsDrawn])
+            self.game.events.subscribe(reshuffles.append, [Reshuffled])
+            self.game.run()
+
+            self.assertTrue(checks)
+        self.assertTrue(reshuffles)
+
+    def test_probabilities(self):
+        """
+        tests if the chance of holding a card matches the hypergeometric distribution at the start of a game
+        """
+        drawFour = Card('Black', 'Draw Four')
+        unseen, hidden = self.tracker.unseen[drawFour.id], self.tracker.hidden
+        expected = 1 - math.comb(hidden - unseen, 7) / math.comb(hidden, 7)
+
+        self.assertAlmostEqual(self.tracker.p_holds(2, drawFour), expected)
+        self.assertAlmostEqual(self.tracker.expected_count(2, drawFour), 7 * unseen / hidden)
+        self.assertEqual(self.tracker.p_holds(1, drawFour), float(drawFour in self.game.players[0].hand))
+        total = sum(self.tracker.expected_playable(2, colour) for colour in ('Red', 'Yellow', 'Blue', 'Green'))
+        self.assertAlmostEqual(total, 7 + 3 * 7 * self.tracker.unseenColours[4] / hidden)
+
+    def test_stop(self):
+        """
+        tests if a stopped tracker no longer listens to the game
+        """
+        self.tracker.stop()
+        self.assertEqual(self.game.events.handlers, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
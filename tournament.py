@@ -0,0 +1,126 @@
+import argparse
+import json
+import multiprocessing
+import typing
+from game import Game
+from endgame import EndgameComputer
+from mcts import MCTSComputer
+from player import Computer
+from result import Result
+
+STRATEGIES: dict = {'random': Computer, 'mcts': MCTSComputer, 'endgame': EndgameComputer} # strategy name -> Player subclass that plays a seat
+
+
+class Standings:
+    """Summary of a batch of games, small enough to send between processes and mergeable with others"""
+
+    def __init__(self, numSeats: int):
+        self.games: int = 0
+        self.completed: int = 0 # games that ended before the turn limit
+        self.turns: int = 0 # summed over all games
+        self.wins: typing.List[int] = [0] * numSeats # per seat, index is player id - 1
+        self.cardsDrawn: typing.List[int] = [0] * numSeats # per seat, summed over all games
+        self.placeSum: typing.List[int] = [0] * numSeats # per seat, sum of finishing places (1 is first)
+
+    def add(self, result: Result) -> None:
+        """Counts one game :param result:"""
+        self.games += 1
+        self.completed += result.completed
+        self.turns += result.turns
+        winner: int = result.winner()
+        if winner: # nobody wins a game that was cut off before anybody finished
+            self.wins[winner-1] += 1
+        for place, playerId in enumerate(result.placings, start=1):
+            self.placeSum[playerId-1] += place
+        for seat, drawn in enumerate(result.cardsDrawn):
+            self.cardsDrawn[seat] += drawn
+        return
+
+    def merge(self, other: 'Standings') -> None:
+        """Adds the counts of another batch to this one :param other standings:"""
+        self.games += other.games
+        self.completed += other.completed
+        self.turns += other.turns
+        for seat in range(len(self.wins)):
+            self.wins[seat] += other.wins[seat]
+            self.cardsDrawn[seat] += other.cardsDrawn[seat]
+            self.placeSum[seat] += other.placeSum[seat]
+        return
+
+    def report(self) -> dict:
+        """Returns win rates, mean places and mean draws per seat, and the mean game length"""
+        games: int = max(self.games, 1)
+        return {'games': self.games,
+                'completed': self.completed,
+                'meanTurns': self.turns / games,
+                'winRate': [wins / games for wins in self.wins],
+                'meanPlace': [placeSum / games for placeSum in self.placeSum],
+                'meanCardsDrawn': [drawn / games for drawn in self.cardsDrawn]}
+
+
+def game_seed(seed: int, game: int) -> int:
+    """Returns the seed of one game of a tournament, Game(seed=...) replays that game on its own
+    :param base seed of the tournament: :param game number:"""
+    return seed * 1000003 + game
+
+
+def play_chunk(task: tuple) -> Standings:
+    """Plays one chunk of games in a worker process. Every game is seeded by its number (not by process or chunk),
+    so a tournament gives the same standings whatever the number of workers or the chunk size
+    :param tuple(strategy names, first game number, no. games, base seed, turn limit): :return standings of the chunk:"""
+    strategyNames, firstGame, numGames, seed, maxTurns = task
+    strategies: typing.List[type] = [STRATEGIES[name] for name in strategyNames]
+    standings = Standings(len(strategies))
+    for game in range(firstGame, firstGame + numGames):
+        standings.add(Game(headless=True, seed=game_seed(seed, game)).simulate(maxTurns=maxTurns, strategies=strategies))
+    return standings
+
+
+def run_tournament(strategyNames: typing.List[str], numGames: int, workers: int = 1, seed: int = 0,
+                   chunkSize: int = 250, maxTurns: int = 10000) -> Standings:
+    """Fans a number of games out over a process pool and merges the standings
+    :param strategy name per seat: :param no. games: :param no. worker processes: :param base seed:
+    :param games per task, big enough to keep the pool's overhead negligible: :param turn limit per game:
+    :return merged standings:"""
+    for name in strategyNames:
+        if name not in STRATEGIES:
+            raise ValueError(f'unknown strategy {name!r}, choose from {", ".join(STRATEGIES)}')
+    tasks: typing.List[tuple] = []
+    for start in range(0, numGames, chunkSize):
+        tasks.append((strategyNames, start, min(chunkSize, numGames - start), seed, maxTurns))
+
+    standings = Standings(len(strategyNames))
+    if workers <= 1:
+        for task in tasks:
+            standings.merge(play_chunk(task))
+        return standings
+    with multiprocessing.Pool(workers) as pool:
+        for chunkStandings in pool.imap_unordered(play_chunk, tasks):
+            standings.merge(chunkStandings)
+    return standings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Plays a batch of bot-vs-bot games over all cores')
+    parser.add_argument('--seats', nargs='+', default=['random'] * 4, metavar='STRATEGY',
+                        help=f'one strategy per seat, from: {", ".join(STRATEGIES)}')
+    parser.add_argument('--games', type=int, default=10000, help='number of games to play')
+    parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count(), help='number of processes')
+    parser.add_argument('--seed', type=int, default=0, help='base seed, the same seed gives the same standings')
+    parser.add_argument('--chunk', type=int, default=250, help='games per task sent to a worker')
+    parser.add_argument('--json', action='store_true', help='print the standings as json')
+    args = parser.parse_args()
+
+    report: dict = run_tournament(args.seats, args.games, args.workers, args.seed, args.chunk).report()
+    if args.json:
+        print(json.dumps(report))
+        return
+    print(f'{report["games"]} games ({report["completed"]} completed), mean length {report["meanTurns"]:.1f} turns')
+    print('seat  strategy   win rate  mean place  mean drawn')
+    for seat, name in enumerate(args.seats):
+        print(f'{seat+1:4}  {name:9} {report["winRate"][seat]:9.3f} {report["meanPlace"][seat]:11.2f} '
+              f'{report["meanCardsDrawn"][seat]:11.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Card counting: what one player can know about the cards they have not seen.
+
+A CardTracker follows a game's events from the point of view of one seat (the observer) and keeps the
+multiset of unseen cards (the deck and the other players' hands, as far as the observer can tell) and the
+size of every hand. Every event updates a few counters, so asking the tracker something every turn costs
+about as much as the game itself; a reshuffle is the only update that touches all 54 card ids.
+
+Probabilities assume that every unseen card is equally likely to be in any of the hidden places (the deck
+or one of the other hands), which is what a player who only counts cards can assume.
+
+    tracker = CardTracker(game, 1) # after game.setup, before the game is run
+    tracker.p_holds(3, Card('Black', 'Draw Four')) # chance that player 3 holds a Draw Four
+    tracker.expected_playable(2, 'Red') # expected number of cards player 2 could play on a Red card
+"""
+import typing
+from card import Card, CARDS, COLOURS, NUM_CARDS, BLACK
+from deck import FULL_DECK
+from events import CardPlayed, CardsDrawn, Reshuffled
+
+class CardTracker:
+    """Unseen cards and hand sizes from the point of view of one player, updated by the game's events"""
+
+    def __init__(self, game: 'Game', observer: int):
+        """Starts counting from the current state of a game that has been set up
+        :param game: :param id of the player whose knowledge is tracked:"""
+        self.game: 'Game' = game # only read for the observer's own hand when they draw
+        self.observer: int = observer
+        self.sizes: typing.List[int] = [0] + [len(player.hand) for player in game.players] # per seat, index 0 unused
+        self.pileCounts: typing.List[int] = [0] * NUM_CARDS # per card id, cards on the pile
+        self.unseen: typing.List[int] = [0] * NUM_CARDS # per card id, cards in the deck or the other hands
+        self.unseenColours: typing.List[int] = [0] * (BLACK + 1) # per colour code, the sum of self.unseen
+        self.hidden: int = 0 # all unseen cards: the deck plus the other hands
+        self.top: int = game.pile[-1].id # card id of the top of the pile, it stays there when the pile is reshuffled
+        for card in FULL_DECK * game.deck.packs:
+            self.add_unseen(card.id, 1)
+        for card in game.pile:
+            self.pileCounts[card.id] += 1
+            self.add_unseen(card.id, -1)
+        for card in game.players[observer-1].hand:
+            self.add_unseen(card.id, -1)
+        self.handlers: typing.Dict[type, typing.Callable] = {CardPlayed: self.card_played, CardsDrawn: self.cards_drawn,
+                                                             Reshuffled: self.reshuffled}
+        for eventType, handler in self.handlers.items():
+            game.events.subscribe(handler, [eventType])
+
+    def add_unseen(self, id: int, change: int) -> None:
+        """Adds (or with a negative change removes) copies of a card to the unseen cards"""
+        self.unseen[id] += change
+        self.unseenColours[CARDS[id].colourCode] += change
+        self.hidden += change
+        return
+
+    def card_played(self, event: CardPlayed) -> None:
+        id: int = event.card.id
+        self.sizes[event.playerId] -= 1
+        self.pileCounts[id] += 1
+        self.top = id
+        if event.playerId != self.observer: # the observer had seen their own card already
+            self.add_unseen(id, -1)
+
+    def cards_drawn(self, event: CardsDrawn) -> None:
+        """Another player's cards only move from the deck to their hand, the observer sees the cards they draw"""
+        self.sizes[event.playerId] += event.count
+        if event.playerId == self.observer and event.count:
+            for card in self.game.players[self.observer-1].hand[-event.count:]: # drawn cards are added at the end
+                self.add_unseen(card.id, -1)
+
+    def reshuffled(self, event: Reshuffled) -> None:
+        """The pile, except for its top card, goes back into the deck and is unseen again"""
+        for id, count in enumerate(self.pileCounts):
+            if count:
+                self.add_unseen(id, count - (id == self.top))
+                self.pileCounts[id] = int(id == self.top)
+
+    def stop(self) -> None:
+        """Stops following the game"""
+        for handler in self.handlers.values():
+            self.game.events.unsubscribe(handler)
+        return
+
+    def p_holds(self, seat: int, card: Card) -> float:
+        """Returns the chance that a player holds at least one copy of a card (a black card without a colour)
+        :param id of another player: :param card:"""
+        if seat == self.observer:
+            return float(self.game.players[seat-1].cardCounts[card.id] > 0)
+        size, hidden = self.sizes[seat], self.hidden
+        pNone: float = 1.0 # the chance that none of the unseen copies is among the player's cards
+        for copy in range(self.unseen[card.id]):
+            if hidden - copy <= 0:
+                break
+            pNone *= max(hidden - size - copy, 0) / (hidden - copy)
+        return 1.0 - pNone
+
+    def expected_count(self, seat: int, card: Card) -> float:
+        """Returns the expected number of copies of a card in a player's hand :param id of another player: :param card:"""
+        return self.sizes[seat] * self.unseen[card.id] / self.hidden if self.hidden else 0.0
+
+    def expected_playable(self, seat: int, colour: str) -> float:
+        """Returns the expected number of cards a player could play on a card of a colour: the cards of that
+        colour and the black cards (a matching value of another colour is not counted)
+        :param id of another player: :param colour name:"""
+        if not self.hidden:
+            return 0.0
+        colourCode: int = COLOURS.index(colour)
+        return self.sizes[seat] * (self.unseenColours[colourCode] + self.unseenColours[BLACK]) / self.hidden